@@ -0,0 +1,180 @@
+import hashlib
+import json
+import logging
+import marshal
+import os
+import pathlib
+import sys
+import tempfile
+import zlib
+from typing import TYPE_CHECKING, BinaryIO, Dict, List, Optional, Union, cast
+
+from ._typing import T_obj_list
+from ._version import __version__
+from .utils.charstore import CharStore
+
+if TYPE_CHECKING:  # pragma: nocover
+    from .page import Page
+
+logger = logging.getLogger(__name__)
+
+# Incremented whenever the format of the cached files changes
+CACHE_FORMAT_VERSION = 1
+
+DEFAULT_MAX_SIZE = 256 * 1024 * 1024
+
+CACHE_SUFFIX = ".objects"
+
+
+def hash_stream(stream: BinaryIO, chunk_size: int = 1024 * 1024) -> str:
+    """Return the SHA-256 hash of a seekable binary stream's full contents."""
+    position = stream.tell()
+    stream.seek(0)
+    h = hashlib.sha256()
+    while True:
+        chunk = stream.read(chunk_size)
+        if not chunk:
+            break
+        h.update(chunk)
+    stream.seek(position)
+    return h.hexdigest()
+
+
+class ObjectCache:
+    """
+    A persistent, on-disk cache of each page's parsed objects, so that
+    reopening the same document (with the same parsing settings) does not
+    require re-interpreting its pages' content streams.
+
+    Each page's objects are stored, compressed, in their own file in
+    `directory`, under a key derived from the document's contents, the page
+    number, and the settings that affect parsing. When the files' total size
+    exceeds `max_size` bytes, the least recently used files are deleted.
+
+    Only pages whose objects consist entirely of basic Python types (as is
+    the case unless, e.g., they contain images) can be cached; other pages
+    are parsed as usual.
+    """
+
+    def __init__(
+        self,
+        directory: Union[str, pathlib.Path],
+        max_size: int = DEFAULT_MAX_SIZE,
+    ):
+        self.directory = pathlib.Path(directory)
+        self.max_size = max_size
+        # The (approximate) total size of the cache's files, if known
+        self.size: Optional[int] = None
+
+    def __repr__(self) -> str:
+        return f"<ObjectCache: {self.directory}>"
+
+    def get_key(self, page: "Page") -> str:
+        pdf = page.pdf
+        settings = {
+            "format": CACHE_FORMAT_VERSION,
+            "pdfplumber": __version__,
+            # The marshal format can differ between Python versions
+            "python": list(sys.version_info[:2]),
+            "document": pdf.content_hash,
+            "page_number": page.page_number,
+            "initial_doctop": page.initial_doctop,
+            "laparams": None if pdf.laparams is None else vars(pdf.laparams),
+            "object_types": None
+            if pdf.object_types is None
+            else sorted(pdf.object_types),
+            "attrs": None if pdf.attrs is None else sorted(pdf.attrs),
+        }
+        serialized = json.dumps(settings, sort_keys=True, default=repr)
+        return hashlib.sha256(serialized.encode("utf-8")).hexdigest()
+
+    def get_path(self, key: str) -> pathlib.Path:
+        return self.directory / (key + CACHE_SUFFIX)
+
+    def load(self, page: "Page") -> Optional[Dict[str, T_obj_list]]:
+        """
+        Return the cached objects for `page`, or None if they are not cached.
+        """
+        path = self.get_path(self.get_key(page))
+        try:
+            with open(path, "rb") as f:
+                data = marshal.loads(zlib.decompress(f.read()))
+            # Mark the file as recently used
+            os.utime(path)
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            logger.warning(f"Could not read cached objects from {path}: {e!r}")
+            return None
+
+        objects: Dict[str, T_obj_list] = data
+        if page.pdf.compact_chars and "char" in objects:
+            objects["char"] = cast(T_obj_list, CharStore.from_objects(objects["char"]))
+        return objects
+
+    def store(self, page: "Page", objects: Dict[str, T_obj_list]) -> bool:
+        """
+        Write `page`'s `objects` to the cache, returning False if they cannot
+        be serialized.
+        """
+        data = {
+            kind: [dict(obj) for obj in objs] if isinstance(objs, CharStore) else objs
+            for kind, objs in objects.items()
+        }
+        try:
+            serialized = zlib.compress(marshal.dumps(data))
+        except ValueError:
+            # E.g., the objects include non-basic types, such as image streams
+            logger.debug(f"Cannot cache objects for page {page.page_number}")
+            return False
+
+        self.directory.mkdir(parents=True, exist_ok=True)
+        path = self.get_path(self.get_key(page))
+        # Write to a temporary file first, so that other processes never
+        # read a partially-written file.
+        fd, tmp_path = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(serialized)
+            os.replace(tmp_path, path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+
+        if self.size is None:
+            self.evict()
+        else:
+            self.size += len(serialized)
+            if self.size > self.max_size:
+                self.evict()
+        return True
+
+    def get_entries(self) -> List[pathlib.Path]:
+        return list(self.directory.glob("*" + CACHE_SUFFIX))
+
+    def evict(self) -> None:
+        """Delete the least recently used files, until under `max_size`."""
+        entries = []
+        for path in self.get_entries():
+            try:
+                stat = path.stat()
+            except FileNotFoundError:  # pragma: nocover
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+
+        total = sum(size for _, size, _ in entries)
+        for _, size, path in sorted(entries):
+            if total <= self.max_size:
+                break
+            try:
+                path.unlink()
+            except FileNotFoundError:  # pragma: nocover
+                pass
+            total -= size
+        self.size = total
+
+    def clear(self) -> None:
+        """Delete all of the cache's files."""
+        for path in self.get_entries():
+            path.unlink()
+        self.size = 0
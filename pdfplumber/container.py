@@ -2,7 +2,7 @@ import csv
 import json
 from io import StringIO
 from itertools import chain
-from typing import Any, Dict, List, Optional, Set, TextIO
+from typing import Any, Dict, List, Optional, Sequence, Set, TextIO
 
 from . import utils
 from ._typing import T_obj, T_obj_list
@@ -13,7 +13,7 @@ class Container(object):
     cached_properties = ["_rect_edges", "_curve_edges", "_edges", "_objects"]
 
     @property
-    def pages(self) -> Optional[List[Any]]:
+    def pages(self) -> Optional[Sequence[Any]]:
         ...  # pragma: nocover
 
     @property
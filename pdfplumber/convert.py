@@ -4,6 +4,7 @@ from typing import Any, Callable, Dict, List, Optional, Tuple
 from pdfminer.psparser import PSLiteral
 
 from .utils import decode_text
+from .utils.charstore import CharStore, CharView
 
 ENCODINGS_TO_TRY = [
     "utf-8",
@@ -109,6 +110,12 @@ class Serializer:
         else:
             return {k: self.serialize(v) for k, v in obj.items()}
 
+    def do_CharStore(self, obj: CharStore) -> List[Any]:
+        return list(self.serialize(x) for x in obj)
+
+    def do_CharView(self, obj: CharView) -> Dict[str, Any]:
+        return self.do_dict(dict(obj))
+
     def do_PDFStream(self, obj: Any) -> Dict[str, str]:
         return {"rawdata": to_b64(obj.rawdata)}
 
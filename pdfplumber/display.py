@@ -1,14 +1,27 @@
+import base64
+import importlib
+import itertools
+import math
 import pathlib
 from io import BufferedReader, BytesIO
-from typing import TYPE_CHECKING, Any, List, Optional, Tuple, Union
+from typing import TYPE_CHECKING, Any, Iterable, List, Optional, Sequence, Tuple, Union
 
 import PIL.Image
+import PIL.ImageColor
 import PIL.ImageDraw
 import pypdfium2  # type: ignore
 
 from . import utils
-from ._typing import T_bbox, T_num, T_obj, T_obj_list, T_point, T_seq
+from ._typing import T_bbox, T_num, T_obj, T_point, T_seq
 from .table import T_table_settings, Table, TableFinder, TableSettings
+from .utils.charstore import CharStore
+
+# NumPy is optional; see utils/clustering.py
+np: Any
+try:
+    np = importlib.import_module("numpy")
+except ImportError:  # pragma: nocover
+    np = None
 
 if TYPE_CHECKING:  # pragma: nocover
     from pandas.core.frame import DataFrame
@@ -29,19 +42,30 @@ DEFAULT_STROKE = COLORS.RED + (200,)
 DEFAULT_STROKE_WIDTH = 1
 DEFAULT_RESOLUTION = 72
 
+# The minimum number of coordinates for which to reproject them using NumPy,
+# if it is installed
+NUMPY_MIN_VALUES = 64
+
 T_color = Union[Tuple[int, int, int], Tuple[int, int, int, int], str]
 T_contains_points = Union[Tuple[T_point, ...], List[T_point], T_obj]
 
+# The shapes drawn on a PageImage are recorded, in image coordinates, as
+# tuples of one of these forms:
+# - ("line", points, stroke, stroke_width)
+# - ("rect", bbox, fill, stroke, stroke_width)
+# - ("ellipse", bbox, fill, stroke)
+T_shape = Tuple[Any, ...]
 
-def get_page_image(
-    stream: Union[BufferedReader, BytesIO],
+
+def open_pdfium_doc(
+    stream: Optional[Union[BufferedReader, BytesIO]],
     path: Optional[pathlib.Path],
-    page_ix: int,
-    resolution: Union[int, float],
     password: Optional[str],
-    antialias: bool = False,
-) -> PIL.Image.Image:
-
+) -> Any:
+    """
+    Open the PDF with pypdfium2, from `path` if the PDF was opened from a
+    file on disk, or else from `stream`. The caller must `.close()` it.
+    """
     src: Union[pathlib.Path, BufferedReader, BytesIO]
 
     # If we are working with a file object saved to disk
@@ -50,26 +74,297 @@ def get_page_image(
 
     # If we instead are working with a BytesIO stream
     else:
+        assert stream is not None
         stream.seek(0)
         src = stream
 
-    pdfium_doc = pypdfium2.PdfDocument(src, password=password)
-    pdfium_page = pdfium_doc.get_page(page_ix)
+    return pypdfium2.PdfDocument(src, password=password)
 
-    img: PIL.Image.Image = pdfium_page.render(
-        # Modifiable arguments
-        scale=resolution / 72,
+
+def render_bitmap(
+    pdfium_doc: Any,
+    page_ix: int,
+    resolution: Union[int, float],
+    antialias: bool = False,
+    box: Optional[Tuple[int, int, int, int]] = None,
+    **kwargs: Any,
+) -> Any:
+    """
+    Render a page to a `pypdfium2.PdfBitmap`, whose buffer is allocated by
+    Python, so that images and arrays sharing it remain valid after the
+    bitmap itself is gone. If `box` is provided, only that pixel box (which
+    must lie within the rendered page) is rendered. The `kwargs` are passed
+    to `PdfPage.render(...)`.
+    """
+    scale = resolution / 72
+    pdfium_page = pdfium_doc.get_page(page_ix)
+    if box is not None:
+        width, height = get_render_size(pdfium_page, resolution)
+        x0, top, x1, bottom = box
+        # pypdfium2 rounds each side's crop up to a whole number of pixels,
+        # so aim for the middle of the last pixel to be cropped.
+        kwargs["crop"] = tuple(
+            (px - 0.5) / scale if px > 0 else 0
+            for px in (x0, height - bottom, width - x1, top)
+        )
+    bitmap = pdfium_page.render(
+        scale=scale,
         no_smoothtext=not antialias,
         no_smoothpath=not antialias,
         no_smoothimage=not antialias,
-        # Non-modifiable arguments
-        prefer_bgrx=True,
-    ).to_pil()
+        **kwargs,
+    )
+    pdfium_page.close()
+    return bitmap
+
+
+def render_page(
+    pdfium_doc: Any,
+    page_ix: int,
+    resolution: Union[int, float],
+    antialias: bool = False,
+    box: Optional[Tuple[int, int, int, int]] = None,
+) -> PIL.Image.Image:
+    # Have pdfium render RGB pixels directly, rather than BGRx pixels that
+    # must then be converted to RGB.
+    bitmap = render_bitmap(
+        pdfium_doc, page_ix, resolution, antialias, box, rev_byteorder=True
+    )
+    img: PIL.Image.Image = bitmap.to_pil()
+    return img
+
+
+def render_page_array(
+    pdfium_doc: Any,
+    page_ix: int,
+    resolution: Union[int, float],
+    antialias: bool = False,
+    grayscale: bool = False,
+    box: Optional[Tuple[int, int, int, int]] = None,
+) -> Any:
+    """
+    Render a page (or, if provided, just the pixel box `box` of it) to a
+    NumPy array that is a view of pdfium's bitmap, rather than a copy of it:
+    (height, width, 4) with BGRx channels, or (height, width) if `grayscale`
+    is True.
+    """
+    bitmap = render_bitmap(
+        pdfium_doc,
+        page_ix,
+        resolution,
+        antialias,
+        box,
+        grayscale=grayscale,
+        prefer_bgrx=not grayscale,
+    )
+    return bitmap.to_numpy()
+
+
+def get_crop_box(
+    bbox: T_bbox, cropbox: T_bbox, scale: float
+) -> Tuple[int, int, int, int]:
+    """
+    Return the pixel box, within an image of a page's `cropbox` rendered at
+    `scale` pixels per point, that displays `bbox`.
+    """
+
+    def reproject(x: T_num, y: T_num) -> Tuple[int, int]:
+        return (int((x - bbox[0]) * scale), int((y - bbox[1]) * scale))
+
+    crop_x0, crop_top = reproject(cropbox[0], cropbox[1])
+    bbox_x0, bbox_top = reproject(bbox[0], bbox[1])
+    bbox_x1, bbox_bottom = reproject(bbox[2], bbox[3])
+    return (
+        bbox_x0 - crop_x0,
+        bbox_top - crop_top,
+        bbox_x1 - crop_x0,
+        bbox_bottom - crop_top,
+    )
+
+
+def crop_array(arr: Any, box: Tuple[int, int, int, int]) -> Any:
+    """
+    Return the pixel `box` of the NumPy array `arr`, as a view of `arr` if
+    the box lies within it. Otherwise, as with `PIL.Image.Image.crop(...)`,
+    return a copy, in which the parts beyond `arr` are padded with zeros.
+    """
+    x0, top, x1, bottom = box
+    height, width = arr.shape[:2]
+    if 0 <= x0 and 0 <= top and x1 <= width and bottom <= height:
+        return arr[top:bottom, x0:x1]
+
+    padded = np.zeros((bottom - top, x1 - x0) + arr.shape[2:], dtype=arr.dtype)
+    src_x0, src_top = max(x0, 0), max(top, 0)
+    src_x1, src_bottom = min(x1, width), min(bottom, height)
+    if src_x0 < src_x1 and src_top < src_bottom:
+        padded[src_top - top : src_bottom - top, src_x0 - x0 : src_x1 - x0] = arr[
+            src_top:src_bottom, src_x0:src_x1
+        ]
+    return padded
+
+
+def get_render_size(pdfium_page: Any, resolution: Union[int, float]) -> Tuple[int, int]:
+    """The size, in pixels, of a pypdfium2 page rendered at `resolution`."""
+    scale = resolution / 72
+    return (
+        math.ceil(pdfium_page.get_width() * scale),
+        math.ceil(pdfium_page.get_height() * scale),
+    )
+
+
+def get_render_region(
+    pdfium_doc: Any,
+    page_ix: int,
+    resolution: Union[int, float],
+    bbox: T_bbox,
+    cropbox: T_bbox,
+) -> Optional[Tuple[float, Tuple[int, int, int, int]]]:
+    """
+    Return the scale, in pixels per point, of the page's cropbox rendered at
+    `resolution`, and the pixel box within it that displays `bbox`. Returns
+    None if that box is the whole rendered page, or extends beyond it, in
+    which case the whole page must be rendered and then cropped (and padded).
+    """
+    pdfium_page = pdfium_doc.get_page(page_ix)
+    width, height = get_render_size(pdfium_page, resolution)
+    pdfium_page.close()
+
+    scale = width / (cropbox[2] - cropbox[0])
+    box = get_crop_box(bbox, cropbox, scale)
+    x0, top, x1, bottom = box
+    if box == (0, 0, width, height):
+        return None
+    if 0 <= x0 < x1 <= width and 0 <= top < bottom <= height:
+        return (scale, box)
+    return None
+
+
+def get_page_image(
+    stream: Union[BufferedReader, BytesIO],
+    path: Optional[pathlib.Path],
+    page_ix: int,
+    resolution: Union[int, float],
+    password: Optional[str],
+    antialias: bool = False,
+) -> PIL.Image.Image:
+    """
+    Render a single page, opening (and closing) a new pypdfium2 document to
+    do so. `PDF.get_page_image(...)`, which reuses the PDF's document and
+    caches recently-rendered pages, is generally preferable.
+    """
+    pdfium_doc = open_pdfium_doc(stream, path, password)
     # In theory `autoclose` when creating it should make it close...
     # automatically.  In practice this does not seem to be the case.
-    pdfium_doc.close()
-
-    return img.convert("RGB")
+    try:
+        return render_page(pdfium_doc, page_ix, resolution, antialias)
+    finally:
+        pdfium_doc.close()
+
+
+def reproject_values(values: Sequence[T_num], origin: T_num, scale: float) -> List[int]:
+    """
+    Return `int((value - origin) * scale)` for each of `values`, computing
+    them all at once with NumPy, if it is installed and there are enough.
+    """
+    if np is not None and len(values) >= NUMPY_MIN_VALUES:
+        arr = np.asarray(values, dtype=float)
+        # Non-finite values cannot be converted to ints, so leave those to
+        # the pure-Python approach, which raises an exception
+        if np.isfinite(arr).all():
+            result: List[int] = ((arr - origin) * scale).astype(int).tolist()
+            return result
+    return [int((value - origin) * scale) for value in values]
+
+
+def get_line_points(points_or_obj: T_contains_points) -> Sequence[T_point]:
+    # If passing a raw list of points, use those
+    if isinstance(points_or_obj, (tuple, list)):
+        return points_or_obj
+    # Else, use the "pts" attribute if available
+    elif isinstance(points_or_obj, dict) and "pts" in points_or_obj:
+        return [(x, y) for x, y in points_or_obj["pts"]]
+    # Otherwise, just use ((x0, top), (x1, bottom))
+    else:
+        obj = points_or_obj
+        return ((obj["x0"], obj["top"]), (obj["x1"], obj["bottom"]))
+
+
+def get_svg_color(color: Optional[T_color]) -> Tuple[str, float]:
+    """Return an SVG color, and its opacity, for a PIL-style color."""
+    if color is None:
+        return ("none", 1)
+    if isinstance(color, str):
+        color = PIL.ImageColor.getrgb(color)
+    r, g, b = color[:3]
+    alpha = color[3] if len(color) > 3 else 255  # type: ignore
+    return (f"rgb({r},{g},{b})", round(alpha / 255, 4))
+
+
+def get_rect_edges(bbox: Tuple[int, int, int, int]) -> List[List[Tuple[int, int]]]:
+    x0, top, x1, bottom = bbox
+    return [
+        [(x0, top), (x1, top)],
+        [(x0, bottom), (x1, bottom)],
+        [(x0, top), (x0, bottom)],
+        [(x1, top), (x1, bottom)],
+    ]
+
+
+def get_svg_lines(
+    lines: Iterable[Sequence[Tuple[int, int]]], stroke: T_color, stroke_width: int
+) -> str:
+    color, opacity = get_svg_color(stroke)
+    # PIL draws the pixel *starting* at each coordinate, so stroke through
+    # the pixels' centers
+    d = " ".join(
+        "M" + " L".join(f"{x + 0.5:g} {y + 0.5:g}" for x, y in points)
+        for points in lines
+    )
+    return (
+        f'<path fill="none" stroke="{color}" stroke-opacity="{opacity}" '
+        f'stroke-width="{stroke_width}" d="{d}"/>'
+    )
+
+
+def get_svg_elements(kind: str, style: Tuple[Any, ...], shapes: List[T_shape]) -> str:
+    """
+    Return SVG path elements that draw all of `shapes`, each of which is of
+    the same `kind` and `style`. Coordinates are adjusted so that the paths
+    cover (roughly) the same pixels that PIL would draw.
+    """
+    if kind == "line":
+        return get_svg_lines((shape[1] for shape in shapes), *style)
+    elif kind == "rect":
+        fill, stroke, stroke_width = style
+        color, opacity = get_svg_color(fill)
+        # PIL's rectangles include their right and bottom coordinates
+        d = " ".join(
+            f"M{x0} {top}H{x1 + 1}V{bottom + 1}H{x0}Z"
+            for x0, top, x1, bottom in (shape[1] for shape in shapes)
+        )
+        element = f'<path fill="{color}" fill-opacity="{opacity}" d="{d}"/>'
+        if stroke_width > 0:
+            edges = (edge for shape in shapes for edge in get_rect_edges(shape[1]))
+            element += "\n" + get_svg_lines(edges, stroke, stroke_width)
+        return element
+    else:
+        fill, stroke = style
+        fill_color, fill_opacity = get_svg_color(fill)
+        stroke_color, stroke_opacity = get_svg_color(stroke)
+        parts = []
+        for x0, top, x1, bottom in (shape[1] for shape in shapes):
+            rx = (x1 - x0 + 1) / 2
+            ry = (bottom - top + 1) / 2
+            cy = top + ry
+            parts.append(
+                f"M{x0:g} {cy:g}a{rx:g} {ry:g} 0 1 0 {2 * rx:g} 0"
+                f"a{rx:g} {ry:g} 0 1 0 {-2 * rx:g} 0Z"
+            )
+        return (
+            f'<path fill="{fill_color}" fill-opacity="{fill_opacity}" '
+            f'stroke="{stroke_color}" stroke-opacity="{stroke_opacity}" '
+            f'd="{" ".join(parts)}"/>'
+        )
 
 
 class PageImage:
@@ -85,20 +380,6 @@ class PageImage:
         self.root = page if page.is_original else page.root_page
         self.resolution = resolution
 
-        if original is None:
-            self.original = get_page_image(
-                stream=page.pdf.stream,
-                path=page.pdf.path,
-                page_ix=page.page_number - 1,
-                resolution=resolution,
-                antialias=antialias,
-                password=page.pdf.password,
-            )
-        else:
-            self.original = original
-
-        self.scale = self.original.size[0] / (page.cropbox[2] - page.cropbox[0])
-
         # This value represents the coordinates of the page,
         # in page-unit values, that will be displayed.
         self.bbox = (
@@ -109,20 +390,33 @@ class PageImage:
 
         # If this value is different than the *Page*'s .cropbox
         # (e.g., because the mediabox differs from the cropbox or
-        # or because we've used Page.crop(...)), then we'll need to
-        # crop the initially-converted image.
-        if page.bbox != page.cropbox:
-            crop_dims = self._reproject_bbox(page.cropbox)
-            bbox_dims = self._reproject_bbox(self.bbox)
-            self.original = self.original.crop(
-                (
-                    bbox_dims[0] - crop_dims[0],
-                    bbox_dims[1] - crop_dims[1],
-                    bbox_dims[2] - crop_dims[0],
-                    bbox_dims[3] - crop_dims[1],
-                )
+        # or because we've used Page.crop(...)), then only part of
+        # the page needs to be displayed. If possible, have pdfium
+        # render just that part.
+        page_ix = page.page_number - 1
+        region = None
+        if original is None and page.bbox != page.cropbox:
+            region = get_render_region(
+                page.pdf.pdfium_doc, page_ix, resolution, self.bbox, page.cropbox
             )
 
+        # Note: These images may be shared with other PageImages, via the
+        # PDF's render cache, so they must not be modified in place.
+        if region is not None:
+            self.scale, box = region
+            self.original = page.pdf.get_page_image(page_ix, resolution, antialias, box)
+        else:
+            if original is None:
+                original = page.pdf.get_page_image(page_ix, resolution, antialias)
+            self.original = original
+            self.scale = original.size[0] / (page.cropbox[2] - page.cropbox[0])
+
+            # Otherwise, crop the initially-converted image.
+            if page.bbox != page.cropbox:
+                self.original = original.crop(
+                    get_crop_box(self.bbox, page.cropbox, self.scale)
+                )
+
         self.reset()
 
     def _reproject_bbox(self, bbox: T_bbox) -> Tuple[int, int, int, int]:
@@ -141,12 +435,96 @@ class PageImage:
         _top = (top - self.bbox[1]) * self.scale
         return (int(_x0), int(_top))
 
+    def _reproject_points(self, points: Sequence[T_point]) -> List[Tuple[int, int]]:
+        """Same as `._reproject(...)`, but for many points at once."""
+        xs = reproject_values([x for x, _ in points], self.bbox[0], self.scale)
+        ys = reproject_values([y for _, y in points], self.bbox[1], self.scale)
+        return list(zip(xs, ys))
+
     def reset(self) -> "PageImage":
-        self.annotated = PIL.Image.new("RGB", self.original.size)
-        self.annotated.paste(self.original)
-        self.draw = PIL.ImageDraw.Draw(self.annotated, "RGBA")
+        # The annotated copy of the original image is only made once it is
+        # needed, e.g., to draw on, so that merely saving or displaying a page
+        # image does not copy it.
+        self._annotated: Optional[PIL.Image.Image] = None
+        self._draw: Optional[PIL.ImageDraw.ImageDraw] = None
+        # The drawing methods record the shapes to draw, which are only drawn
+        # onto the annotated image once it is needed; `._num_drawn` is the
+        # number of shapes drawn so far.
+        self.shapes: List[T_shape] = []
+        self._num_drawn = 0
         return self
 
+    def _get_draw(self) -> PIL.ImageDraw.ImageDraw:
+        if self._annotated is None:
+            self._annotated = self.original.convert("RGB")
+        if self._draw is None:
+            self._draw = PIL.ImageDraw.Draw(self._annotated, "RGBA")
+        return self._draw
+
+    def _draw_shapes(self) -> None:
+        """Draw any shapes that have been recorded but not yet drawn."""
+        if self._num_drawn == len(self.shapes):
+            return
+        draw = self._get_draw()
+        line, rectangle, ellipse = draw.line, draw.rectangle, draw.ellipse
+        for shape in itertools.islice(self.shapes, self._num_drawn, None):
+            kind = shape[0]
+            if kind == "line":
+                line(shape[1], fill=shape[2], width=shape[3])
+            elif kind == "rect":
+                rectangle(shape[1], shape[2], COLORS.TRANSPARENT)
+                if shape[4] > 0:
+                    for edge in get_rect_edges(shape[1]):
+                        line(edge, fill=shape[3], width=shape[4])
+            else:
+                ellipse(shape[1], shape[2], shape[3])
+        self._num_drawn = len(self.shapes)
+
+    @property
+    def annotated(self) -> PIL.Image.Image:
+        self._get_draw()
+        self._draw_shapes()
+        assert self._annotated is not None
+        return self._annotated
+
+    @property
+    def draw(self) -> PIL.ImageDraw.ImageDraw:
+        self._draw_shapes()
+        return self._get_draw()
+
+    def _get_image(self) -> PIL.Image.Image:
+        """The annotated image if anything has been drawn, else the original."""
+        if self._annotated is None and not self.shapes:
+            return self.original
+        return self.annotated
+
+    def to_svg(self) -> str:
+        """
+        Return an SVG document of the original page image, overlaid with the
+        shapes drawn via this PageImage's drawing methods, as vector graphics.
+        Consecutive shapes of the same kind and style are combined into a
+        single path (within which overlapping shapes are only painted once),
+        so that even thousands of shapes render quickly.
+        """
+        width, height = self.original.size
+        png = BytesIO()
+        self.original.save(png, "PNG")
+        data = base64.b64encode(png.getvalue()).decode("ascii")
+        parts = [
+            '<svg xmlns="http://www.w3.org/2000/svg" '
+            'xmlns:xlink="http://www.w3.org/1999/xlink" '
+            f'width="{width}" height="{height}" '
+            f'viewBox="0 0 {width} {height}">',
+            f'<image width="{width}" height="{height}" '
+            f'xlink:href="data:image/png;base64,{data}"/>',
+        ]
+        for (kind, *style), shapes in itertools.groupby(
+            self.shapes, key=lambda shape: (shape[0], *shape[2:])
+        ):
+            parts.append(get_svg_elements(kind, tuple(style), list(shapes)))
+        parts.append("</svg>")
+        return "\n".join(parts)
+
     def save(
         self,
         dest: Union[str, pathlib.Path, BytesIO],
@@ -156,12 +534,19 @@ class PageImage:
         bits: int = 8,
         **kwargs: Any,
     ) -> None:
+        if format.upper() == "SVG":
+            svg = self.to_svg()
+            if isinstance(dest, (str, pathlib.Path)):
+                pathlib.Path(dest).write_text(svg, encoding="utf-8")
+            else:
+                dest.write(svg.encode("utf-8"))
+            return
+
+        image = self._get_image()
         if quantize:
-            out = self.annotated.quantize(colors, method=PIL.Image.FASTOCTREE).convert(
-                "P"
-            )
+            out = image.quantize(colors, method=PIL.Image.FASTOCTREE).convert("P")
         else:
-            out = self.annotated
+            out = image
 
         out.save(
             dest,
@@ -180,31 +565,24 @@ class PageImage:
         stroke: T_color = DEFAULT_STROKE,
         stroke_width: int = DEFAULT_STROKE_WIDTH,
     ) -> "PageImage":
-        # If passing a raw list of points, use those
-        if isinstance(points_or_obj, (tuple, list)):
-            points = points_or_obj
-        # Else, use the "pts" attribute if available
-        elif isinstance(points_or_obj, dict) and "pts" in points_or_obj:
-            points = [(x, y) for x, y in points_or_obj["pts"]]
-        # Otherwise, just use ((x0, top), (x1, bottom))
-        else:
-            obj = points_or_obj
-            points = ((obj["x0"], obj["top"]), (obj["x1"], obj["bottom"]))
-
-        self.draw.line(
-            list(map(self._reproject, points)), fill=stroke, width=stroke_width
+        return self.draw_lines(
+            [points_or_obj], stroke=stroke, stroke_width=stroke_width
         )
 
-        return self
-
     def draw_lines(
         self,
         list_of_lines: Union[T_seq[T_contains_points], "DataFrame"],
         stroke: T_color = DEFAULT_STROKE,
         stroke_width: int = DEFAULT_STROKE_WIDTH,
     ) -> "PageImage":
-        for x in utils.to_list(list_of_lines):
-            self.draw_line(x, stroke=stroke, stroke_width=stroke_width)
+        lines = [get_line_points(x) for x in utils.to_list(list_of_lines)]
+        # Reproject all of the lines' points at once
+        points = self._reproject_points([pt for line in lines for pt in line])
+        start = 0
+        for line in lines:
+            end = start + len(line)
+            self.shapes.append(("line", points[start:end], stroke, stroke_width))
+            start = end
         return self
 
     def draw_vline(
@@ -213,9 +591,7 @@ class PageImage:
         stroke: T_color = DEFAULT_STROKE,
         stroke_width: int = DEFAULT_STROKE_WIDTH,
     ) -> "PageImage":
-        points = (location, self.bbox[1], location, self.bbox[3])
-        self.draw.line(self._reproject_bbox(points), fill=stroke, width=stroke_width)
-        return self
+        return self.draw_vlines([location], stroke=stroke, stroke_width=stroke_width)
 
     def draw_vlines(
         self,
@@ -223,8 +599,9 @@ class PageImage:
         stroke: T_color = DEFAULT_STROKE,
         stroke_width: int = DEFAULT_STROKE_WIDTH,
     ) -> "PageImage":
-        for x in list(locations):
-            self.draw_vline(x, stroke=stroke, stroke_width=stroke_width)
+        _, top, _, bottom = self._reproject_bbox(self.bbox)
+        for x in reproject_values(list(locations), self.bbox[0], self.scale):
+            self.shapes.append(("line", [(x, top), (x, bottom)], stroke, stroke_width))
         return self
 
     def draw_hline(
@@ -233,9 +610,7 @@ class PageImage:
         stroke: T_color = DEFAULT_STROKE,
         stroke_width: int = DEFAULT_STROKE_WIDTH,
     ) -> "PageImage":
-        points = (self.bbox[0], location, self.bbox[2], location)
-        self.draw.line(self._reproject_bbox(points), fill=stroke, width=stroke_width)
-        return self
+        return self.draw_hlines([location], stroke=stroke, stroke_width=stroke_width)
 
     def draw_hlines(
         self,
@@ -243,8 +618,9 @@ class PageImage:
         stroke: T_color = DEFAULT_STROKE,
         stroke_width: int = DEFAULT_STROKE_WIDTH,
     ) -> "PageImage":
-        for x in list(locations):
-            self.draw_hline(x, stroke=stroke, stroke_width=stroke_width)
+        x0, _, x1, _ = self._reproject_bbox(self.bbox)
+        for y in reproject_values(list(locations), self.bbox[1], self.scale):
+            self.shapes.append(("line", [(x0, y), (x1, y)], stroke, stroke_width))
         return self
 
     def draw_rect(
@@ -254,41 +630,45 @@ class PageImage:
         stroke: T_color = DEFAULT_STROKE,
         stroke_width: int = DEFAULT_STROKE_WIDTH,
     ) -> "PageImage":
-        if isinstance(bbox_or_obj, (tuple, list)):
-            bbox = bbox_or_obj
-        else:
-            obj = bbox_or_obj
-            bbox = (obj["x0"], obj["top"], obj["x1"], obj["bottom"])
-
-        x0, top, x1, bottom = bbox
-        half = stroke_width / 2
-        x0 = min(x0 + half, (x0 + x1) / 2)
-        top = min(top + half, (top + bottom) / 2)
-        x1 = max(x1 - half, (x0 + x1) / 2)
-        bottom = max(bottom - half, (top + bottom) / 2)
-
-        fill_bbox = self._reproject_bbox((x0, top, x1, bottom))
-        self.draw.rectangle(fill_bbox, fill, COLORS.TRANSPARENT)
-
-        if stroke_width > 0:
-            segments = [
-                ((x0, top), (x1, top)),  # top
-                ((x0, bottom), (x1, bottom)),  # bottom
-                ((x0, top), (x0, bottom)),  # left
-                ((x1, top), (x1, bottom)),  # right
-            ]
-            self.draw_lines(segments, stroke=stroke, stroke_width=stroke_width)
-        return self
+        return self.draw_rects(
+            [bbox_or_obj], fill=fill, stroke=stroke, stroke_width=stroke_width
+        )
 
     def draw_rects(
         self,
-        list_of_rects: Union[List[T_bbox], T_obj_list, "DataFrame"],
+        list_of_rects: Union[T_seq[Union[T_bbox, T_obj]], "DataFrame"],
         fill: T_color = DEFAULT_FILL,
         stroke: T_color = DEFAULT_STROKE,
         stroke_width: int = DEFAULT_STROKE_WIDTH,
     ) -> "PageImage":
-        for x in utils.to_list(list_of_rects):
-            self.draw_rect(x, fill=fill, stroke=stroke, stroke_width=stroke_width)
+        bboxes: Iterable[T_seq[T_num]]
+        if isinstance(list_of_rects, CharStore):
+            bboxes = list_of_rects.bboxes()
+        else:
+            bboxes = (
+                x
+                if isinstance(x, (tuple, list))
+                else (x["x0"], x["top"], x["x1"], x["bottom"])
+                for x in utils.to_list(list_of_rects)
+            )
+
+        # Inset each rect by half the stroke width, so that the stroke falls
+        # within the rect's bounds
+        half = stroke_width / 2
+        corners = []
+        for x0, top, x1, bottom in bboxes:
+            x0 = min(x0 + half, (x0 + x1) / 2)
+            top = min(top + half, (top + bottom) / 2)
+            x1 = max(x1 - half, (x0 + x1) / 2)
+            bottom = max(bottom - half, (top + bottom) / 2)
+            corners.append((x0, top))
+            corners.append((x1, bottom))
+
+        points = self._reproject_points(corners)
+        for (x0, top), (x1, bottom) in zip(points[::2], points[1::2]):
+            self.shapes.append(
+                ("rect", (x0, top, x1, bottom), fill, stroke, stroke_width)
+            )
         return self
 
     def draw_circle(
@@ -298,25 +678,29 @@ class PageImage:
         fill: T_color = DEFAULT_FILL,
         stroke: T_color = DEFAULT_STROKE,
     ) -> "PageImage":
-        if isinstance(center_or_obj, tuple):
-            center = center_or_obj
-        else:
-            obj = center_or_obj
-            center = ((obj["x0"] + obj["x1"]) / 2, (obj["top"] + obj["bottom"]) / 2)
-        cx, cy = center
-        bbox = (cx - radius, cy - radius, cx + radius, cy + radius)
-        self.draw.ellipse(self._reproject_bbox(bbox), fill, stroke)
-        return self
+        return self.draw_circles(
+            [center_or_obj], radius=radius, fill=fill, stroke=stroke
+        )
 
     def draw_circles(
         self,
-        list_of_circles: Union[List[T_point], T_obj_list, "DataFrame"],
+        list_of_circles: Union[T_seq[Union[T_point, T_obj]], "DataFrame"],
         radius: int = 5,
         fill: T_color = DEFAULT_FILL,
         stroke: T_color = DEFAULT_STROKE,
     ) -> "PageImage":
+        corners = []
         for x in utils.to_list(list_of_circles):
-            self.draw_circle(x, radius=radius, fill=fill, stroke=stroke)
+            if isinstance(x, tuple):
+                cx, cy = x
+            else:
+                cx, cy = ((x["x0"] + x["x1"]) / 2, (x["top"] + x["bottom"]) / 2)
+            corners.append((cx - radius, cy - radius))
+            corners.append((cx + radius, cy + radius))
+
+        points = self._reproject_points(corners)
+        for (x0, top), (x1, bottom) in zip(points[::2], points[1::2]):
+            self.shapes.append(("ellipse", (x0, top, x1, bottom), fill, stroke))
         return self
 
     def debug_table(
@@ -393,4 +777,4 @@ class PageImage:
         return b.getvalue()
 
     def show(self) -> None:  # pragma: no cover
-        self.annotated.show()
+        self._get_image().show()
@@ -9,12 +9,16 @@ from typing import (
     List,
     Optional,
     Pattern,
+    Sequence,
+    Set,
     Tuple,
     Union,
+    cast,
 )
 
 from pdfminer.converter import PDFPageAggregator
 from pdfminer.layout import (
+    LAParams,
     LTChar,
     LTComponent,
     LTContainer,
@@ -23,7 +27,7 @@ from pdfminer.layout import (
     LTPage,
     LTTextContainer,
 )
-from pdfminer.pdfinterp import PDFPageInterpreter, PDFStackT
+from pdfminer.pdfinterp import PDFPageInterpreter, PDFResourceManager, PDFStackT
 from pdfminer.pdfpage import PDFPage
 from pdfminer.psparser import PSLiteral
 
@@ -31,12 +35,19 @@ from . import utils
 from ._typing import T_bbox, T_num, T_obj, T_obj_list
 from .container import Container
 from .structure import PDFStructTree, StructTreeMissing
-from .table import T_table_settings, Table, TableFinder, TableSettings
-from .utils import decode_text, resolve_all, resolve_and_decode
-from .utils.text import TextMap
+from .table import T_table_settings, Table, TableFinder, TableSettings, extract_tables
+from .utils import decode_text, resolve_all, resolve_and_decode, spatial
+from .utils.charstore import CharStore
+from .utils.spatial import SpatialIndex, get_bboxes, subset
+from .utils.text import WORD_EXTRACTOR_KWARGS, TextMap, WordExtractor, WordMap
 
 lt_pat = re.compile(r"^LT")
 
+# The maximum number of TextMaps and WordMaps, respectively, that each page
+# caches; each is keyed on the settings used to create it.
+TEXTMAP_CACHE_SIZE = 16
+WORDMAP_CACHE_SIZE = 8
+
 ALL_ATTRS = set(
     [
         "adv",
@@ -69,6 +80,10 @@ ALL_ATTRS = set(
 )
 
 
+# The object types that pdfminer.six creates when painting paths and images
+PATH_OBJECT_TYPES = set(["line", "rect", "curve"])
+IMAGE_OBJECT_TYPES = set(["image"])
+
 if TYPE_CHECKING:  # pragma: nocover
     from .display import PageImage
     from .pdf import PDF
@@ -118,6 +133,16 @@ def normalize_color(
     return separate_pattern(tuplefied)
 
 
+@lru_cache(maxsize=None)
+def _get_class_object_type(class_name: str) -> str:
+    return re.sub(lt_pat, "", class_name).lower()
+
+
+def get_object_type(obj: LTItem) -> str:
+    """E.g., "char" for an LTChar, "textboxhorizontal" for an LTTextBoxHorizontal"""
+    return _get_class_object_type(obj.__class__.__name__)
+
+
 def tuplify_list_kwargs(kwargs: Dict[str, Any]) -> Dict[str, Any]:
     return {
         key: (tuple(value) if isinstance(value, list) else value)
@@ -132,6 +157,21 @@ class PDFPageAggregatorWithMarkedContent(PDFPageAggregator):
     cur_mcid: Optional[int] = None
     cur_tag: Optional[str] = None
 
+    def __init__(
+        self,
+        rsrcmgr: PDFResourceManager,
+        pageno: int = 1,
+        laparams: Optional[LAParams] = None,
+        object_types: Optional[Set[str]] = None,
+    ):
+        super().__init__(rsrcmgr, pageno=pageno, laparams=laparams)
+        # If provided, the object types to be extracted. Paths and images are
+        # skipped entirely when none of their object types are requested.
+        self.object_types = object_types
+
+    def wants(self, kinds: Set[str]) -> bool:
+        return self.object_types is None or not kinds.isdisjoint(self.object_types)
+
     def begin_tag(self, tag: PSLiteral, props: Optional[PDFStackT] = None) -> None:
         """Handle beginning of tag, setting current MCID if any."""
         self.cur_tag = decode_text(tag.name)
@@ -167,13 +207,15 @@ class PDFPageAggregatorWithMarkedContent(PDFPageAggregator):
 
     def render_image(self, *args, **kwargs) -> None:  # type: ignore
         """Hook for rendering images, adding the `mcid` attribute."""
-        super().render_image(*args, **kwargs)
-        self.tag_cur_item()
+        if self.wants(IMAGE_OBJECT_TYPES):
+            super().render_image(*args, **kwargs)
+            self.tag_cur_item()
 
     def paint_path(self, *args, **kwargs) -> None:  # type: ignore
         """Hook for rendering lines and curves, adding the `mcid` attribute."""
-        super().paint_path(*args, **kwargs)
-        self.tag_cur_item()
+        if self.wants(PATH_OBJECT_TYPES):
+            super().paint_path(*args, **kwargs)
+            self.tag_cur_item()
 
 
 def _normalize_box(box_raw: T_bbox, rotation: T_num = 0) -> T_bbox:
@@ -197,8 +239,41 @@ def _invert_box(box_raw: T_bbox, mb_height: T_num) -> T_bbox:
     return (x0, mb_height - y1, x1, mb_height - y0)
 
 
+def get_page_boxes(page_obj: PDFPage) -> Tuple[int, T_bbox, T_bbox]:
+    """
+    Return the (rotation, mediabox, cropbox) of a pdfminer.six page, with
+    the boxes expressed in pdfplumber's top-left-origin coordinates.
+    """
+
+    def get_attr(key: str, default: Any = None) -> Any:
+        ref = page_obj.attrs.get(key)
+        return default if ref is None else resolve_all(ref)
+
+    # Per PDF Reference Table 3.27: "The number of degrees by which the
+    # page should be rotated clockwise when displayed or printed. The value
+    # must be a multiple of 90. Default value: 0"
+    _rotation = get_attr("Rotate", 0)
+    rotation = _rotation % 360
+
+    mb_raw = _normalize_box(get_attr("MediaBox"), rotation)
+    mb_height = mb_raw[3] - mb_raw[1]
+
+    mediabox = _invert_box(mb_raw, mb_height)
+
+    if "CropBox" in page_obj.attrs:
+        cropbox = _invert_box(_normalize_box(get_attr("CropBox"), rotation), mb_height)
+    else:
+        cropbox = mediabox
+
+    return rotation, mediabox, cropbox
+
+
 class Page(Container):
-    cached_properties: List[str] = Container.cached_properties + ["_layout"]
+    cached_properties: List[str] = Container.cached_properties + [
+        "_layout",
+        "_spatial_indexes",
+        "_views",
+    ]
     is_original: bool = True
     pages = None
 
@@ -215,36 +290,22 @@ class Page(Container):
         self.page_number = page_number
         self.initial_doctop = initial_doctop
 
-        def get_attr(key: str, default: Any = None) -> Any:
-            ref = page_obj.attrs.get(key)
-            return default if ref is None else resolve_all(ref)
-
-        # Per PDF Reference Table 3.27: "The number of degrees by which the
-        # page should be rotated clockwise when displayed or printed. The value
-        # must be a multiple of 90. Default value: 0"
-        _rotation = get_attr("Rotate", 0)
-        self.rotation = _rotation % 360
-
-        mb_raw = _normalize_box(get_attr("MediaBox"), self.rotation)
-        mb_height = mb_raw[3] - mb_raw[1]
-
-        self.mediabox = _invert_box(mb_raw, mb_height)
-
-        if "CropBox" in page_obj.attrs:
-            self.cropbox = _invert_box(
-                _normalize_box(get_attr("CropBox"), self.rotation), mb_height
-            )
-        else:
-            self.cropbox = self.mediabox
+        self.rotation, self.mediabox, self.cropbox = get_page_boxes(page_obj)
 
         # Page.bbox defaults to self.mediabox, but can be altered by Page.crop(...)
         self.bbox = self.mediabox
 
+        # The number of CroppedPages derived from this page; see CroppedPage
+        self.num_crops = 0
+
         # See https://rednafi.com/python/lru_cache_on_methods/
-        self.get_textmap = lru_cache()(self._get_textmap)
+        self.get_textmap = lru_cache(TEXTMAP_CACHE_SIZE)(self._get_textmap)
+        self.get_wordmap = lru_cache(WORDMAP_CACHE_SIZE)(self._get_wordmap)
 
     def close(self) -> None:
         self.flush_cache()
+        self.get_textmap.cache_clear()
+        self.get_wordmap.cache_clear()
 
     @property
     def width(self) -> T_num:
@@ -270,6 +331,7 @@ class Page(Container):
             self.pdf.rsrcmgr,
             pageno=self.page_number,
             laparams=self.pdf.laparams,
+            object_types=self.pdf.object_types,
         )
         interpreter = PDFPageInterpreter(self.pdf.rsrcmgr, device)
         interpreter.process_page(self.page_obj)
@@ -326,24 +388,68 @@ class Page(Container):
     def objects(self) -> Dict[str, T_obj_list]:
         if hasattr(self, "_objects"):
             return self._objects
-        self._objects: Dict[str, T_obj_list] = self.parse_objects()
+        cache = self.pdf.object_cache
+        objects = None if cache is None else cache.load(self)
+        if objects is None:
+            objects = self.parse_objects()
+            if cache is not None:
+                cache.store(self, objects)
+        self._objects: Dict[str, T_obj_list] = objects
         return self._objects
 
+    def get_spatial_index(self, object_type: str) -> SpatialIndex:
+        """
+        Return a spatial index of the page's objects of type `object_type`,
+        building it on first use.
+        """
+        if not hasattr(self, "_spatial_indexes"):
+            self._spatial_indexes: Dict[str, SpatialIndex] = {}
+        index = self._spatial_indexes.get(object_type)
+        if index is None:
+            view = self.get_view(object_type)
+            if view is None:
+                objs = self.objects.get(object_type, [])
+                index = SpatialIndex.from_objects(objs)
+            else:
+                index = SpatialIndex(view.bboxes)
+            self._spatial_indexes[object_type] = index
+        return index
+
+    def get_view(self, object_type: str) -> Optional["ObjectView"]:
+        """
+        Return an `ObjectView` of the page's objects of type `object_type`,
+        relative to the root page's objects, or None if the page's objects
+        cannot be expressed that way.
+        """
+        if not hasattr(self, "_views"):
+            self._views: Dict[str, Optional[ObjectView]] = {}
+        if object_type not in self._views:
+            self._views[object_type] = self._make_view(object_type)
+        return self._views[object_type]
+
+    def get_object_types(self) -> List[str]:
+        """Return the types of objects (e.g., "char", "rect") on the page."""
+        return list(self.objects.keys())
+
+    def _make_view(self, object_type: str) -> Optional["ObjectView"]:
+        objs = self.objects.get(object_type, [])
+        return ObjectView(list(range(len(objs))), get_bboxes(objs))
+
     def point2coord(self, pt: Tuple[T_num, T_num]) -> Tuple[T_num, T_num]:
         return (pt[0], self.height - pt[1])
 
     def process_object(self, obj: LTItem) -> T_obj:
-        kind = re.sub(lt_pat, "", obj.__class__.__name__).lower()
+        kind = get_object_type(obj)
 
-        def process_attr(item: Tuple[str, Any]) -> Optional[Tuple[str, Any]]:
-            k, v = item
-            if k in ALL_ATTRS:
-                res = resolve_all(v)
-                return (k, res)
-            else:
-                return None
+        # If the PDF was opened with `attrs=[...]`, only compute those attributes
+        wanted = self.pdf.attrs
+
+        def want(key: str) -> bool:
+            return wanted is None or key in wanted
 
-        attr = dict(filter(None, map(process_attr, obj.__dict__.items())))
+        raw_attrs = ALL_ATTRS if wanted is None else ALL_ATTRS & wanted
+
+        attr = {k: resolve_all(v) for k, v in obj.__dict__.items() if k in raw_attrs}
 
         attr["object_type"] = kind
         attr["page_number"] = self.page_number
@@ -354,17 +460,25 @@ class Page(Container):
             # other objects. Keeping this code here, though,
             # for ease of addition if color spaces become
             # more available via pdfminer.six
-            if hasattr(obj, cs):
+            if want(cs) and hasattr(obj, cs):
                 attr[cs] = resolve_and_decode(getattr(obj, cs).name)
 
         for color_attr, pattern_attr in [
             ("stroking_color", "stroking_pattern"),
             ("non_stroking_color", "non_stroking_pattern"),
         ]:
-            if color_attr in attr:
-                attr[color_attr], attr[pattern_attr] = normalize_color(attr[color_attr])
-
-        if isinstance(obj, (LTChar, LTTextContainer)):
+            # The pattern is derived from the color, so read the color
+            # whenever either is wanted; see also the LTChar branch below.
+            if (want(color_attr) or want(pattern_attr)) and hasattr(obj, color_attr):
+                normalized, pattern = normalize_color(
+                    resolve_all(getattr(obj, color_attr))
+                )
+                if want(color_attr):
+                    attr[color_attr] = normalized
+                if want(pattern_attr):
+                    attr[pattern_attr] = pattern
+
+        if want("text") and isinstance(obj, (LTChar, LTTextContainer)):
             attr["text"] = obj.get_text()
 
         if isinstance(obj, LTChar):
@@ -372,55 +486,70 @@ class Page(Container):
             # directly expose .stroking_color and .non_stroking_color
             # for LTChar objects (unlike, e.g., LTRect objects).
             gs = obj.graphicstate
-            attr["stroking_color"], attr["stroking_pattern"] = normalize_color(
-                gs.scolor
-            )
-            attr["non_stroking_color"], attr["non_stroking_pattern"] = normalize_color(
-                gs.ncolor
-            )
+            for color_attr, pattern_attr, color in [
+                ("stroking_color", "stroking_pattern", gs.scolor),
+                ("non_stroking_color", "non_stroking_pattern", gs.ncolor),
+            ]:
+                if want(color_attr) or want(pattern_attr):
+                    normalized, pattern = normalize_color(color)
+                    if want(color_attr):
+                        attr[color_attr] = normalized
+                    if want(pattern_attr):
+                        attr[pattern_attr] = pattern
 
             # Handle (rare) byte-encoded fontnames
-            if isinstance(attr["fontname"], bytes):
+            if isinstance(attr.get("fontname"), bytes):
                 attr["fontname"] = fix_fontname_bytes(attr["fontname"])
 
         elif isinstance(obj, (LTCurve,)):
-            attr["pts"] = list(map(self.point2coord, attr["pts"]))
-
-            # Ignoring typing because type signature for obj.original_path
-            # appears to be incorrect
-            attr["path"] = [(cmd, *map(self.point2coord, pts)) for cmd, *pts in obj.original_path]  # type: ignore  # noqa: E501
-
-            attr["dash"] = obj.dashing_style
-
-        if "y0" in attr:
-            attr["top"] = self.height - attr["y1"]
-            attr["bottom"] = self.height - attr["y0"]
-            attr["doctop"] = self.initial_doctop + attr["top"]
+            if "pts" in attr:
+                attr["pts"] = list(map(self.point2coord, attr["pts"]))
+
+            if want("path"):
+                # Ignoring typing because type signature for obj.original_path
+                # appears to be incorrect
+                attr["path"] = [(cmd, *map(self.point2coord, pts)) for cmd, *pts in obj.original_path]  # type: ignore  # noqa: E501
+
+            if want("dash"):
+                attr["dash"] = obj.dashing_style
+
+        if isinstance(obj, LTComponent):
+            top = self.height - obj.y1
+            if want("top"):
+                attr["top"] = top
+            if want("bottom"):
+                attr["bottom"] = self.height - obj.y0
+            if want("doctop"):
+                attr["doctop"] = self.initial_doctop + top
 
         return attr
 
     def iter_layout_objects(
         self, layout_objects: List[LTComponent]
     ) -> Generator[T_obj, None, None]:
+        object_types = self.pdf.object_types
         for obj in layout_objects:
+            kind = get_object_type(obj)
+            wanted = kind != "anno" and (object_types is None or kind in object_types)
             # If object is, like LTFigure, a higher-level object ...
             if isinstance(obj, LTContainer):
                 # and LAParams is passed, process the object itself.
-                if self.pdf.laparams is not None:
+                if self.pdf.laparams is not None and wanted:
                     yield self.process_object(obj)
                 # Regardless, iterate through its children
                 yield from self.iter_layout_objects(obj._objs)
-            else:
+            elif wanted:
                 yield self.process_object(obj)
 
     def parse_objects(self) -> Dict[str, T_obj_list]:
         objects: Dict[str, T_obj_list] = {}
         for obj in self.iter_layout_objects(self.layout._objs):
             kind = obj["object_type"]
-            if kind in ["anno"]:
-                continue
             if objects.get(kind) is None:
-                objects[kind] = []
+                if kind == "char" and self.pdf.compact_chars:
+                    objects[kind] = cast(T_obj_list, CharStore())
+                else:
+                    objects[kind] = []
             objects[kind].append(obj)
         return objects
 
@@ -458,7 +587,7 @@ class Page(Container):
     ) -> List[List[List[Optional[str]]]]:
         tset = TableSettings.resolve(table_settings)
         tables = self.find_tables(tset)
-        return [table.extract(**(tset.text_settings or {})) for table in tables]
+        return extract_tables(tables, self.chars, **(tset.text_settings or {}))
 
     def extract_table(
         self, table_settings: Optional[T_table_settings] = None
@@ -479,7 +608,13 @@ class Page(Container):
         if "layout_height_chars" not in kwargs:
             defaults.update({"layout_height": self.height})
         full_kwargs: Dict[str, Any] = {**defaults, **kwargs}
-        return utils.chars_to_textmap(self.chars, **full_kwargs)
+        wordmap = self.get_wordmap(
+            **{k: v for k, v in full_kwargs.items() if k in WORD_EXTRACTOR_KWARGS}
+        )
+        return utils.chars_to_textmap(self.chars, wordmap=wordmap, **full_kwargs)
+
+    def _get_wordmap(self, **kwargs: Any) -> WordMap:
+        return WordExtractor(**kwargs).extract_wordmap(self.chars)
 
     def search(
         self,
@@ -508,7 +643,9 @@ class Page(Container):
         return utils.extract_text_simple(self.chars, **kwargs)
 
     def extract_words(self, **kwargs: Any) -> T_obj_list:
-        return utils.extract_words(self.chars, **kwargs)
+        wordmap = self.get_wordmap(**tuplify_list_kwargs(kwargs))
+        # Copy the words, so that changes to them do not affect the cache
+        return [dict(word) for word, _ in wordmap.tuples]
 
     def extract_text_lines(
         self, strip: bool = True, return_chars: bool = True, **kwargs: Any
@@ -542,6 +679,32 @@ class Page(Container):
             self, bbox, relative=relative, strict=strict, crop_fn=utils.outside_bbox
         )
 
+    def crop_many(
+        self,
+        bboxes: Sequence[T_bbox],
+        mode: str = "crop",
+        relative: bool = False,
+        strict: bool = True,
+    ) -> List["CroppedPage"]:
+        """
+        Same as calling .crop(bbox) — or, with mode="within"/"outside",
+        .within_bbox(bbox)/.outside_bbox(bbox) — for each of `bboxes`, except
+        that the objects are assigned to all of the bboxes at once, with a
+        single sweep per object type.
+        """
+        if mode not in CROP_MODES:
+            raise ValueError(f"mode must be one of {list(CROP_MODES)}, not {mode!r}")
+        crop_fn = CROP_MODES[mode]
+        pages = [
+            CroppedPage(self, bbox, crop_fn=crop_fn, relative=relative, strict=strict)
+            for bbox in bboxes
+        ]
+        batch = CropBatch(self, [page.crop_bbox for page in pages])
+        for i, page in enumerate(pages):
+            page._batch = batch
+            page._batch_position = i
+        return pages
+
     def filter(self, test_function: Callable[[T_obj], bool]) -> "FilteredPage":
         return FilteredPage(self, test_function)
 
@@ -553,6 +716,8 @@ class Page(Container):
         p = FilteredPage(self, lambda x: True)
         p._objects = {kind: objs for kind, objs in self.objects.items()}
         p._objects["char"] = utils.dedupe_chars(self.chars, **kwargs)
+        # Derived pages must use the deduplicated chars, rather than a view
+        p._views = {"char": None}
         return p
 
     def to_image(
@@ -569,7 +734,71 @@ class Page(Container):
         - width: The desired image width in pixels.
         - height: The desired image width in pixels.
         """
-        from .display import DEFAULT_RESOLUTION, PageImage
+        from .display import PageImage
+
+        return PageImage(
+            self,
+            resolution=self._get_resolution(resolution, width, height),
+            antialias=antialias,
+            force_mediabox=force_mediabox,
+        )
+
+    def to_array(
+        self,
+        resolution: Optional[Union[int, float]] = None,
+        width: Optional[Union[int, float]] = None,
+        height: Optional[Union[int, float]] = None,
+        antialias: bool = False,
+        grayscale: bool = False,
+    ) -> Any:
+        """
+        Render the page as a NumPy array of uint8 values, with shape (height,
+        width, 4) and BGRx channels, or (height, width) if `grayscale` is
+        True. The array is a view of the buffer that pdfium renders into,
+        rather than a copy. For a cropped page, only the cropped region is
+        rendered, if it lies within the page's cropbox; otherwise, the array
+        is a copy of the relevant region of the full page's buffer, padded
+        (as with `.to_image(...)`) with zeros beyond the cropbox. Requires
+        NumPy. Accepts the same `resolution`/`width`/`height` arguments as
+        `.to_image(...)`.
+        """
+        from .display import (
+            crop_array,
+            get_crop_box,
+            get_render_region,
+            render_page_array,
+        )
+
+        page_ix = self.page_number - 1
+        resolution = self._get_resolution(resolution, width, height)
+        # As with .to_image(...), uncropped pages display their cropbox
+        uncropped = self.bbox == self.cropbox or self.bbox == self.mediabox
+        region = None
+        if not uncropped:
+            region = get_render_region(
+                self.pdf.pdfium_doc, page_ix, resolution, self.bbox, self.cropbox
+            )
+
+        arr = render_page_array(
+            self.pdf.pdfium_doc,
+            page_ix,
+            resolution,
+            antialias=antialias,
+            grayscale=grayscale,
+            box=None if region is None else region[1],
+        )
+        if uncropped or region is not None:
+            return arr
+        scale = arr.shape[1] / (self.cropbox[2] - self.cropbox[0])
+        return crop_array(arr, get_crop_box(self.bbox, self.cropbox, scale))
+
+    def _get_resolution(
+        self,
+        resolution: Optional[Union[int, float]],
+        width: Optional[Union[int, float]],
+        height: Optional[Union[int, float]],
+    ) -> Union[int, float]:
+        from .display import DEFAULT_RESOLUTION
 
         num_specs = sum(x is not None for x in [resolution, width, height])
         if num_specs > 1:
@@ -581,12 +810,7 @@ class Page(Container):
         elif height is not None:
             resolution = 72 * height / self.height
 
-        return PageImage(
-            self,
-            resolution=resolution or DEFAULT_RESOLUTION,
-            antialias=antialias,
-            force_mediabox=force_mediabox,
-        )
+        return resolution or DEFAULT_RESOLUTION
 
     def to_dict(self, object_types: Optional[List[str]] = None) -> Dict[str, Any]:
         if object_types is None:
@@ -622,8 +846,19 @@ class DerivedPage(Page):
         self.page_number = parent_page.page_number
         self.mediabox = parent_page.mediabox
         self.cropbox = parent_page.cropbox
+        self.num_crops = 0
         self.flush_cache(Container.cached_properties)
-        self.get_textmap = lru_cache()(self._get_textmap)
+        self.get_textmap = lru_cache(TEXTMAP_CACHE_SIZE)(self._get_textmap)
+        self.get_wordmap = lru_cache(WORDMAP_CACHE_SIZE)(self._get_wordmap)
+
+    def _make_view(self, object_type: str) -> Optional["ObjectView"]:
+        return None
+
+    def get_object_types(self) -> List[str]:
+        # Avoid computing the page's objects, if they have not been already
+        if hasattr(self, "_objects"):
+            return list(self._objects.keys())
+        return self.parent_page.get_object_types()
 
 
 def test_proposed_bbox(bbox: T_bbox, parent_bbox: T_bbox) -> None:
@@ -646,6 +881,82 @@ def test_proposed_bbox(bbox: T_bbox, parent_bbox: T_bbox) -> None:
         )
 
 
+# The functions, and SpatialIndex methods, that select the same objects as
+# each of the built-in cropping functions
+INDEX_QUERIES: Dict[Callable[[T_obj_list, T_bbox], T_obj_list], str] = {
+    utils.crop_to_bbox: "intersects",
+    utils.within_bbox: "within",
+    utils.outside_bbox: "outside",
+}
+
+CROP_MODES: Dict[str, Callable[[T_obj_list, T_bbox], T_obj_list]] = {
+    "crop": utils.crop_to_bbox,
+    "within": utils.within_bbox,
+    "outside": utils.outside_bbox,
+}
+
+MIN_INDEXED_OBJECTS = 64
+
+
+class ObjectView:
+    """
+    The objects of a given type on a derived page, expressed as the
+    `indices` of the root page's objects from which they derive, their
+    current bounding boxes, and the `clips` (i.e., cropping bboxes) that
+    must be applied, in order, to the root page's objects to produce them.
+    This lets chains of derived pages select objects without copying them;
+    `positions` are the objects' indices in the parent page's view.
+    """
+
+    __slots__ = ("indices", "bboxes", "clips", "positions")
+
+    def __init__(
+        self,
+        indices: List[int],
+        bboxes: List[T_bbox],
+        clips: Tuple[T_bbox, ...] = (),
+        positions: Optional[List[int]] = None,
+    ):
+        self.indices = indices
+        self.bboxes = bboxes
+        self.clips = clips
+        self.positions = positions
+
+    def take(self, positions: List[int]) -> "ObjectView":
+        indices, bboxes = self.indices, self.bboxes
+        return ObjectView(
+            [indices[i] for i in positions],
+            [bboxes[i] for i in positions],
+            self.clips,
+            positions,
+        )
+
+
+class CropBatch:
+    """
+    The work shared by the pages that a single `Page.crop_many(...)` call
+    returns: for each object type, computed on first use, the positions of
+    the parent page's objects (in its view, if it has one) that might fall
+    within each of the `bboxes`.
+    """
+
+    def __init__(self, parent_page: Page, bboxes: List[T_bbox]):
+        self.parent_page = parent_page
+        self.bboxes = bboxes
+        self._candidates: Dict[str, List[List[int]]] = {}
+
+    def get_candidates(self, object_type: str, position: int) -> List[int]:
+        if object_type not in self._candidates:
+            parent = self.parent_page
+            view = parent.get_view(object_type)
+            if view is None:
+                bboxes = get_bboxes(parent.objects.get(object_type, []))
+            else:
+                bboxes = view.bboxes
+            self._candidates[object_type] = spatial.sweep(bboxes, self.bboxes)
+        return self._candidates[object_type][position]
+
+
 class CroppedPage(DerivedPage):
     def __init__(
         self,
@@ -669,6 +980,12 @@ class CroppedPage(DerivedPage):
         super().__init__(parent_page)
 
         self._crop_fn = _crop_fn
+        self.crop_fn = crop_fn
+        self.crop_bbox = crop_bbox
+        parent_page.num_crops += 1
+        # Set by Page.crop_many(...)
+        self._batch: Optional[CropBatch] = None
+        self._batch_position = 0
 
         # Note: testing for original function passed, not _crop_fn
         if crop_fn is utils.outside_bbox:
@@ -681,10 +998,93 @@ class CroppedPage(DerivedPage):
         if hasattr(self, "_objects"):
             return self._objects
         self._objects: Dict[str, T_obj_list] = {
-            k: self._crop_fn(v) for k, v in self.parent_page.objects.items()
+            k: self._crop_objs(k) for k in self.parent_page.get_object_types()
         }
         return self._objects
 
+    def _crop_objs(self, object_type: str) -> T_obj_list:
+        parent = self.parent_page
+        view = self.get_view(object_type)
+        if view is None:
+            objs = parent.objects[object_type]
+            if self.crop_fn is not utils.outside_bbox:
+                candidates = self._candidates(object_type, len(objs))
+                if candidates is not None:
+                    objs = subset(objs, candidates)
+            return self._crop_fn(objs)
+
+        assert view.positions is not None
+        if hasattr(parent, "_objects"):
+            # The parent's objects are already available, so start from those
+            objs = subset(parent._objects[object_type], view.positions)
+            if self.crop_fn is utils.crop_to_bbox:
+                objs = utils.crop_to_bbox(objs, self.crop_bbox)
+            return objs
+
+        objs = subset(self.root_page.objects[object_type], view.indices)
+        for clip in view.clips:
+            objs = utils.crop_to_bbox(objs, clip)
+        return objs
+
+    def _make_view(self, object_type: str) -> Optional[ObjectView]:
+        if self.crop_fn not in INDEX_QUERIES:
+            return None
+        parent = self.parent_page
+        parent_view = parent.get_view(object_type)
+        if parent_view is None:
+            return None
+
+        bboxes = parent_view.bboxes
+        candidates = self._candidates(object_type, len(bboxes))
+        if self.crop_fn is utils.crop_to_bbox:
+            positions, overlaps = spatial.clip(bboxes, self.crop_bbox, candidates)
+            view = parent_view.take(positions)
+            view.bboxes = overlaps
+            view.clips = view.clips + (self.crop_bbox,)
+            return view
+        return parent_view.take(self._query(bboxes, candidates))
+
+    def _candidates(self, object_type: str, num_objects: int) -> Optional[List[int]]:
+        """
+        Return the positions of the parent page's objects that might
+        intersect the crop bbox, via the page's crop batch or the parent's
+        spatial index, or None if all of the objects must be considered.
+        """
+        if self._batch is not None:
+            return self._batch.get_candidates(object_type, self._batch_position)
+        if self._use_index(object_type, num_objects):
+            index = self.parent_page.get_spatial_index(object_type)
+            return index.candidates(self.crop_bbox)
+        return None
+
+    def _use_index(self, object_type: str, num_objects: int) -> bool:
+        # Building a spatial index costs somewhat more than a single scan of
+        # the objects, so only use one once the parent has been cropped more
+        # than once (or already has an index).
+        parent = self.parent_page
+        return (
+            self.crop_fn in INDEX_QUERIES
+            and num_objects >= MIN_INDEXED_OBJECTS
+            and (
+                parent.num_crops >= 2
+                or object_type in getattr(parent, "_spatial_indexes", {})
+            )
+        )
+
+    def _query(
+        self, bboxes: List[T_bbox], candidates: Optional[List[int]]
+    ) -> List[int]:
+        """
+        Return the positions, among the parent page's objects' `bboxes`, of
+        the objects that this page keeps.
+        """
+        if self.crop_fn is utils.outside_bbox and candidates is not None:
+            # Keep everything except the candidates that intersect the bbox
+            hits = set(spatial.intersects(bboxes, self.crop_bbox, candidates))
+            return [i for i in range(len(bboxes)) if i not in hits]
+        query_fn = getattr(spatial, INDEX_QUERIES[self.crop_fn])
+        return cast(List[int], query_fn(bboxes, self.crop_bbox, candidates))
+
 
 class FilteredPage(DerivedPage):
     def __init__(self, parent_page: Page, filter_fn: Callable[[T_obj], bool]):
@@ -697,7 +1097,26 @@ class FilteredPage(DerivedPage):
         if hasattr(self, "_objects"):
             return self._objects
         self._objects: Dict[str, T_obj_list] = {
-            k: list(filter(self.filter_fn, v))
-            for k, v in self.parent_page.objects.items()
+            k: subset(v, self._select(k)) for k, v in self.parent_page.objects.items()
         }
         return self._objects
+
+    def _select(self, object_type: str) -> List[int]:
+        """
+        Return the positions, among the parent page's objects, of those that
+        pass the filter.
+        """
+        if not hasattr(self, "_selections"):
+            self._selections: Dict[str, List[int]] = {}
+        if object_type not in self._selections:
+            objs = self.parent_page.objects.get(object_type, [])
+            self._selections[object_type] = [
+                i for i, obj in enumerate(objs) if self.filter_fn(obj)
+            ]
+        return self._selections[object_type]
+
+    def _make_view(self, object_type: str) -> Optional[ObjectView]:
+        parent_view = self.parent_page.get_view(object_type)
+        if parent_view is None:
+            return None
+        return parent_view.take(self._select(object_type))
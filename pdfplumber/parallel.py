@@ -0,0 +1,259 @@
+import os
+import pathlib
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from io import BytesIO
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Deque,
+    Dict,
+    Generator,
+    Iterable,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+)
+
+if TYPE_CHECKING:  # pragma: nocover
+    from .page import Page
+    from .pdf import PDF
+
+T_page_fn = Union[str, Callable[..., Any]]
+T_source = Union[pathlib.Path, bytes]
+T_rendered = Union[bytes, pathlib.Path]
+
+# The PDF opened by each worker process; see `_init_worker`
+_worker_pdf: Optional["PDF"] = None
+
+# The pypdfium2 document opened by each rendering worker process; see
+# `_init_render_worker`
+_worker_pdfium_doc: Any = None
+
+
+class PageProcessingError(Exception):
+    """Raised when a page-level function fails in a worker process."""
+
+    pass
+
+
+def get_source(pdf: "PDF") -> T_source:
+    """
+    Return something from which a worker process can reopen `pdf`: its path,
+    if it was loaded from one, and otherwise the raw bytes of its stream.
+    """
+    if pdf.path is not None:
+        return pdf.path
+    pdf.stream.seek(0)
+    return pdf.stream.read()
+
+
+def get_open_kwargs(pdf: "PDF") -> Dict[str, Any]:
+    return {
+        "pages": pdf.pages_to_parse,
+        "laparams": None if pdf.laparams is None else vars(pdf.laparams),
+        "password": pdf.password,
+        "strict_metadata": pdf.strict_metadata,
+        "compact_chars": pdf.compact_chars,
+        "object_types": None if pdf.object_types is None else list(pdf.object_types),
+        "attrs": None if pdf.attrs is None else list(pdf.attrs),
+        "object_cache": pdf.object_cache,
+    }
+
+
+def _init_worker(source: T_source, open_kwargs: Dict[str, Any]) -> None:
+    from .pdf import PDF
+
+    global _worker_pdf
+    src: Union[pathlib.Path, BytesIO]
+    src = BytesIO(source) if isinstance(source, bytes) else source
+    _worker_pdf = PDF.open(src, **open_kwargs)
+
+
+def apply_page_fn(page: "Page", fn: T_page_fn, kwargs: Dict[str, Any]) -> Any:
+    """
+    Call `fn` on `page`, where `fn` is either a function that takes the page
+    as its first argument or the name of a `Page` method.
+    """
+    if isinstance(fn, str):
+        return getattr(page, fn)(**kwargs)
+    return fn(page, **kwargs)
+
+
+def _process_chunk(
+    indices: Sequence[int], fn: T_page_fn, kwargs: Dict[str, Any]
+) -> List[Any]:
+    assert _worker_pdf is not None
+    results = []
+    for i in indices:
+        page = None
+        try:
+            page = _worker_pdf.pages[i]
+            results.append(apply_page_fn(page, fn, kwargs))
+        except Exception as e:
+            description = (
+                f"page index {i}" if page is None else f"page {page.page_number}"
+            )
+            raise PageProcessingError(f"Error processing {description}: {e!r}") from e
+        finally:
+            # Release the page's cached layout and objects before moving on.
+            if page is not None:
+                page.close()
+    return results
+
+
+def map_pages(
+    pdf: "PDF",
+    fn: T_page_fn,
+    processes: Optional[int] = None,
+    chunksize: int = 1,
+    **kwargs: Any,
+) -> Generator[Any, None, None]:
+    """
+    Apply `fn` to each of `pdf`'s pages in a pool of worker processes,
+    yielding the results in page order.
+    """
+    if chunksize < 1:
+        raise ValueError("chunksize must be at least 1")
+
+    # This walks the page tree, rather than trusting its declared /Count
+    num_pages = len(pdf.pages)
+    processes = processes or os.cpu_count() or 1
+    chunks = (
+        range(start, min(start + chunksize, num_pages))
+        for start in range(0, num_pages, chunksize)
+    )
+
+    executor = ProcessPoolExecutor(
+        max_workers=processes,
+        initializer=_init_worker,
+        initargs=(get_source(pdf), get_open_kwargs(pdf)),
+    )
+    yield from _run_chunks(
+        executor, _process_chunk, chunks, (fn, kwargs), processes * 2
+    )
+
+
+def _run_chunks(
+    executor: ProcessPoolExecutor,
+    chunk_fn: Callable[..., List[Any]],
+    chunks: Iterable[Sequence[Any]],
+    args: Tuple[Any, ...],
+    max_pending: int,
+) -> Generator[Any, None, None]:
+    """
+    Submit `chunk_fn(chunk, *args)` to `executor` for each of `chunks`,
+    yielding the (list-valued) results' items in order, and shut down the
+    executor when done.
+    """
+    # Only keep a limited number of chunks in flight, so that results
+    # cannot pile up faster than they are consumed.
+    pending: Deque["Future[List[Any]]"] = deque()
+    try:
+        for chunk in chunks:
+            pending.append(executor.submit(chunk_fn, chunk, *args))
+            if len(pending) >= max_pending:
+                yield from pending.popleft().result()
+        while pending:
+            yield from pending.popleft().result()
+    finally:
+        for future in pending:
+            future.cancel()
+        executor.shutdown(wait=True)
+
+
+def _init_render_worker(source: T_source, password: Optional[str]) -> None:
+    from .display import open_pdfium_doc
+
+    global _worker_pdfium_doc
+    if isinstance(source, bytes):
+        _worker_pdfium_doc = open_pdfium_doc(BytesIO(source), None, password)
+    else:
+        _worker_pdfium_doc = open_pdfium_doc(None, source, password)
+
+
+def _render_chunk(
+    targets: Sequence[Tuple[int, Optional[pathlib.Path]]],
+    resolution: Union[int, float],
+    antialias: bool,
+    format: str,
+    save_kwargs: Dict[str, Any],
+) -> List[T_rendered]:
+    from .display import render_page
+
+    results: List[T_rendered] = []
+    for page_number, path in targets:
+        try:
+            img = render_page(
+                _worker_pdfium_doc, page_number - 1, resolution, antialias
+            )
+            if path is None:
+                buf = BytesIO()
+                img.save(buf, format=format, **save_kwargs)
+                results.append(buf.getvalue())
+            else:
+                img.save(path, format=format, **save_kwargs)
+                results.append(path)
+        except Exception as e:
+            raise PageProcessingError(
+                f"Error rendering page {page_number}: {e!r}"
+            ) from e
+    return results
+
+
+def render_pages(
+    pdf: "PDF",
+    page_numbers: Sequence[int],
+    resolution: Union[int, float],
+    antialias: bool = False,
+    format: str = "PNG",
+    directory: Optional[Union[str, pathlib.Path]] = None,
+    processes: Optional[int] = None,
+    chunksize: int = 1,
+    **kwargs: Any,
+) -> Generator[Tuple[int, T_rendered], None, None]:
+    """
+    Render each of `pdf`'s pages whose numbers are in `page_numbers` in a pool
+    of worker processes, each of which opens the PDF with pypdfium2 (but not
+    pdfminer), yielding `(page_number, image)` tuples in order. Each image is
+    encoded in `format` and either returned as bytes or, if `directory` is
+    provided, written to a file there, whose path is returned instead.
+    """
+    if chunksize < 1:
+        raise ValueError("chunksize must be at least 1")
+
+    paths: List[Optional[pathlib.Path]]
+    if directory is None:
+        paths = [None] * len(page_numbers)
+    else:
+        directory = pathlib.Path(directory)
+        directory.mkdir(parents=True, exist_ok=True)
+        width = len(str(max(page_numbers, default=0)))
+        ext = format.lower()
+        paths = [directory / f"page-{n:0{width}d}.{ext}" for n in page_numbers]
+
+    targets = list(zip(page_numbers, paths))
+    chunks = (
+        targets[start : start + chunksize]
+        for start in range(0, len(targets), chunksize)
+    )
+    save_kwargs = {"dpi": (resolution, resolution), **kwargs}
+
+    processes = processes or os.cpu_count() or 1
+    executor = ProcessPoolExecutor(
+        max_workers=processes,
+        initializer=_init_render_worker,
+        initargs=(get_source(pdf), pdf.password),
+    )
+    results = _run_chunks(
+        executor,
+        _render_chunk,
+        chunks,
+        (resolution, antialias, format, save_kwargs),
+        processes * 2,
+    )
+    for page_number, result in zip(page_numbers, results):
+        yield page_number, result
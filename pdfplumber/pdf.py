@@ -1,9 +1,25 @@
 import itertools
 import logging
 import pathlib
+from functools import lru_cache
 from io import BufferedReader, BytesIO
 from types import TracebackType
-from typing import Any, Dict, List, Optional, Tuple, Type, Union
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Dict,
+    Generator,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Pattern,
+    Sequence,
+    Tuple,
+    Type,
+    Union,
+    overload,
+)
 
 from pdfminer.layout import LAParams
 from pdfminer.pdfdocument import PDFDocument
@@ -13,14 +29,134 @@ from pdfminer.pdfparser import PDFParser
 from pdfminer.psparser import PSException
 
 from ._typing import T_num, T_obj_list
+from .cache import ObjectCache, hash_stream
 from .container import Container
-from .page import Page
+from .page import Page, get_page_boxes, tuplify_list_kwargs
+from .parallel import T_page_fn, map_pages, render_pages
 from .repair import _repair
+from .search import SearchIndex
 from .structure import PDFStructTree, StructTreeMissing
 from .utils import resolve_and_decode
+from .utils.text import compile_search_pattern
+
+if TYPE_CHECKING:  # pragma: nocover
+    import PIL.Image
 
 logger = logging.getLogger(__name__)
 
+# Attributes that every object has, even when `attrs=[...]` is passed.
+REQUIRED_ATTRS = ["object_type", "page_number"]
+
+# The maximum number of rendered page images that each PDF keeps in memory
+RENDER_CACHE_SIZE = 4
+
+
+class PageList(Sequence[Page]):
+    """
+    A lazily-populated sequence of a PDF's pages. The page tree is only
+    walked as far as needed to reach the requested page (or, for `len(...)`,
+    negative indices, and slices, all the way), and `Page` objects are only
+    created for pages that are actually accessed.
+    """
+
+    def __init__(self, pdf: "PDF"):
+        self.pdf = pdf
+        self.pages_to_parse = (
+            None if pdf.pages_to_parse is None else set(pdf.pages_to_parse)
+        )
+        self._page_objs = PDFPage.create_pages(pdf.doc)
+        self._exhausted = False
+        self._num_seen = 0
+        # For each selected page: its page number, pdfminer.six page object,
+        # and the sum of the heights of all selected pages preceding it.
+        self._entries: List[Tuple[int, PDFPage, T_num]] = []
+        self._next_doctop: T_num = 0
+        self._loaded: Dict[int, Page] = {}
+        # The number of selected pages, once the page tree has been walked.
+        # (The page tree's declared /Count is not necessarily accurate.)
+        self._len: Optional[int] = None
+
+    def _load_until(self, index: Optional[int]) -> bool:
+        """
+        Walk the page tree until the page at `index` (among selected pages)
+        has been found, or until the end if `index` is None. Returns False
+        if the document has too few pages.
+        """
+        pp = self.pages_to_parse
+        while not self._exhausted and (index is None or len(self._entries) <= index):
+            try:
+                page_obj = next(self._page_objs)
+            except StopIteration:
+                self._exhausted = True
+                self._len = len(self._entries)
+                break
+            self._num_seen += 1
+            page_number = self._num_seen
+            if pp is not None and page_number not in pp:
+                continue
+            self._entries.append((page_number, page_obj, self._next_doctop))
+            _, mediabox, _ = get_page_boxes(page_obj)
+            self._next_doctop += mediabox[3] - mediabox[1]
+        return index is None or len(self._entries) > index
+
+    def _get_page(self, index: int) -> Page:
+        if index in self._loaded:
+            return self._loaded[index]
+        if index < 0 or not self._load_until(index):
+            raise IndexError("page index out of range")
+        page_number, page_obj, doctop = self._entries[index]
+        page = Page(self.pdf, page_obj, page_number=page_number, initial_doctop=doctop)
+        self._loaded[index] = page
+        return page
+
+    @property
+    def loaded(self) -> List[Page]:
+        """The pages that have been accessed so far, in document order."""
+        return [self._loaded[i] for i in sorted(self._loaded)]
+
+    def is_loaded(self, index: int) -> bool:
+        """Whether the `Page` at `index` has already been created."""
+        return index in self._loaded
+
+    @property
+    def page_numbers(self) -> List[int]:
+        """
+        The page numbers of the selected pages, found by walking the page
+        tree (which may not match its declared page count), but without
+        creating any `Page`.
+        """
+        self._load_until(None)
+        return [page_number for page_number, _, _ in self._entries]
+
+    def __len__(self) -> int:
+        if self._len is None:
+            self._load_until(None)
+        return self._len or 0
+
+    @overload
+    def __getitem__(self, index: int) -> Page:
+        ...  # pragma: nocover
+
+    @overload
+    def __getitem__(self, index: slice) -> List[Page]:
+        ...  # pragma: nocover
+
+    def __getitem__(self, index: Union[int, slice]) -> Union[Page, List[Page]]:
+        if isinstance(index, slice):
+            return [self._get_page(i) for i in range(*index.indices(len(self)))]
+        if index < 0:
+            index += len(self)
+        return self._get_page(index)
+
+    def __iter__(self) -> Iterator[Page]:
+        i = 0
+        while self._load_until(i):
+            yield self._get_page(i)
+            i += 1
+
+    def __repr__(self) -> str:
+        return f"<PageList: {len(self)} pages>"
+
 
 class PDF(Container):
     cached_properties: List[str] = Container.cached_properties + ["_pages"]
@@ -34,6 +170,10 @@ class PDF(Container):
         laparams: Optional[Dict[str, Any]] = None,
         password: Optional[str] = None,
         strict_metadata: bool = False,
+        compact_chars: bool = False,
+        object_types: Optional[List[str]] = None,
+        attrs: Optional[List[str]] = None,
+        object_cache: Optional[Union[str, pathlib.Path, ObjectCache]] = None,
     ):
         self.stream = stream
         self.stream_is_external = stream_is_external
@@ -41,6 +181,17 @@ class PDF(Container):
         self.pages_to_parse = pages
         self.laparams = None if laparams is None else LAParams(**laparams)
         self.password = password
+        self.strict_metadata = strict_metadata
+        self.compact_chars = compact_chars
+        self.object_types = None if object_types is None else set(object_types)
+        self.attrs = None if attrs is None else set(attrs) | set(REQUIRED_ATTRS)
+        self.object_cache = (
+            object_cache
+            if object_cache is None or isinstance(object_cache, ObjectCache)
+            else ObjectCache(object_cache)
+        )
+
+        self.get_page_image = lru_cache(RENDER_CACHE_SIZE)(self._get_page_image)
 
         self.doc = PDFDocument(PDFParser(stream), password=password or "")
         self.rsrcmgr = PDFResourceManager()
@@ -72,6 +223,10 @@ class PDF(Container):
         strict_metadata: bool = False,
         repair: bool = False,
         gs_path: Optional[Union[str, pathlib.Path]] = None,
+        compact_chars: bool = False,
+        object_types: Optional[List[str]] = None,
+        attrs: Optional[List[str]] = None,
+        object_cache: Optional[Union[str, pathlib.Path, ObjectCache]] = None,
     ) -> "PDF":
 
         stream: Union[BufferedReader, BytesIO]
@@ -100,6 +255,10 @@ class PDF(Container):
                 password=password,
                 strict_metadata=strict_metadata,
                 stream_is_external=stream_is_external,
+                compact_chars=compact_chars,
+                object_types=object_types,
+                attrs=attrs,
+                object_cache=object_cache,
             )
 
         except PSException:
@@ -108,10 +267,18 @@ class PDF(Container):
             raise
 
     def close(self) -> None:
+        # Only close the pages that have actually been loaded; there is no
+        # need to walk the rest of the page tree just to close them.
+        if hasattr(self, "_pages"):
+            for page in self._pages.loaded:
+                page.close()
+
         self.flush_cache()
 
-        for page in self.pages:
-            page.close()
+        self.get_page_image.cache_clear()
+        if hasattr(self, "_pdfium_doc"):
+            self._pdfium_doc.close()
+            del self._pdfium_doc
 
         if not self.stream_is_external:
             self.stream.close()
@@ -128,21 +295,167 @@ class PDF(Container):
         self.close()
 
     @property
-    def pages(self) -> List[Page]:
+    def content_hash(self) -> str:
+        """The SHA-256 hash of the PDF's raw contents, used by `object_cache`."""
+        if hasattr(self, "_content_hash"):
+            return self._content_hash
+        self._content_hash: str = hash_stream(self.stream)
+        return self._content_hash
+
+    @property
+    def pdfium_doc(self) -> Any:
+        """
+        The `pypdfium2.PdfDocument` used to render the PDF's pages, which is
+        opened on first use and shared by all of them until `.close()`.
+        """
+        if hasattr(self, "_pdfium_doc"):
+            return self._pdfium_doc
+        from .display import open_pdfium_doc
+
+        self._pdfium_doc: Any = open_pdfium_doc(self.stream, self.path, self.password)
+        return self._pdfium_doc
+
+    def _get_page_image(
+        self,
+        page_ix: int,
+        resolution: Union[int, float],
+        antialias: bool = False,
+        box: Optional[Tuple[int, int, int, int]] = None,
+    ) -> "PIL.Image.Image":
+        from .display import render_page
+
+        return render_page(self.pdfium_doc, page_ix, resolution, antialias, box)
+
+    @property
+    def pages(self) -> PageList:
         if hasattr(self, "_pages"):
             return self._pages
+        self._pages: PageList = PageList(self)
+        return self._pages
 
-        doctop: T_num = 0
-        pp = self.pages_to_parse
-        self._pages: List[Page] = []
-        for i, page in enumerate(PDFPage.create_pages(self.doc)):
-            page_number = i + 1
-            if pp is not None and page_number not in pp:
+    def iter_pages(self, release: bool = True) -> Generator[Page, None, None]:
+        """
+        Yield the PDF's pages one at a time. If `release` is True (the
+        default), each page is closed (flushing its cached layout, objects,
+        and textmaps) as soon as the consumer moves on to the next page.
+        """
+        for page in self.pages:
+            try:
+                yield page
+            finally:
+                if release:
+                    page.close()
+
+    def map_pages(
+        self,
+        fn: T_page_fn,
+        processes: Optional[int] = None,
+        chunksize: int = 1,
+        **kwargs: Any,
+    ) -> Generator[Any, None, None]:
+        """
+        Call `fn(page, **kwargs)` on each page, using a pool of `processes`
+        worker processes (by default, one per CPU), and yield the results in
+        page order. `fn` can be a picklable function or the name of a `Page`
+        method, such as "extract_text". Each worker reopens the PDF from its
+        path (or bytes), and handles `chunksize` pages per task.
+        """
+        return map_pages(self, fn, processes=processes, chunksize=chunksize, **kwargs)
+
+    def render_pages(
+        self,
+        pages: Optional[Iterable[int]] = None,
+        resolution: Optional[Union[int, float]] = None,
+        antialias: bool = False,
+        format: str = "PNG",
+        directory: Optional[Union[str, pathlib.Path]] = None,
+        processes: Optional[int] = None,
+        chunksize: int = 1,
+        **kwargs: Any,
+    ) -> Generator[Tuple[int, Union[bytes, pathlib.Path]], None, None]:
+        """
+        Render each page (or only those whose page numbers are in `pages`) to
+        an image encoded in `format` (e.g., "PNG" or "JPEG"), using a pool of
+        `processes` worker processes, and yield `(page_number, image)` tuples
+        in page order. Each image is returned as bytes or, if `directory` is
+        provided, written to a file there, in which case its path is returned
+        instead. Additional `kwargs` are passed to `PIL.Image.Image.save(...)`.
+        """
+        # The workers render the pages via pdfium, so there is no need to
+        # create the pages themselves.
+        selected = None if pages is None else set(pages)
+        page_numbers = [
+            page_number
+            for page_number in self.pages.page_numbers
+            if selected is None or page_number in selected
+        ]
+        return render_pages(
+            self,
+            page_numbers,
+            resolution=resolution or 72,
+            antialias=antialias,
+            format=format,
+            directory=directory,
+            processes=processes,
+            chunksize=chunksize,
+            **kwargs,
+        )
+
+    def search_many(
+        self,
+        patterns: Sequence[Union[str, Pattern[str]]],
+        pages: Optional[Iterable[int]] = None,
+        regex: bool = True,
+        case: bool = True,
+        main_group: int = 0,
+        return_chars: bool = True,
+        return_groups: bool = True,
+        combine: bool = False,
+        **kwargs: Any,
+    ) -> Generator[Dict[str, Any], None, None]:
+        """
+        Search the text of each page (or only those whose page numbers are in
+        `pages`) for all of `patterns`, yielding the same dicts as
+        `Page.search(...)`, plus the "page_number" and the "pattern" matched.
+        The patterns are compiled only once, and each page's textmap is built
+        only once. Pages that had not been accessed before the search are
+        closed once they have been searched. See `TextMap.search_many(...)`
+        for the `combine` option.
+        """
+        compiled = [compile_search_pattern(p, regex=regex, case=case) for p in patterns]
+        selected = None if pages is None else set(pages)
+        textmap_kwargs = tuplify_list_kwargs(kwargs)
+        for index, page_number in enumerate(self.pages.page_numbers):
+            if selected is not None and page_number not in selected:
                 continue
-            p = Page(self, page, page_number=page_number, initial_doctop=doctop)
-            self._pages.append(p)
-            doctop += p.height
-        return self._pages
+            # Only release the pages that were not already in use
+            release = not self.pages.is_loaded(index)
+            page = self.pages[index]
+            try:
+                textmap = page.get_textmap(**textmap_kwargs)
+                for pattern_index, result in textmap.search_many(
+                    compiled,
+                    main_group=main_group,
+                    return_chars=return_chars,
+                    return_groups=return_groups,
+                    combine=combine,
+                ):
+                    result["page_number"] = page_number
+                    result["pattern"] = patterns[pattern_index]
+                    yield result
+            finally:
+                if release:
+                    page.close()
+
+    def build_search_index(self, **kwargs: Any) -> SearchIndex:
+        """
+        Build a `SearchIndex` of the text of every page, which can be searched
+        repeatedly (and saved, via `.to_json(...)`, and reloaded, via
+        `SearchIndex.from_json(...)`) without re-processing the pages. The
+        `kwargs` are those you would pass to `Page.search(...)`, e.g.,
+        `layout=True`.
+        """
+        return SearchIndex.from_pdf(self, **kwargs)
 
     @property
     def objects(self) -> Dict[str, T_obj_list]:
@@ -150,8 +463,8 @@ class PDF(Container):
             return self._objects
         all_objects: Dict[str, T_obj_list] = {}
         for p in self.pages:
-            for kind in p.objects.keys():
-                all_objects[kind] = all_objects.get(kind, []) + p.objects[kind]
+            for kind, objs in p.objects.items():
+                all_objects.setdefault(kind, []).extend(objs)
         self._objects: Dict[str, T_obj_list] = all_objects
         return self._objects
 
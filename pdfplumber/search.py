@@ -0,0 +1,174 @@
+import json
+from array import array
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Pattern,
+    TextIO,
+    Union,
+)
+
+from ._typing import T_bbox
+from .page import tuplify_list_kwargs
+from .utils.geometry import merge_bboxes, obj_to_bbox
+from .utils.text import TextMap, compile_search_pattern
+
+if TYPE_CHECKING:  # pragma: nocover
+    from .pdf import PDF
+
+# Incremented whenever the serialized format changes
+SEARCH_INDEX_VERSION = 1
+
+
+class PageText:
+    """
+    The searchable text of a single page: the string that `Page.search(...)`
+    searches, plus, for each character of that string, the index of the
+    bounding box of the char it came from (or -1, for layout-implied
+    whitespace).
+    """
+
+    def __init__(
+        self,
+        page_number: int,
+        text: str,
+        char_indices: "array[int]",
+        bboxes: List[T_bbox],
+    ):
+        self.page_number = page_number
+        self.text = text
+        self.char_indices = char_indices
+        self.bboxes = bboxes
+
+    @classmethod
+    def from_textmap(cls, page_number: int, textmap: TextMap) -> "PageText":
+        return cls(
+            page_number,
+            textmap.as_string,
+            textmap.char_indices,
+            list(map(obj_to_bbox, textmap.chars)),
+        )
+
+    def get_bbox(self, start: int, end: int) -> T_bbox:
+        bboxes = self.bboxes
+        return merge_bboxes(bboxes[i] for i in self.char_indices[start:end] if i >= 0)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "page_number": self.page_number,
+            "text": self.text,
+            "char_indices": self.char_indices.tolist(),
+            "bboxes": [list(bbox) for bbox in self.bboxes],
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "PageText":
+        return cls(
+            data["page_number"],
+            data["text"],
+            array("i", data["char_indices"]),
+            [tuple(bbox) for bbox in data["bboxes"]],  # type: ignore
+        )
+
+
+class SearchIndex:
+    """
+    A serializable index of the text of a PDF's pages, which can be searched
+    repeatedly, and saved and reloaded, without re-processing the pages.
+    Searches return the same dicts as `Page.search(...)` (minus the "chars"),
+    plus each result's "page_number".
+    """
+
+    def __init__(self, pages: List[PageText], settings: Dict[str, Any]):
+        self.pages = pages
+        self.settings = settings
+
+    @classmethod
+    def from_pdf(cls, pdf: "PDF", **kwargs: Any) -> "SearchIndex":
+        """
+        Index each page of `pdf`, closing each page (see `PDF.iter_pages(...)`)
+        once it has been indexed. The `kwargs` are those you would pass to
+        `Page.extract_text(...)`/`Page.search(...)`, e.g., `layout=True`.
+        """
+        textmap_kwargs = tuplify_list_kwargs(kwargs)
+        pages = [
+            PageText.from_textmap(page.page_number, page.get_textmap(**textmap_kwargs))
+            for page in pdf.iter_pages()
+        ]
+        return cls(pages, kwargs)
+
+    def search(
+        self,
+        pattern: Union[str, Pattern[str]],
+        regex: bool = True,
+        case: bool = True,
+        main_group: int = 0,
+        return_groups: bool = True,
+        pages: Optional[Iterable[int]] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        Search each indexed page (or only those whose page numbers are in
+        `pages`), with the same arguments as `Page.search(...)`.
+        """
+        compiled = compile_search_pattern(pattern, regex=regex, case=case)
+        page_numbers = None if pages is None else set(pages)
+        results = []
+        for page in self.pages:
+            if page_numbers is not None and page.page_number not in page_numbers:
+                continue
+            for m in compiled.finditer(page.text):
+                # As with Page.search(...), skip zero-length and
+                # whitespace-only matches
+                if not m.group(main_group).strip():
+                    continue
+                x0, top, x1, bottom = page.get_bbox(*m.span(main_group))
+                result = {
+                    "text": m.group(main_group),
+                    "x0": x0,
+                    "top": top,
+                    "x1": x1,
+                    "bottom": bottom,
+                }
+                if return_groups:
+                    result["groups"] = m.groups()
+                result["page_number"] = page.page_number
+                results.append(result)
+        return results
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "version": SEARCH_INDEX_VERSION,
+            "settings": self.settings,
+            "pages": [page.to_dict() for page in self.pages],
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "SearchIndex":
+        version = data.get("version")
+        if version != SEARCH_INDEX_VERSION:
+            raise ValueError(
+                f"Unsupported search index version: {version!r} "
+                f"(expected {SEARCH_INDEX_VERSION})"
+            )
+        pages = [PageText.from_dict(page) for page in data["pages"]]
+        return cls(pages, data["settings"])
+
+    def to_json(
+        self, stream: Optional[TextIO] = None, indent: Optional[int] = None
+    ) -> Optional[str]:
+        if stream is None:
+            return json.dumps(self.to_dict(), indent=indent)
+        else:
+            json.dump(self.to_dict(), stream, indent=indent)
+            return None
+
+    @classmethod
+    def from_json(cls, source: Union[str, TextIO]) -> "SearchIndex":
+        """Load a search index from a JSON string or a text stream."""
+        if isinstance(source, str):
+            return cls.from_dict(json.loads(source))
+        return cls.from_dict(json.load(source))
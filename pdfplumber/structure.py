@@ -13,6 +13,7 @@ from typing import (
     List,
     Optional,
     Pattern,
+    Set,
     Tuple,
     Union,
 )
@@ -489,8 +490,13 @@ class PDFStructTree(Findable):
                 # Not sure why mypy complains here
                 return bbox  # type: ignore
         else:
-            mcid_objs = []
+            # Group the MCIDs by page, so that each page's objects need only
+            # be scanned once
+            mcids_by_page: Dict[Optional[int], Set[int]] = {}
             for page_number, mcid in el.all_mcids():
+                mcids_by_page.setdefault(page_number, set()).add(mcid)
+            mcid_objs: List[T_obj] = []
+            for page_number, mcids in mcids_by_page.items():
                 objects: Iterable[T_obj]
                 if page_number is None:
                     if page is not None:
@@ -501,9 +507,7 @@ class PDFStructTree(Findable):
                     objects = itertools.chain.from_iterable(
                         self.pages[page_number].objects.values()
                     )
-                for c in objects:
-                    if c["mcid"] == mcid:
-                        mcid_objs.append(c)
+                mcid_objs.extend(c for c in objects if c["mcid"] in mcids)
             if not mcid_objs:
                 raise IndexError("No objects found")  # pragma: nocover
             return geometry.objects_to_bbox(mcid_objs)
@@ -1,7 +1,10 @@
+import bisect
+import heapq
 import itertools
+from collections import deque
 from dataclasses import dataclass
 from operator import itemgetter
-from typing import TYPE_CHECKING, Any, Dict, List, Optional, Set, Tuple, Union
+from typing import TYPE_CHECKING, Any, Deque, Dict, List, Optional, Set, Tuple, Union
 
 from . import utils
 from ._typing import T_bbox, T_num, T_obj, T_obj_iter, T_obj_list, T_point
@@ -12,6 +15,7 @@ DEFAULT_MIN_WORDS_VERTICAL = 3
 DEFAULT_MIN_WORDS_HORIZONTAL = 1
 
 T_intersections = Dict[T_point, Dict[str, T_obj_list]]
+T_cell_key = Tuple[int, int, int]
 T_table_settings = Union["TableSettings", Dict[str, Any]]
 
 if TYPE_CHECKING:  # pragma: nocover
@@ -215,15 +219,30 @@ def edges_to_intersections(
     v_edges, h_edges = [
         list(filter(lambda x: x["orientation"] == o, edges)) for o in ("v", "h")
     ]
+    h_edges = sorted(h_edges, key=itemgetter("top", "x0"))
+    h_tops = [h["top"] for h in h_edges]
+    n_h = len(h_edges)
+
     for v in sorted(v_edges, key=itemgetter("x0", "top")):
-        for h in sorted(h_edges, key=itemgetter("top", "x0")):
-            if (
-                (v["top"] <= (h["top"] + y_tolerance))
-                and (v["bottom"] >= (h["top"] - y_tolerance))
-                and (v["x0"] >= (h["x0"] - x_tolerance))
-                and (v["x0"] <= (h["x1"] + x_tolerance))
-            ):
-                vertex = (v["x0"], h["top"])
+        v_x0, v_top, v_bottom = v["x0"], v["top"], v["bottom"]
+
+        # Since h_edges are sorted by "top", the edges that can intersect `v`
+        # form a contiguous run. Locate it by bisection, then nudge its ends
+        # using the exact tests below, to guard against rounding differences.
+        start = bisect.bisect_left(h_tops, v_top - y_tolerance)
+        while start > 0 and v_top <= (h_tops[start - 1] + y_tolerance):
+            start -= 1
+        while start < n_h and not v_top <= (h_tops[start] + y_tolerance):
+            start += 1
+        end = bisect.bisect_right(h_tops, v_bottom + y_tolerance)
+        while end < n_h and v_bottom >= (h_tops[end] - y_tolerance):
+            end += 1
+        while end > start and not v_bottom >= (h_tops[end - 1] - y_tolerance):
+            end -= 1
+
+        for h in h_edges[start:end]:
+            if (v_x0 >= (h["x0"] - x_tolerance)) and (v_x0 <= (h["x1"] + x_tolerance)):
+                vertex = (v_x0, h["top"])
                 if vertex not in intersections:
                     intersections[vertex] = {"v": [], "h": []}
                 intersections[vertex]["v"].append(v)
@@ -240,37 +259,38 @@ def intersections_to_cells(intersections: T_intersections) -> List[T_bbox]:
     and a list of edge objects as values. The edge objects should correspond
     to the edges that touch the intersection.
     """
+    # The bboxes of the edges that touch each point, computed once per point
+    v_bboxes: Dict[T_point, Set[T_bbox]] = {}
+    h_bboxes: Dict[T_point, Set[T_bbox]] = {}
+    for point, edges in intersections.items():
+        v_bboxes[point] = set(map(utils.obj_to_bbox, edges["v"]))
+        h_bboxes[point] = set(map(utils.obj_to_bbox, edges["h"]))
 
     def edge_connects(p1: T_point, p2: T_point) -> bool:
-        def edges_to_set(edges: T_obj_list) -> Set[T_bbox]:
-            return set(map(utils.obj_to_bbox, edges))
-
         if p1[0] == p2[0]:
-            common = edges_to_set(intersections[p1]["v"]).intersection(
-                edges_to_set(intersections[p2]["v"])
-            )
-            if len(common):
+            if not v_bboxes[p1].isdisjoint(v_bboxes[p2]):
                 return True
 
         if p1[1] == p2[1]:
-            common = edges_to_set(intersections[p1]["h"]).intersection(
-                edges_to_set(intersections[p2]["h"])
-            )
-            if len(common):
+            if not h_bboxes[p1].isdisjoint(h_bboxes[p2]):
                 return True
         return False
 
     points = list(sorted(intersections.keys()))
-    n_points = len(points)
 
-    def find_smallest_cell(points: List[T_point], i: int) -> Optional[T_bbox]:
-        if i == n_points - 1:
-            return None
-        pt = points[i]
-        rest = points[i + 1 :]
+    # The points in each column (sorted by top) and in each row (sorted by x)
+    columns: Dict[T_num, List[T_point]] = {}
+    rows: Dict[T_num, List[T_point]] = {}
+    for pt in points:
+        columns.setdefault(pt[0], []).append(pt)
+        rows.setdefault(pt[1], []).append(pt)
+
+    def find_smallest_cell(pt: T_point) -> Optional[T_bbox]:
         # Get all the points directly below and directly right
-        below = [x for x in rest if x[0] == pt[0]]
-        right = [x for x in rest if x[1] == pt[1]]
+        column = columns[pt[0]]
+        row = rows[pt[1]]
+        below = column[bisect.bisect_right(column, pt) :]
+        right = row[bisect.bisect_right(row, pt) :]
         for below_pt in below:
             if not edge_connects(pt, below_pt):
                 continue
@@ -290,7 +310,7 @@ def intersections_to_cells(intersections: T_intersections) -> List[T_bbox]:
                     return (pt[0], pt[1], bottom_right[0], bottom_right[1])
         return None
 
-    cell_gen = (find_smallest_cell(points, i) for i in range(len(points)))
+    cell_gen = (find_smallest_cell(pt) for pt in points)
     return list(filter(None, cell_gen))
 
 
@@ -304,49 +324,45 @@ def cells_to_tables(cells: List[T_bbox]) -> List[List[T_bbox]]:
         x0, top, x1, bottom = bbox
         return ((x0, top), (x0, bottom), (x1, top), (x1, bottom))
 
-    remaining_cells = list(cells)
-
-    # Iterate through the cells found above, and assign them
-    # to contiguous tables
-
-    current_corners: Set[T_point] = set()
-    current_cells: List[T_bbox] = []
-
+    # Index the cells by their corners
+    cells_by_corner: Dict[T_point, List[int]] = {}
+    for i, cell in enumerate(cells):
+        for corner in bbox_to_corners(cell):
+            cells_by_corner.setdefault(corner, []).append(i)
+
+    # The positions of each distinct cell's copies, if there are duplicates
+    copies: Dict[T_bbox, Deque[int]] = {}
+    for i, cell in enumerate(cells):
+        copies.setdefault(cell, deque()).append(i)
+
+    # Assign the cells to contiguous tables, i.e., groups of cells connected
+    # via shared corners, each starting from the first remaining cell.
+    # Within each table, cells are ordered as if by repeatedly scanning the
+    # remaining cells and adding any that touch the table so far: a cell is
+    # added in the first scan that reaches it after a touching cell has
+    # been added (either earlier in that scan or in a previous one).
+    remaining = [True] * len(cells)
     tables = []
-    while len(remaining_cells):
-        initial_cell_count = len(current_cells)
-        for cell in list(remaining_cells):
-            cell_corners = bbox_to_corners(cell)
-            # If we're just starting a table ...
-            if len(current_cells) == 0:
-                # ... immediately assign it to the empty group
-                current_corners |= set(cell_corners)
-                current_cells.append(cell)
-                remaining_cells.remove(cell)
-            else:
-                # How many corners does this table share with the current group?
-                corner_count = sum(c in current_corners for c in cell_corners)
-
-                # If touching on at least one corner...
-                if corner_count > 0:
-                    # ... assign it to the current group
-                    current_corners |= set(cell_corners)
-                    current_cells.append(cell)
-                    remaining_cells.remove(cell)
-
-        # If this iteration did not find any more cells to append...
-        if len(current_cells) == initial_cell_count:
-            # ... start a new cell group
-            tables.append(list(current_cells))
-            current_corners.clear()
-            current_cells.clear()
-
-    # Once we have exhausting the list of cells ...
-
-    # ... and we have a cell group that has not been stored
-    if len(current_cells):
-        # ... store it.
-        tables.append(list(current_cells))
+    for first in range(len(cells)):
+        if not remaining[first]:
+            continue
+        table_cells = []
+        last_scan: Dict[int, int] = {}
+        queue: List[Tuple[int, int]] = [(0, first)]
+        while queue:
+            scan, i = heapq.heappop(queue)
+            if not remaining[i] or last_scan.get(i, -1) >= scan:
+                continue
+            last_scan[i] = scan
+            # Identical cells are interchangeable, so this consumes the first
+            # remaining copy, which is not necessarily the one at `i`
+            remaining[copies[cells[i]].popleft()] = False
+            table_cells.append(cells[i])
+            for corner in bbox_to_corners(cells[i]):
+                for j in cells_by_corner[corner]:
+                    if remaining[j]:
+                        heapq.heappush(queue, (scan if j > i else scan + 1, j))
+        tables.append(table_cells)
 
     # Sort the tables top-to-bottom-left-to-right based on the value of the
     # topmost-and-then-leftmost coordinate of a table.
@@ -397,29 +413,93 @@ class Table(object):
         return rows
 
     def extract(self, **kwargs: Any) -> List[List[Optional[str]]]:
+        return extract_tables([self], self.page.chars, **kwargs)[0]
 
-        chars = self.page.chars
-        table_arr = []
 
-        def char_in_bbox(char: T_obj, bbox: T_bbox) -> bool:
-            v_mid = (char["top"] + char["bottom"]) / 2
-            h_mid = (char["x0"] + char["x1"]) / 2
-            x0, top, x1, bottom = bbox
-            return bool(
-                (h_mid >= x0) and (h_mid < x1) and (v_mid >= top) and (v_mid < bottom)
-            )
+T_slabs = Tuple[List[T_num], List[Any]]
 
-        for row in self.rows:
-            arr = []
-            row_chars = [char for char in chars if char_in_bbox(char, row.bbox)]
 
-            for cell in row.cells:
+def get_slabs(intervals: List[Tuple[T_num, T_num, Any]]) -> T_slabs:
+    """
+    Given a list of (start, end, item) intervals, divide the number line at
+    every start and end value, and return the sorted division points along
+    with a list of the items covering each slab between adjacent points.
+    """
+    bounds = sorted(set(x for start, end, _ in intervals for x in (start, end)))
+    slabs: List[List[Any]] = [[] for _ in bounds[1:]]
+    for start, end, item in intervals:
+        first = bisect.bisect_left(bounds, start)
+        last = bisect.bisect_left(bounds, end)
+        for i in range(first, last):
+            slabs[i].append(item)
+    return bounds, slabs
+
+
+def get_slab(slabs: T_slabs, value: T_num) -> Any:
+    """
+    Return the contents of the slab containing `value`, or None if `value`
+    falls outside all of them.
+    """
+    bounds, contents = slabs
+    i = bisect.bisect_right(bounds, value) - 1
+    return contents[i] if 0 <= i < len(contents) else None
+
+
+def bucket_chars(
+    rows_by_table: List[List[Row]], chars: T_obj_iter
+) -> Dict[T_cell_key, T_obj_list]:
+    """
+    Assign each char to every table cell containing the char's midpoint, in
+    a single pass over `chars`. Return a dict mapping each cell's (table
+    index, row index, cell index) to the chars in that cell, in their
+    original order.
+    """
+    buckets: Dict[T_cell_key, T_obj_list] = {}
+    cells: List[Tuple[T_num, T_num, Tuple[T_bbox, T_cell_key]]] = []
+    for t, rows in enumerate(rows_by_table):
+        for r, row in enumerate(rows):
+            for c, cell in enumerate(row.cells):
+                if cell is not None:
+                    buckets[(t, r, c)] = []
+                    cells.append((cell[1], cell[3], (cell, (t, r, c))))
+
+    # Divide the cells into horizontal slabs, and the cells within each of
+    # those into vertical slabs
+    bounds, y_slabs = get_slabs(cells)
+    slabs = (
+        bounds,
+        [get_slabs([(c[0], c[2], key) for c, key in slab]) for slab in y_slabs],
+    )
+
+    for char in chars:
+        v_mid = (char["top"] + char["bottom"]) / 2
+        h_mid = (char["x0"] + char["x1"]) / 2
+        x_slabs = get_slab(slabs, v_mid)
+        if x_slabs is not None:
+            for key in get_slab(x_slabs, h_mid) or []:
+                buckets[key].append(char)
+    return buckets
+
+
+def extract_tables(
+    tables: List[Table], chars: T_obj_iter, **kwargs: Any
+) -> List[List[List[Optional[str]]]]:
+    """
+    Extract the text of each of `tables`, assigning `chars` to the tables'
+    cells in a single pass.
+    """
+    rows_by_table = [table.rows for table in tables]
+    buckets = bucket_chars(rows_by_table, chars)
+    extracted = []
+    for t, rows in enumerate(rows_by_table):
+        table_arr = []
+        for r, row in enumerate(rows):
+            arr = []
+            for c, cell in enumerate(row.cells):
                 if cell is None:
                     cell_text = None
                 else:
-                    cell_chars = [
-                        char for char in row_chars if char_in_bbox(char, cell)
-                    ]
+                    cell_chars = buckets[(t, r, c)]
 
                     if len(cell_chars):
                         if "layout" in kwargs:
@@ -431,8 +511,8 @@ class Table(object):
                         cell_text = ""
                 arr.append(cell_text)
             table_arr.append(arr)
-
-        return table_arr
+        extracted.append(table_arr)
+    return extracted
 
 
 TABLE_STRATEGIES = ["lines", "lines_strict", "text", "explicit"]
@@ -0,0 +1,323 @@
+from array import array
+from typing import (
+    Any,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Mapping,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+    overload,
+)
+
+from .._typing import T_bbox, T_num, T_obj
+
+# Attributes stored as arrays of floats, rather than as Python objects.
+FLOAT_ATTRS = set(
+    [
+        "x0",
+        "x1",
+        "y0",
+        "y1",
+        "top",
+        "bottom",
+        "doctop",
+        "width",
+        "height",
+        "size",
+        "adv",
+    ]
+)
+
+MATRIX_ATTRS = set(["matrix"])
+
+# Placeholder for objects that lack a given attribute.
+MISSING = object()
+
+
+def is_number(value: Any) -> bool:
+    return isinstance(value, (int, float)) and not isinstance(value, bool)
+
+
+class Column:
+    """A column of values that falls back to storing plain Python objects."""
+
+    def __init__(self, values: Iterable[Any] = ()):
+        self.values: List[Any] = list(values)
+
+    def accepts(self, value: Any) -> bool:
+        return True
+
+    def append(self, value: Any) -> None:
+        self.values.append(value)
+
+    def __getitem__(self, i: int) -> Any:
+        return self.values[i]
+
+    def __setitem__(self, i: int, value: Any) -> None:
+        self.values[i] = value
+
+    def __len__(self) -> int:
+        return len(self.values)
+
+    def __iter__(self) -> Iterator[Any]:
+        return iter(self.values)
+
+    def to_list(self) -> List[Any]:
+        return list(self.values)
+
+    def take(self, indices: Sequence[int]) -> "Column":
+        return Column(self.values[i] for i in indices)
+
+
+class FloatColumn(Column):
+    """Stores numeric values, as floats, in a compact array."""
+
+    def __init__(self, values: Iterable[T_num] = ()):
+        self.values: "array[float]" = array("d", values)  # type: ignore
+
+    def accepts(self, value: Any) -> bool:
+        return is_number(value)
+
+    def to_list(self) -> List[Any]:
+        return self.values.tolist()
+
+    def take(self, indices: Sequence[int]) -> "FloatColumn":
+        v = self.values
+        return FloatColumn(v[i] for i in indices)
+
+
+class MatrixColumn(Column):
+    """Stores 6-number transformation matrices, as floats, in a compact array."""
+
+    def __init__(self, values: Iterable[Tuple[T_num, ...]] = ()):
+        self.values: "array[float]" = array("d")  # type: ignore
+        for value in values:
+            self.append(value)
+
+    def accepts(self, value: Any) -> bool:
+        return (
+            isinstance(value, tuple) and len(value) == 6 and all(map(is_number, value))
+        )
+
+    def append(self, value: Any) -> None:
+        self.values.extend(value)
+
+    def __getitem__(self, i: int) -> Tuple[float, ...]:
+        return tuple(self.values[i * 6 : (i + 1) * 6])
+
+    def __setitem__(self, i: int, value: Any) -> None:
+        self.values[i * 6 : (i + 1) * 6] = array("d", value)
+
+    def __len__(self) -> int:
+        return len(self.values) // 6
+
+    def __iter__(self) -> Iterator[Tuple[float, ...]]:
+        return (self[i] for i in range(len(self)))
+
+    def to_list(self) -> List[Any]:
+        return list(self)
+
+    def take(self, indices: Sequence[int]) -> "MatrixColumn":
+        return MatrixColumn(self[i] for i in indices)
+
+
+class InternedColumn(Column):
+    """
+    Stores each distinct value once, plus a compact array of small-integer
+    codes pointing to those values.
+    """
+
+    def __init__(self, values: Iterable[Any] = ()):
+        self.table: List[Any] = []
+        self.codes: Dict[Any, int] = {}
+        self.values: "array[int]" = array("I")  # type: ignore
+        for value in values:
+            self.append(value)
+
+    def accepts(self, value: Any) -> bool:
+        try:
+            hash(value)
+        except TypeError:
+            return False
+        return True
+
+    def encode(self, value: Any) -> int:
+        # Include the type in the key, so that (e.g.) 1, 1.0, and True
+        # are not conflated.
+        key = (type(value), value)
+        code = self.codes.get(key)
+        if code is None:
+            code = self.codes[key] = len(self.table)
+            self.table.append(value)
+        return code
+
+    def append(self, value: Any) -> None:
+        self.values.append(self.encode(value))
+
+    def __getitem__(self, i: int) -> Any:
+        return self.table[self.values[i]]
+
+    def __setitem__(self, i: int, value: Any) -> None:
+        self.values[i] = self.encode(value)
+
+    def __iter__(self) -> Iterator[Any]:
+        return map(self.table.__getitem__, self.values)
+
+    def to_list(self) -> List[Any]:
+        return list(self)
+
+    def take(self, indices: Sequence[int]) -> "InternedColumn":
+        return InternedColumn(self[i] for i in indices)
+
+
+def make_column(key: str) -> Column:
+    if key in FLOAT_ATTRS:
+        return FloatColumn()
+    elif key in MATRIX_ATTRS:
+        return MatrixColumn()
+    else:
+        return InternedColumn()
+
+
+class CharView(Mapping[str, Any]):
+    """
+    A read-only, dict-like view of a single object in a `CharStore`.
+    """
+
+    __slots__ = ("store", "index")
+
+    def __init__(self, store: "CharStore", index: int):
+        self.store = store
+        self.index = index
+
+    def __getitem__(self, key: str) -> Any:
+        value = self.store.columns[key][self.index]
+        if value is MISSING:
+            raise KeyError(key)
+        return value
+
+    def __iter__(self) -> Iterator[str]:
+        i = self.index
+        return (k for k, col in self.store.columns.items() if col[i] is not MISSING)
+
+    def __len__(self) -> int:
+        return sum(1 for _ in self)
+
+    def __repr__(self) -> str:
+        return repr(dict(self))
+
+
+class CharStore(Sequence[T_obj]):
+    """
+    A compact, columnar ("struct-of-arrays") store of objects, typically
+    chars. Positional and size attributes are stored as arrays of floats,
+    transformation matrices as a flat array of floats, and other attributes
+    (fontnames, colors, et cetera) as small-integer codes pointing to a
+    table of distinct values. Indexing and iterating return dict-like
+    `CharView`s.
+    """
+
+    def __init__(self, columns: Optional[Dict[str, Column]] = None, length: int = 0):
+        self.columns: Dict[str, Column] = columns or {}
+        self.length = length
+
+    @classmethod
+    def from_objects(cls, objs: Iterable[T_obj]) -> "CharStore":
+        store = cls()
+        for obj in objs:
+            store.append(obj)
+        return store
+
+    def set_value(self, key: str, i: int, value: Any) -> None:
+        col = self.columns[key]
+        if not col.accepts(value):
+            # Fall back to a column type that can store this value
+            col = self.columns[key] = Column(col.to_list())
+        col[i] = value
+
+    def append(self, obj: T_obj) -> None:
+        for key, value in obj.items():
+            col = self.columns.get(key)
+            if col is None:
+                col = make_column(key)
+                if self.length:
+                    col = Column([MISSING] * self.length)
+                self.columns[key] = col
+            if not col.accepts(value):
+                col = self.columns[key] = Column(col.to_list())
+            col.append(value)
+        for key, col in self.columns.items():
+            if key not in obj:
+                if not col.accepts(MISSING):
+                    col = self.columns[key] = Column(col.to_list())
+                col.append(MISSING)
+        self.length += 1
+
+    def __len__(self) -> int:
+        return self.length
+
+    @overload
+    def __getitem__(self, index: int) -> T_obj:
+        ...  # pragma: nocover
+
+    @overload
+    def __getitem__(self, index: slice) -> "CharStore":
+        ...  # pragma: nocover
+
+    def __getitem__(self, index: Union[int, slice]) -> Union[T_obj, "CharStore"]:
+        if isinstance(index, slice):
+            return self.select(range(*index.indices(self.length)))
+        if index < 0:
+            index += self.length
+        if not 0 <= index < self.length:
+            raise IndexError("CharStore index out of range")
+        return CharView(self, index)  # type: ignore
+
+    def __iter__(self) -> Iterator[T_obj]:
+        for i in range(self.length):
+            yield CharView(self, i)  # type: ignore
+
+    def __repr__(self) -> str:
+        return f"<CharStore: {self.length} objects>"
+
+    def get_values(self, key: str) -> List[Any]:
+        """Return the values of attribute `key` for all objects in the store."""
+        return self.columns[key].to_list()
+
+    def bboxes(self) -> Iterator[T_bbox]:
+        cols = self.columns
+        return zip(cols["x0"], cols["top"], cols["x1"], cols["bottom"])
+
+    def select(self, indices: Iterable[int]) -> "CharStore":
+        """Return a new store, containing only the objects at `indices`."""
+        _indices = list(indices)
+        columns = {key: col.take(_indices) for key, col in self.columns.items()}
+        return self.__class__(columns, len(_indices))
+
+    def clip_to(self, bboxes: Sequence[T_bbox]) -> "CharStore":
+        """
+        Return a new store, in which each object's extent has been replaced by
+        the corresponding (smaller) bounding box in `bboxes`.
+        """
+        store = self.select(range(self.length))
+        has_doctop = "doctop" in store.columns
+        for i, (x0, top, x1, bottom) in enumerate(bboxes):
+            if has_doctop:
+                doctop = store.columns["doctop"][i]
+                if doctop is not MISSING:
+                    diff = top - store.columns["top"][i]
+                    store.set_value("doctop", i, doctop + diff)
+            for key, value in (
+                ("x0", x0),
+                ("top", top),
+                ("x1", x1),
+                ("bottom", bottom),
+                ("width", x1 - x0),
+                ("height", bottom - top),
+            ):
+                store.set_value(key, i, value)
+        return store
@@ -1,9 +1,62 @@
+import importlib
 import itertools
 from collections.abc import Hashable
 from operator import itemgetter
-from typing import Callable, Dict, Iterable, List, TypeVar, Union
+from typing import Any, Callable, Dict, Iterable, List, TypeVar, Union
 
 from .._typing import T_num
+from .charstore import CharStore
+
+# NumPy is optional; it is imported this way so that type-checking does not
+# depend on whether (or which version of) it is installed.
+np: Any
+try:
+    np = importlib.import_module("numpy")
+except ImportError:  # pragma: nocover
+    np = None
+
+# The minimum number of values for which to cluster using NumPy, if it is
+# installed; for fewer values, the pure-Python approach is faster.
+NUMPY_MIN_VALUES = 64
+
+
+def get_numeric_array(values: List[Any]) -> Any:
+    """
+    Return `values` as a NumPy array, if NumPy is installed, there are enough
+    values to benefit, and all values are (non-NaN) ints or floats.
+    """
+    if np is None or len(values) < NUMPY_MIN_VALUES:
+        return None
+    try:
+        arr = np.asarray(values)
+    except (ValueError, TypeError, OverflowError):
+        return None
+    if arr.ndim != 1 or arr.dtype.kind not in "iuf":
+        return None
+    if arr.dtype.kind == "f" and np.isnan(arr).any():
+        return None
+    return arr
+
+
+def get_cluster_labels(arr: Any, tolerance: T_num) -> Any:
+    """
+    Return the cluster number of each value in `arr`, clustering as
+    `cluster_list` does: distinct values, in sorted order, join the current
+    cluster if within `tolerance` of the previous value.
+    """
+    uniq, inverse = np.unique(arr, return_inverse=True)
+    breaks = uniq[1:] > (uniq[:-1] + tolerance)
+    labels = np.concatenate([[0], np.cumsum(breaks)])
+    return labels[inverse.ravel()]
+
+
+def split_at_changes(items: List[Any], labels: Any) -> List[List[Any]]:
+    """Split `items` wherever consecutive `labels` differ."""
+    if not items:
+        return []
+    splits = (np.flatnonzero(np.diff(labels)) + 1).tolist()
+    bounds = [0] + splits + [len(items)]
+    return [items[a:b] for a, b in zip(bounds, bounds[1:])]
 
 
 def cluster_list(xs: List[T_num], tolerance: T_num = 0) -> List[List[T_num]]:
@@ -11,6 +64,13 @@ def cluster_list(xs: List[T_num], tolerance: T_num = 0) -> List[List[T_num]]:
         return [[x] for x in sorted(xs)]
     if len(xs) < 2:
         return [[x] for x in sorted(xs)]
+    arr = get_numeric_array(xs)
+    if arr is not None:
+        order = np.argsort(arr, kind="stable")
+        xs_sorted = [xs[i] for i in order.tolist()]
+        sorted_arr = arr[order]
+        breaks = sorted_arr[1:] > (sorted_arr[:-1] + tolerance)
+        return split_at_changes(xs_sorted, np.concatenate([[0], np.cumsum(breaks)]))
     groups = []
     xs = list(sorted(xs))
     current_group = [xs[0]]
@@ -46,19 +106,31 @@ def cluster_objects(
     preserve_order: bool = False,
 ) -> List[List[R]]:
 
-    if not callable(key_fn):
-        key_fn = itemgetter(key_fn)
+    if isinstance(xs, CharStore) and not callable(key_fn):
+        # Read the values straight from the store's column
+        values = xs.get_values(key_fn)
+    else:
+        if not callable(key_fn):
+            key_fn = itemgetter(key_fn)
+        values = list(map(key_fn, xs))
+
+    arr = get_numeric_array(values)
+    if arr is not None:
+        labels = get_cluster_labels(arr, tolerance)
+        if preserve_order:
+            return split_at_changes(list(xs), labels)
+        order = np.argsort(labels, kind="stable")
+        return split_at_changes([xs[i] for i in order.tolist()], labels[order])
 
-    values = map(key_fn, xs)
     cluster_dict = make_cluster_dict(values, tolerance)
 
     get_0, get_1 = itemgetter(0), itemgetter(1)
 
     if preserve_order:
-        cluster_tuples = [(x, cluster_dict.get(key_fn(x))) for x in xs]
+        cluster_tuples = [(x, cluster_dict.get(v)) for x, v in zip(xs, values)]
     else:
         cluster_tuples = sorted(
-            ((x, cluster_dict.get(key_fn(x))) for x in xs), key=get_1
+            ((x, cluster_dict.get(v)) for x, v in zip(xs, values)), key=get_1
         )
 
     grouped = itertools.groupby(cluster_tuples, key=get_1)
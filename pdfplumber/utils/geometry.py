@@ -1,8 +1,9 @@
 import itertools
 from operator import itemgetter
-from typing import Dict, Iterable, Optional
+from typing import Dict, Iterable, Optional, cast
 
 from .._typing import T_bbox, T_num, T_obj, T_obj_list
+from .charstore import CharStore
 from .clustering import cluster_objects
 
 
@@ -96,6 +97,15 @@ def intersects_bbox(objs: Iterable[T_obj], bbox: T_bbox) -> T_obj_list:
     """
     Filters objs to only those intersecting the bbox
     """
+    if isinstance(objs, CharStore):
+        return cast(
+            T_obj_list,
+            objs.select(
+                i
+                for i, obj_bbox in enumerate(objs.bboxes())
+                if get_bbox_overlap(obj_bbox, bbox) is not None
+            ),
+        )
     return [obj for obj in objs if get_bbox_overlap(obj_to_bbox(obj), bbox) is not None]
 
 
@@ -103,6 +113,15 @@ def within_bbox(objs: Iterable[T_obj], bbox: T_bbox) -> T_obj_list:
     """
     Filters objs to only those fully within the bbox
     """
+    if isinstance(objs, CharStore):
+        return cast(
+            T_obj_list,
+            objs.select(
+                i
+                for i, obj_bbox in enumerate(objs.bboxes())
+                if get_bbox_overlap(obj_bbox, bbox) == obj_bbox
+            ),
+        )
     return [
         obj
         for obj in objs
@@ -114,6 +133,15 @@ def outside_bbox(objs: Iterable[T_obj], bbox: T_bbox) -> T_obj_list:
     """
     Filters objs to only those fully outside the bbox
     """
+    if isinstance(objs, CharStore):
+        return cast(
+            T_obj_list,
+            objs.select(
+                i
+                for i, obj_bbox in enumerate(objs.bboxes())
+                if get_bbox_overlap(obj_bbox, bbox) is None
+            ),
+        )
     return [obj for obj in objs if get_bbox_overlap(obj_to_bbox(obj), bbox) is None]
 
 
@@ -122,6 +150,15 @@ def crop_to_bbox(objs: Iterable[T_obj], bbox: T_bbox) -> T_obj_list:
     Filters objs to only those intersecting the bbox,
     and crops the extent of the objects to the bbox.
     """
+    if isinstance(objs, CharStore):
+        indices = []
+        overlaps = []
+        for i, obj_bbox in enumerate(objs.bboxes()):
+            overlap = get_bbox_overlap(obj_bbox, bbox)
+            if overlap is not None:
+                indices.append(i)
+                overlaps.append(overlap)
+        return cast(T_obj_list, objs.select(indices).clip_to(overlaps))
     return list(filter(None, (clip_obj(obj, bbox) for obj in objs)))
 
 
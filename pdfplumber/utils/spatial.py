@@ -0,0 +1,251 @@
+import bisect
+import itertools
+import math
+from typing import Dict, Iterable, List, Optional, Sequence, Set, Tuple, cast
+
+from .._typing import T_bbox, T_num, T_obj, T_obj_list
+from .charstore import CharStore
+from .geometry import get_bbox_overlap, obj_to_bbox
+
+DEFAULT_CELL_SIZE = 36
+
+# Objects spanning more grid cells than this are not bucketed; instead,
+# they are included as candidates for every query.
+MAX_CELLS_PER_OBJECT = 256
+
+T_cell = Tuple[int, int]
+
+
+def get_bboxes(objs: Sequence[T_obj]) -> List[T_bbox]:
+    if isinstance(objs, CharStore):
+        return list(objs.bboxes())
+    return list(map(obj_to_bbox, objs))
+
+
+def subset(objs: Sequence[T_obj], indices: Iterable[int]) -> T_obj_list:
+    """
+    Return the objects at `indices`, preserving the type of `objs` if it
+    is a `CharStore`.
+    """
+    if isinstance(objs, CharStore):
+        return cast(T_obj_list, objs.select(indices))
+    return [objs[i] for i in indices]
+
+
+class SpatialIndex:
+    """
+    A uniform-grid index over a sequence of objects' bounding boxes, for
+    finding the objects that (may) overlap a given bounding box without
+    scanning all of them. Query results are lists of indices into the
+    original sequence, in ascending order, so that filtering via the index
+    preserves the original order of the objects.
+    """
+
+    def __init__(self, bboxes: List[T_bbox], cell_size: T_num = DEFAULT_CELL_SIZE):
+        self.cell_size = cell_size
+        self.bboxes = bboxes
+        self.cells: Dict[T_cell, List[int]] = {}
+        self.unbucketed: List[int] = []
+
+        for i, bbox in enumerate(self.bboxes):
+            cell_range = self.get_cell_range(bbox)
+            if cell_range is None:
+                self.unbucketed.append(i)
+                continue
+            x_range, y_range = cell_range
+            if len(x_range) * len(y_range) > MAX_CELLS_PER_OBJECT:
+                self.unbucketed.append(i)
+                continue
+            for cell in itertools.product(x_range, y_range):
+                if cell in self.cells:
+                    self.cells[cell].append(i)
+                else:
+                    self.cells[cell] = [i]
+
+    @classmethod
+    def from_objects(
+        cls, objs: Sequence[T_obj], cell_size: T_num = DEFAULT_CELL_SIZE
+    ) -> "SpatialIndex":
+        return cls(get_bboxes(objs), cell_size)
+
+    def __len__(self) -> int:
+        return len(self.bboxes)
+
+    def get_cell_range(self, bbox: T_bbox) -> Optional[Tuple[range, range]]:
+        x0, top, x1, bottom = bbox
+        try:
+            size = self.cell_size
+            return (
+                range(math.floor(x0 / size), math.floor(x1 / size) + 1),
+                range(math.floor(top / size), math.floor(bottom / size) + 1),
+            )
+        except (OverflowError, ValueError):
+            # E.g., infinite or NaN coordinates
+            return None
+
+    def candidates(self, bbox: T_bbox) -> List[int]:
+        """
+        Return the indices of all objects that *might* overlap `bbox`; this
+        includes every object that shares a grid cell with `bbox`.
+        """
+        cell_range = self.get_cell_range(bbox)
+        if cell_range is None:
+            return list(range(len(self)))
+        x_range, y_range = cell_range
+        found: Set[int] = set(self.unbucketed)
+        cells = self.cells
+        if len(x_range) * len(y_range) > len(cells):
+            # The query covers more cells than are occupied
+            for (x, y), indices in cells.items():
+                if x in x_range and y in y_range:
+                    found.update(indices)
+        else:
+            for cell in itertools.product(x_range, y_range):
+                if cell in cells:
+                    found.update(cells[cell])
+        return sorted(found)
+
+    def intersects(self, bbox: T_bbox) -> List[int]:
+        """Return the indices of the objects that intersect `bbox`."""
+        return intersects(self.bboxes, bbox, self.candidates(bbox))
+
+    def within(self, bbox: T_bbox) -> List[int]:
+        """Return the indices of the objects that fall fully within `bbox`."""
+        return within(self.bboxes, bbox, self.candidates(bbox))
+
+    def outside(self, bbox: T_bbox) -> List[int]:
+        """Return the indices of the objects that fall fully outside `bbox`."""
+        hits = set(self.intersects(bbox))
+        return [i for i in range(len(self)) if i not in hits]
+
+
+# The functions below select from `bboxes` the same objects that
+# `utils.crop_to_bbox`, `utils.within_bbox`, and `utils.outside_bbox`,
+# respectively, would keep, returning their indices in ascending order. If
+# `candidates` is provided, only those indices are considered.
+
+
+def intersects(
+    bboxes: Sequence[T_bbox], bbox: T_bbox, candidates: Optional[Iterable[int]] = None
+) -> List[int]:
+    indices = range(len(bboxes)) if candidates is None else candidates
+    return [i for i in indices if get_bbox_overlap(bboxes[i], bbox) is not None]
+
+
+def within(
+    bboxes: Sequence[T_bbox], bbox: T_bbox, candidates: Optional[Iterable[int]] = None
+) -> List[int]:
+    indices = range(len(bboxes)) if candidates is None else candidates
+    return [i for i in indices if get_bbox_overlap(bboxes[i], bbox) == bboxes[i]]
+
+
+def outside(
+    bboxes: Sequence[T_bbox], bbox: T_bbox, candidates: Optional[Iterable[int]] = None
+) -> List[int]:
+    indices = range(len(bboxes)) if candidates is None else candidates
+    return [i for i in indices if get_bbox_overlap(bboxes[i], bbox) is None]
+
+
+def clip(
+    bboxes: Sequence[T_bbox], bbox: T_bbox, candidates: Optional[Iterable[int]] = None
+) -> Tuple[List[int], List[T_bbox]]:
+    """
+    Return the indices of the bboxes that intersect `bbox`, as `intersects`
+    does, along with each one's overlap with `bbox`, computed exactly as
+    `get_bbox_overlap` does, but without a function call per bbox.
+    """
+    b_left, b_top, b_right, b_bottom = bbox
+    indices = []
+    overlaps = []
+    for i in range(len(bboxes)) if candidates is None else candidates:
+        a_left, a_top, a_right, a_bottom = bboxes[i]
+        o_left = b_left if b_left > a_left else a_left
+        o_right = b_right if b_right < a_right else a_right
+        o_bottom = b_bottom if b_bottom < a_bottom else a_bottom
+        o_top = b_top if b_top > a_top else a_top
+        o_width = o_right - o_left
+        o_height = o_bottom - o_top
+        if o_height >= 0 and o_width >= 0 and o_height + o_width > 0:
+            indices.append(i)
+            overlaps.append((o_left, o_top, o_right, o_bottom))
+    return indices, overlaps
+
+
+def sweep(bboxes: Sequence[T_bbox], regions: Sequence[T_bbox]) -> List[List[int]]:
+    """
+    For each of `regions`, return the indices (in ascending order) of the
+    bboxes which *might* intersect it. Rather than testing every bbox against
+    every region, this sweeps down the page once, adding bboxes to an "active"
+    list (sorted by their bottoms) as the regions' bottoms pass their tops,
+    so that the bboxes overlapping each region's vertical extent form a tail
+    of that list. Regions sharing a vertical extent (e.g., the fields in a
+    row of a form) are then narrowed down by their horizontal extents.
+    """
+    # Bboxes and regions with NaN coordinates cannot be sorted, so they are
+    # treated as (potentially) intersecting everything.
+    unsorted = [i for i, b in enumerate(bboxes) if b[1] != b[1] or b[3] != b[3]]
+    skip = set(unsorted)
+    by_top = sorted(
+        (i for i in range(len(bboxes)) if i not in skip), key=lambda i: bboxes[i][1]
+    )
+    by_bottom = sorted(
+        (j for j, r in enumerate(regions) if r[1] == r[1] and r[3] == r[3]),
+        key=lambda j: (regions[j][3], regions[j][1]),
+    )
+    results: List[Optional[List[int]]] = [None] * len(regions)
+
+    active_bottoms: List[T_num] = []
+    active: List[int] = []
+    n = 0
+    for (r_bottom, r_top), group in itertools.groupby(
+        by_bottom, key=lambda j: (regions[j][3], regions[j][1])
+    ):
+        while n < len(by_top) and bboxes[by_top[n]][1] <= r_bottom:
+            i = by_top[n]
+            position = bisect.bisect_right(active_bottoms, bboxes[i][3])
+            active_bottoms.insert(position, bboxes[i][3])
+            active.insert(position, i)
+            n += 1
+        start = bisect.bisect_left(active_bottoms, r_top)
+        band = sorted(active[start:] + unsorted)
+        row = list(group)
+        if len(row) == 1:
+            results[row[0]] = band
+        else:
+            row_regions = [regions[j] for j in row]
+            for j, found in zip(row, _sweep_row(bboxes, band, row_regions)):
+                results[j] = found
+    return [list(range(len(bboxes))) if r is None else r for r in results]
+
+
+def _sweep_row(
+    bboxes: Sequence[T_bbox], band: List[int], regions: Sequence[T_bbox]
+) -> List[List[int]]:
+    """
+    Given the indices of the bboxes (`band`) that overlap the vertical extent
+    shared by `regions`, return the subset of them that might intersect each
+    region: those whose left edges lie within the region's horizontal extent,
+    widened (on the left) by the widest bbox's width.
+    """
+    unsorted = []
+    by_x0 = []
+    max_width: T_num = 0
+    for i in band:
+        x0, _, x1, _ = bboxes[i]
+        width = x1 - x0
+        if width != width:
+            unsorted.append(i)
+            continue
+        by_x0.append((x0, i))
+        if width > max_width:
+            max_width = width
+    by_x0.sort()
+    x0s = [x0 for x0, _ in by_x0]
+
+    results = []
+    for r_x0, _, r_x1, _ in regions:
+        lower = r_x0 - max_width
+        lo = 0 if lower != lower else bisect.bisect_left(x0s, lower)
+        hi = len(x0s) if r_x1 != r_x1 else bisect.bisect_right(x0s, r_x1)
+        results.append(sorted([i for _, i in by_x0[lo:hi]] + unsorted))
+    return results
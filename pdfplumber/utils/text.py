@@ -3,6 +3,7 @@ import itertools
 import logging
 import re
 import string
+from array import array
 from operator import itemgetter
 from typing import (
     Any,
@@ -13,17 +14,23 @@ from typing import (
     Match,
     Optional,
     Pattern,
+    Sequence,
     Tuple,
     Union,
 )
 
 from .._typing import T_bbox, T_dir, T_num, T_obj, T_obj_iter, T_obj_list
+from .charstore import CharStore
 from .clustering import cluster_objects
 from .generic import to_list
 from .geometry import objects_to_bbox
+from .spatial import subset
 
 logger = logging.getLogger(__name__)
 
+# Index used, in a TextMap, for characters that do not correspond to any char
+NO_CHAR = array("i", [-1])
+
 DEFAULT_X_TOLERANCE = 3
 DEFAULT_Y_TOLERANCE = 3
 DEFAULT_X_DENSITY = 7.25
@@ -92,10 +99,77 @@ def validate_directions(line_dir: T_dir, char_dir: T_dir, suffix: str = "") -> N
         )
 
 
+def compile_search_pattern(
+    pattern: Union[str, Pattern[str]], regex: bool = True, case: bool = True
+) -> Pattern[str]:
+    if isinstance(pattern, Pattern):
+        if regex is False:
+            raise ValueError(
+                "Cannot pass a compiled search pattern *and* regex=False together."
+            )
+        if case is False:
+            raise ValueError(
+                "Cannot pass a compiled search pattern *and* case=False together."
+            )
+        return pattern
+
+    if regex is False:
+        pattern = re.escape(pattern)
+
+    flags = re.I if case is False else 0
+    return re.compile(pattern, flags)
+
+
+# Inline global flags, e.g., "(?i)", at the start of a pattern
+LEADING_FLAGS_PATTERN = re.compile(r"^(?:\(\?[aiLmsux]+\))+")
+
+
+def combine_patterns(
+    patterns: Sequence[Pattern[str]],
+) -> Tuple[Pattern[str], List[int]]:
+    """
+    Join `patterns` into a single alternation, in which each pattern is
+    wrapped in its own group. Returns the combined pattern and the number of
+    the group wrapping each pattern.
+    """
+    if len(set(p.flags for p in patterns)) > 1:
+        raise ValueError("Cannot combine search patterns with different flags.")
+
+    group_names = [name for p in patterns for name in p.groupindex]
+    repeated = sorted(set(n for n in group_names if group_names.count(n) > 1))
+    if repeated:
+        raise ValueError(
+            "Cannot combine search patterns that share group names: "
+            + ", ".join(repeated)
+        )
+
+    offsets = []
+    offset = 1
+    for p in patterns:
+        offsets.append(offset)
+        offset += 1 + p.groups
+
+    # Leading inline flags are already reflected in each pattern's .flags
+    # (which all patterns share), and would not be at the start of the
+    # combined pattern, so remove them.
+    flags = patterns[0].flags if patterns else 0
+    sources = [LEADING_FLAGS_PATTERN.sub("", p.pattern) for p in patterns]
+    try:
+        combined = re.compile("|".join(f"({src})" for src in sources), flags)
+    except re.error as e:
+        raise ValueError(f"Cannot combine search patterns: {e}") from e
+    return combined, offsets
+
+
 class TextMap:
     """
     A TextMap maps each unicode character in the text to an individual `char`
     object (or, in the case of layout-implied whitespace, `None`).
+
+    Rather than storing the (text, char) tuples it is constructed from, it
+    stores the text as a single string, plus a parallel array of indices into
+    `chars`, in which -1 denotes layout-implied whitespace. TextMaps can also
+    be constructed directly from those, via `TextMap.from_arrays(...)`.
     """
 
     def __init__(
@@ -103,18 +177,73 @@ class TextMap:
         tuples: List[Tuple[str, Optional[T_obj]]],
         line_dir_render: T_dir,
         char_dir_render: T_dir,
+    ) -> None:
+        builder = TextMapBuilder()
+        for text, char in tuples:
+            if char is None:
+                builder.add_whitespace(text)
+            else:
+                builder.add_char(text, char)
+        self._setup(
+            "".join(builder.parts),
+            builder.char_indices,
+            builder.chars,
+            line_dir_render,
+            char_dir_render,
+        )
+
+    @classmethod
+    def from_arrays(
+        cls,
+        text: str,
+        char_indices: "array[int]",
+        chars: T_obj_list,
+        line_dir_render: T_dir,
+        char_dir_render: T_dir,
+    ) -> "TextMap":
+        textmap = cls.__new__(cls)
+        textmap._setup(text, char_indices, chars, line_dir_render, char_dir_render)
+        return textmap
+
+    def _setup(
+        self,
+        text: str,
+        char_indices: "array[int]",
+        chars: T_obj_list,
+        line_dir_render: T_dir,
+        char_dir_render: T_dir,
     ) -> None:
         validate_directions(line_dir_render, char_dir_render, "_render")
-        self.tuples = tuples
+        if len(text) != len(char_indices):
+            raise ValueError("`text` and `char_indices` must have the same length.")
+        self.text = text
+        self.char_indices = char_indices
+        self.chars = chars
         self.line_dir_render = line_dir_render
         self.char_dir_render = char_dir_render
         self.as_string = self.to_string()
 
+    @property
+    def tuples(self) -> List[Tuple[str, Optional[T_obj]]]:
+        chars = self.chars
+        return [
+            (text, None if i < 0 else chars[i])
+            for text, i in zip(self.text, self.char_indices)
+        ]
+
+    def get_chars(self, start: int, end: int) -> T_obj_list:
+        """
+        Return the chars corresponding to the text between `start` and `end`,
+        excluding layout-implied whitespace.
+        """
+        chars = self.chars
+        return [chars[i] for i in self.char_indices[start:end] if i >= 0]
+
     def to_string(self) -> str:
         cd = self.char_dir_render
         ld = self.line_dir_render
 
-        base = "".join(map(itemgetter(0), self.tuples))
+        base = self.text
 
         if cd == "ltr" and ld == "ttb":
             return base
@@ -149,8 +278,7 @@ class TextMap:
         return_groups: bool = True,
         return_chars: bool = True,
     ) -> Dict[str, Any]:
-        subset = self.tuples[m.start(main_group) : m.end(main_group)]
-        chars = [c for (text, c) in subset if c is not None]
+        chars = self.get_chars(m.start(main_group), m.end(main_group))
         x0, top, x1, bottom = objects_to_bbox(chars)
 
         result = {
@@ -178,23 +306,7 @@ class TextMap:
         return_chars: bool = True,
         main_group: int = 0,
     ) -> List[Dict[str, Any]]:
-        if isinstance(pattern, Pattern):
-            if regex is False:
-                raise ValueError(
-                    "Cannot pass a compiled search pattern *and* regex=False together."
-                )
-            if case is False:
-                raise ValueError(
-                    "Cannot pass a compiled search pattern *and* case=False together."
-                )
-            compiled = pattern
-        else:
-            if regex is False:
-                pattern = re.escape(pattern)
-
-            flags = re.I if case is False else 0
-            compiled = re.compile(pattern, flags)
-
+        compiled = compile_search_pattern(pattern, regex=regex, case=case)
         gen = re.finditer(compiled, self.as_string)
         # Remove zero-length matches (can happen, e.g., with optional
         # patterns in regexes) and whitespace-only matches
@@ -209,6 +321,75 @@ class TextMap:
             for m in filtered
         ]
 
+    def search_many(
+        self,
+        patterns: Sequence[Pattern[str]],
+        return_groups: bool = True,
+        return_chars: bool = True,
+        main_group: int = 0,
+        combine: bool = False,
+    ) -> Generator[Tuple[int, Dict[str, Any]], None, None]:
+        """
+        Search for each of the compiled `patterns`, yielding (index, result)
+        tuples, where `index` identifies the pattern and `result` is the same
+        as what `.search(...)` returns. The chars and bounding box of each
+        matched span are computed only once, even if several patterns match it.
+
+        If `combine` is True, the patterns are joined into a single regex
+        alternation, so that the text is scanned just once, and results are
+        yielded in the order they appear in the text. As with any alternation,
+        however, each position can then match only one pattern (the first to
+        match, in `patterns` order). Patterns cannot contain numbered
+        backreferences, different patterns cannot use the same group name,
+        and all patterns must have the same flags (including inline flags,
+        such as "(?i)", which are only allowed at the start of a pattern);
+        otherwise, a ValueError is raised.
+        """
+        text = self.as_string
+        spans: Dict[Tuple[int, int], Tuple[T_obj_list, T_bbox]] = {}
+
+        def to_dict(
+            m: Match[str], group: int, groups: Tuple[Any, ...]
+        ) -> Dict[str, Any]:
+            span = m.span(group)
+            if span not in spans:
+                chars = self.get_chars(*span)
+                spans[span] = (chars, objects_to_bbox(chars))
+            chars, (x0, top, x1, bottom) = spans[span]
+            result = {
+                "text": m.group(group),
+                "x0": x0,
+                "top": top,
+                "x1": x1,
+                "bottom": bottom,
+            }
+            if return_groups:
+                result["groups"] = groups
+            if return_chars:
+                result["chars"] = list(chars)
+            return result
+
+        if combine and patterns:
+            combined, offsets = combine_patterns(patterns)
+            indices = {offset: i for i, offset in enumerate(offsets)}
+            for m in combined.finditer(text):
+                # The group wrapping the matching pattern is the last to close
+                offset = m.lastindex or 0
+                index = indices[offset]
+                if main_group > patterns[index].groups:
+                    raise IndexError("no such group")
+                group = offset + main_group if main_group else offset
+                if not m.group(group).strip():
+                    continue
+                num_groups = patterns[index].groups
+                groups = m.groups()[offset : offset + num_groups]
+                yield index, to_dict(m, group, groups)
+        else:
+            for index, compiled in enumerate(patterns):
+                for m in compiled.finditer(text):
+                    if m.group(main_group).strip():
+                        yield index, to_dict(m, main_group, m.groups())
+
     def extract_text_lines(
         self, strip: bool = True, return_chars: bool = True
     ) -> List[Dict[str, Any]]:
@@ -230,6 +411,52 @@ class TextMap:
         )
 
 
+class TextMapBuilder:
+    """
+    Incrementally assembles the text and char indices of a TextMap,
+    without creating an object per character.
+    """
+
+    def __init__(self) -> None:
+        self.parts: List[str] = []
+        self.char_indices: "array[int]" = array("i")
+        self.chars: T_obj_list = []
+
+    def __len__(self) -> int:
+        return len(self.char_indices)
+
+    def add_whitespace(self, text: str) -> None:
+        """Append layout-implied whitespace, which has no corresponding char."""
+        if text:
+            self.parts.append(text)
+            self.char_indices.extend(NO_CHAR * len(text))
+
+    def add_char(self, text: str, char: T_obj) -> None:
+        """Append `text`, every character of which corresponds to `char`."""
+        if text:
+            self.parts.append(text)
+            self.char_indices.extend(array("i", [len(self.chars)]) * len(text))
+        self.chars.append(char)
+
+    def ends_with_newline(self) -> bool:
+        return bool(self.parts) and self.parts[-1][-1] == "\n"
+
+    def remove_terminal_newline(self) -> None:
+        """Remove the final character, if it is a layout-implied newline."""
+        if self.ends_with_newline() and self.char_indices[-1] < 0:
+            self.parts[-1] = self.parts[-1][:-1]
+            self.char_indices.pop()
+
+    def build(self, line_dir_render: T_dir, char_dir_render: T_dir) -> TextMap:
+        return TextMap.from_arrays(
+            "".join(self.parts),
+            self.char_indices,
+            self.chars,
+            line_dir_render=line_dir_render,
+            char_dir_render=char_dir_render,
+        )
+
+
 class WordMap:
     """
     A WordMap maps words->chars.
@@ -292,14 +519,12 @@ class WordMap:
         For other line/character directions (e.g., bottom-to-top,
         right-to-left), these steps are adjusted.
         """
-        _textmap: List[Tuple[str, Optional[T_obj]]] = []
+        _textmap = TextMapBuilder()
+        line_dir_render = line_dir_render or line_dir
+        char_dir_render = char_dir_render or char_dir
 
         if not len(self.tuples):
-            return TextMap(
-                _textmap,
-                line_dir_render=line_dir_render or line_dir,
-                char_dir_render=char_dir_render or char_dir,
-            )
+            return _textmap.build(line_dir_render, char_dir_render)
 
         expansions = LIGATURES if expand_ligatures else {}
 
@@ -320,9 +545,9 @@ class WordMap:
             else:
                 layout_height_chars = int(round(layout_height / y_density))
 
-            blank_line = [(" ", None)] * layout_width_chars
+            blank_line = " " * layout_width_chars
         else:
-            blank_line = []
+            blank_line = ""
 
         num_newlines = 0
 
@@ -364,9 +589,9 @@ class WordMap:
             )
 
             for i in range(num_newlines_prepend):
-                if not len(_textmap) or _textmap[-1][0] == "\n":
-                    _textmap += blank_line
-                _textmap.append(("\n", None))
+                if not len(_textmap) or _textmap.ends_with_newline():
+                    _textmap.add_whitespace(blank_line)
+                _textmap.add_whitespace("\n")
 
             num_newlines += num_newlines_prepend
 
@@ -388,36 +613,76 @@ class WordMap:
                     x_dist = 0
 
                 num_spaces_prepend = max(min(1, line_len), round(x_dist) - line_len)
-                _textmap += [(" ", None)] * num_spaces_prepend
+                _textmap.add_whitespace(" " * num_spaces_prepend)
                 line_len += num_spaces_prepend
 
                 for c in chars:
                     letters = expansions.get(c["text"], c["text"])
-                    for letter in letters:
-                        _textmap.append((letter, c))
-                        line_len += 1
+                    _textmap.add_char(letters, c)
+                    line_len += len(letters)
 
             # Append spaces at end of line
             if layout:
-                _textmap += [(" ", None)] * (layout_width_chars - line_len)
+                _textmap.add_whitespace(" " * (layout_width_chars - line_len))
 
         # Append blank lines at end of text
         if layout:
             num_newlines_append = layout_height_chars - (num_newlines + 1)
             for i in range(num_newlines_append):
                 if i > 0:
-                    _textmap += blank_line
-                _textmap.append(("\n", None))
+                    _textmap.add_whitespace(blank_line)
+                _textmap.add_whitespace("\n")
 
             # Remove terminal newline
-            if _textmap[-1] == ("\n", None):
-                _textmap = _textmap[:-1]
+            _textmap.remove_terminal_newline()
+
+        return _textmap.build(line_dir_render, char_dir_render)
+
+
+CHAR_KIND_REGULAR = 0
+CHAR_KIND_BLANK = 1
+CHAR_KIND_PUNCTUATION = 2
 
-        return TextMap(
-            _textmap,
-            line_dir_render=line_dir_render or line_dir,
-            char_dir_render=char_dir_render or char_dir,
-        )
+
+class CharKinds(Dict[str, int]):
+    """
+    Maps char text to how WordExtractor treats the char: as a regular char,
+    a blank char (which ends any current word and is then discarded), or
+    punctuation (which forms a word of its own). Computed as needed.
+    """
+
+    def __init__(self, keep_blank_chars: bool, split_at_punctuation: str):
+        self.keep_blank_chars = keep_blank_chars
+        self.split_at_punctuation = split_at_punctuation
+
+    def __missing__(self, text: str) -> int:
+        if not self.keep_blank_chars and text.isspace():
+            kind = CHAR_KIND_BLANK
+        elif text in self.split_at_punctuation:
+            kind = CHAR_KIND_PUNCTUATION
+        else:
+            kind = CHAR_KIND_REGULAR
+        self[text] = kind
+        return kind
+
+
+def is_word_break(
+    ax: T_num, bx: T_num, cx: T_num, ay: T_num, cy: T_num, x: T_num, y: T_num
+) -> bool:
+    """
+    The test shared by WordExtractor.char_begins_new_word and
+    WordExtractor.iter_horizontal_chars_to_words: given the previous char's
+    start (`ax`) and end (`bx`) and the current char's start (`cx`) along the
+    line, and both chars' positions across it (`ay`, `cy`), whether the
+    current char begins a new word under tolerances `x` and `y`.
+    """
+    return bool(
+        # Intraline test
+        (cx < ax)
+        or (cx > bx + x)
+        # Interline test
+        or (cy > ay + y)
+    )
 
 
 class WordExtractor:
@@ -475,6 +740,8 @@ class WordExtractor:
 
         self.expansions = LIGATURES if expand_ligatures else {}
 
+        self.char_kinds = CharKinds(keep_blank_chars, self.split_at_punctuation)
+
     def get_char_dir(self, upright: int) -> T_dir:
         # Note: This can be simplified and reincorporated into .merge_chars and
         # .iter_chars_to_lines once .vertical_ttb and .horizontal_ltr
@@ -582,19 +849,21 @@ class WordExtractor:
                 bx = -prev_char["top"]
                 cx = -curr_char["bottom"]
 
-        return bool(
-            # Intraline test
-            (cx < ax)
-            or (cx > bx + x)
-            # Interline test
-            or (cy > ay + y)
-        )
+        return is_word_break(ax, bx, cx, ay, cy, x, y)
 
     def iter_chars_to_words(
         self,
         ordered_chars: T_obj_iter,
         direction: T_dir,
     ) -> Generator[T_obj_list, None, None]:
+        if direction in ("ltr", "rtl") and (
+            # Only if .char_begins_new_word has not been overridden
+            type(self).char_begins_new_word
+            is WordExtractor.char_begins_new_word
+        ):
+            yield from self.iter_horizontal_chars_to_words(ordered_chars, direction)
+            return
+
         current_word: T_obj_list = []
 
         def start_next_word(
@@ -638,6 +907,61 @@ class WordExtractor:
         if current_word:
             yield current_word
 
+    def iter_horizontal_chars_to_words(
+        self,
+        ordered_chars: T_obj_iter,
+        direction: T_dir,
+    ) -> Generator[T_obj_list, None, None]:
+        """
+        Equivalent to .iter_chars_to_words for horizontal ("ltr" or "rtl")
+        text, but faster: the coordinates that .char_begins_new_word would
+        compare are read directly (both then apply `is_word_break`), and the
+        handling of each distinct char text (as blank, punctuation, or
+        neither) is determined only once.
+        """
+        char_kinds = self.char_kinds
+        ltr = direction == "ltr"
+        xt = self.x_tolerance
+        xtr = self.x_tolerance_ratio
+        yt = self.y_tolerance
+        ytr = self.y_tolerance_ratio
+
+        current_word: T_obj_list = []
+        for char in ordered_chars:
+            kind = char_kinds[char["text"]]
+
+            if kind == CHAR_KIND_BLANK:
+                if current_word:
+                    yield current_word
+                current_word = []
+
+            elif kind == CHAR_KIND_PUNCTUATION:
+                if current_word:
+                    yield current_word
+                yield [char]
+                current_word = []
+
+            elif current_word:
+                prev = current_word[-1]
+                x = xt if xtr is None else xtr * prev["size"]
+                y = yt if ytr is None else ytr * prev["size"]
+                if ltr:
+                    ax, bx, cx = prev["x0"], prev["x1"], char["x0"]
+                else:
+                    ax, bx, cx = -prev["x1"], -prev["x0"], -char["x1"]
+
+                if is_word_break(ax, bx, cx, prev["top"], char["top"], x, y):
+                    yield current_word
+                    current_word = [char]
+                else:
+                    current_word.append(char)
+
+            else:
+                current_word = [char]
+
+        if current_word:
+            yield current_word
+
     def iter_chars_to_lines(
         self, chars: T_obj_iter
     ) -> Generator[Tuple[T_obj_list, T_dir], None, None]:
@@ -692,7 +1016,15 @@ TEXTMAP_KWARGS = inspect.signature(WordMap.to_textmap).parameters.keys()
 WORD_EXTRACTOR_KWARGS = inspect.signature(WordExtractor).parameters.keys()
 
 
-def chars_to_textmap(chars: T_obj_list, **kwargs: Any) -> TextMap:
+def chars_to_textmap(
+    chars: T_obj_list, wordmap: Optional[WordMap] = None, **kwargs: Any
+) -> TextMap:
+    """
+    Convert `chars` to a TextMap. If `wordmap` is provided, it should be the
+    result of calling .extract_wordmap(chars) on a WordExtractor created with
+    the same word-extraction settings as in `kwargs`, and will be used
+    instead of extracting the words again.
+    """
     kwargs.update(
         {
             "presorted": True,
@@ -700,10 +1032,11 @@ def chars_to_textmap(chars: T_obj_list, **kwargs: Any) -> TextMap:
         }
     )
 
-    extractor = WordExtractor(
-        **{k: kwargs[k] for k in WORD_EXTRACTOR_KWARGS if k in kwargs}
-    )
-    wordmap = extractor.extract_wordmap(chars)
+    if wordmap is None:
+        extractor = WordExtractor(
+            **{k: kwargs[k] for k in WORD_EXTRACTOR_KWARGS if k in kwargs}
+        )
+        wordmap = extractor.extract_wordmap(chars)
     textmap = wordmap.to_textmap(
         **{k: kwargs[k] for k in TEXTMAP_KWARGS if k in kwargs}
     )
@@ -746,16 +1079,11 @@ def extract_text(
             y_tolerance if line_dir_render in ("ttb", "btt") else x_tolerance,
         )
 
-        return TextMap(
-            [
-                (char, None)
-                for char in (
-                    "\n".join(" ".join(word["text"] for word in line) for line in lines)
-                )
-            ],
-            line_dir_render=line_dir_render,
-            char_dir_render=char_dir_render,
-        ).as_string
+        _textmap = TextMapBuilder()
+        _textmap.add_whitespace(
+            "\n".join(" ".join(word["text"] for word in line) for line in lines)
+        )
+        return _textmap.build(line_dir_render, char_dir_render).as_string
 
 
 def collate_line(
@@ -781,24 +1109,58 @@ def extract_text_simple(
     return "\n".join(collate_line(c, x_tolerance) for c in clustered)
 
 
+def cluster_indices(
+    indices: List[int], values: Sequence[T_num], tolerance: T_num
+) -> List[List[int]]:
+    """
+    Cluster `indices` by their `values`, as `cluster_objects` does: distinct
+    values, in sorted order, join the current cluster if within `tolerance`
+    of the previous value. Within each cluster, `indices` keep their order.
+    """
+    clusters: List[List[int]] = []
+    last = None
+    for i in sorted(indices, key=values.__getitem__):
+        value = values[i]
+        if last is None or (value != last and value > last + tolerance):
+            clusters.append([i])
+        else:
+            clusters[-1].append(i)
+        last = value
+    for cluster in clusters:
+        cluster.sort()
+    return clusters
+
+
 def dedupe_chars(chars: T_obj_list, tolerance: T_num = 1) -> T_obj_list:
     """
-    Removes duplicate chars — those sharing the same text, fontname, size,
+    Removes duplicate chars — those sharing the same text, fontname, size,
     and positioning (within `tolerance`) as other characters in the set.
     """
     key = itemgetter("fontname", "size", "upright", "text")
-    pos_key = itemgetter("doctop", "x0")
 
-    def yield_unique_chars(chars: T_obj_list) -> Generator[T_obj, None, None]:
-        sorted_chars = sorted(chars, key=key)
-        for grp, grp_chars in itertools.groupby(sorted_chars, key=key):
-            for y_cluster in cluster_objects(
-                list(grp_chars), itemgetter("doctop"), tolerance
-            ):
-                for x_cluster in cluster_objects(
-                    y_cluster, itemgetter("x0"), tolerance
-                ):
-                    yield sorted(x_cluster, key=pos_key)[0]
+    # Group the chars' positions in the list by their (fontname, size, ...)
+    groups: Dict[Any, List[int]] = {}
+    for i, char in enumerate(chars):
+        groups.setdefault(key(char), []).append(i)
 
-    deduped = yield_unique_chars(chars)
-    return sorted(deduped, key=chars.index)
+    if isinstance(chars, CharStore):
+        doctops = chars.get_values("doctop")
+        x0s = chars.get_values("x0")
+    else:
+        doctops = [char["doctop"] for char in chars]
+        x0s = [char["x0"] for char in chars]
+
+    def pos_key(i: int) -> Tuple[T_num, T_num, int]:
+        return (doctops[i], x0s[i], i)
+
+    unique = []
+    for indices in groups.values():
+        if len(indices) == 1:
+            unique.append(indices[0])
+            continue
+        for y_cluster in cluster_indices(indices, doctops, tolerance):
+            for x_cluster in cluster_indices(y_cluster, x0s, tolerance):
+                unique.append(min(x_cluster, key=pos_key))
+
+    # Return the surviving chars in their original order
+    return subset(chars, sorted(unique))
@@ -1,4 +1,5 @@
 #!/usr/bin/env python
+import io
 import logging
 import os
 import unittest
@@ -37,6 +38,98 @@ class Test(unittest.TestCase):
         assert self.pdf.pages[0].page_number == 1
         assert str(self.pdf.pages[0]) == "<Page:1>"
 
+    def test_lazy_pages(self):
+        path = os.path.join(HERE, "pdfs/issue-67-example.pdf")
+        with pdfplumber.open(path) as pdf:
+            pages = pdf.pages
+            assert len(pages) == 22
+            assert pages.page_numbers == list(range(1, 23))
+            assert pages[5].page_number == 6
+            # Only the requested page should have been loaded ...
+            assert pages.loaded == [pages[5]]
+            # ... and repeated access should return the same object
+            assert pages[5] is pages[5]
+            assert pages[-1].page_number == 22
+            assert [p.page_number for p in pages[1:4]] == [2, 3, 4]
+            with pytest.raises(IndexError):
+                pages[22]
+
+            doctop = 0
+            for page in pages:
+                assert page.initial_doctop == doctop
+                doctop += page.height
+
+        with pdfplumber.open(path, pages=[5, 3, 100]) as pdf:
+            assert len(pdf.pages) == 2
+            assert pdf.pages.page_numbers == [3, 5]
+            assert pdf.pages.loaded == []
+            assert [p.page_number for p in pdf.pages] == [3, 5]
+            assert pdf.pages[1].initial_doctop == pdf.pages[0].height
+
+    def test_wrong_page_count(self):
+        # The page tree declares too few, or too many, pages
+        path = os.path.join(HERE, "pdfs/issue-53-example.pdf")
+        with open(path, "rb") as f:
+            data = f.read()
+        for count in [b"1", b"9"]:
+            stream = io.BytesIO(data.replace(b"/Count 5", b"/Count " + count))
+            with pdfplumber.open(stream) as pdf:
+                assert len(pdf.pages) == 5
+                assert pdf.pages[-1].page_number == 5
+                assert [p.page_number for p in pdf.pages[:]] == [1, 2, 3, 4, 5]
+                assert pdf.pages.page_numbers == [1, 2, 3, 4, 5]
+                assert len(list(pdf.pages)) == len(pdf.pages)
+
+    def test_iter_pages(self):
+        path = os.path.join(HERE, "pdfs/issue-53-example.pdf")
+        with pdfplumber.open(path) as pdf:
+            prev = None
+            for page in pdf.iter_pages():
+                if prev is not None:
+                    assert not hasattr(prev, "_layout")
+                    assert not hasattr(prev, "_objects")
+                    assert prev.get_textmap.cache_info().currsize == 0
+                assert len(page.extract_text())
+                assert page.get_textmap.cache_info().currsize == 1
+                prev = page
+            assert not hasattr(prev, "_objects")
+
+            for page in pdf.iter_pages(release=False):
+                page.extract_text()
+            assert all(hasattr(page, "_objects") for page in pdf.pages)
+
+    def test_selective_parsing(self):
+        path = os.path.join(HERE, "pdfs/nics-background-checks-2015-11.pdf")
+        original = self.pdf.pages[0]
+        with pdfplumber.open(path, object_types=["char"]) as pdf:
+            page = pdf.pages[0]
+            assert list(page.objects.keys()) == ["char"]
+            assert page.chars == original.chars
+            # pdfminer.six should not have created the path objects at all
+            assert all(obj.__class__.__name__ == "LTChar" for obj in page.layout)
+
+        attrs = ["text", "fontname", "x0", "x1", "top", "bottom"]
+        with pdfplumber.open(path, attrs=attrs) as pdf:
+            page = pdf.pages[0]
+            char = page.chars[0]
+            assert set(char.keys()) == set(attrs + ["object_type", "page_number"])
+            assert char == {k: v for k, v in original.chars[0].items() if k in char}
+            assert set(page.rects[0].keys()) == set(
+                ["x0", "x1", "top", "bottom", "object_type", "page_number"]
+            )
+
+        with pdfplumber.open(path, attrs=["non_stroking_pattern"]) as pdf:
+            char = pdf.pages[0].chars[0]
+            assert "non_stroking_color" not in char
+            assert char["non_stroking_pattern"] is None
+            # Non-char objects also get the pattern, but not the color
+            rect = pdf.pages[0].rects[0]
+            assert "non_stroking_color" not in rect
+            assert "non_stroking_pattern" in rect
+            assert rect["non_stroking_pattern"] == original.rects[0].get(
+                "non_stroking_pattern"
+            )
+
     def test_objects(self):
         assert len(self.pdf.chars)
         assert len(self.pdf.rects)
@@ -0,0 +1,106 @@
+#!/usr/bin/env python
+import logging
+import os
+import shutil
+import tempfile
+import unittest
+
+import pdfplumber
+from pdfplumber.cache import ObjectCache
+from pdfplumber.utils.charstore import CharStore
+
+logging.disable(logging.ERROR)
+
+HERE = os.path.abspath(os.path.dirname(__file__))
+
+
+def to_lists(objects):
+    return {kind: list(map(dict, objs)) for kind, objs in objects.items()}
+
+
+class Test(unittest.TestCase):
+    @classmethod
+    def setup_class(self):
+        self.path = os.path.join(HERE, "pdfs/nics-background-checks-2015-11.pdf")
+        self.pdf = pdfplumber.open(self.path)
+
+    @classmethod
+    def teardown_class(self):
+        self.pdf.close()
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def test_cache(self):
+        expected = to_lists(self.pdf.pages[0].objects)
+
+        with pdfplumber.open(self.path, object_cache=self.directory) as pdf:
+            assert isinstance(pdf.object_cache, ObjectCache)
+            assert to_lists(pdf.pages[0].objects) == expected
+        assert len(pdf.object_cache.get_entries()) == 1
+
+        with pdfplumber.open(self.path, object_cache=self.directory) as pdf:
+            page = pdf.pages[0]
+            assert to_lists(page.objects) == expected
+            # The objects were loaded from the cache, without parsing the page
+            assert not hasattr(page, "_layout")
+            assert page.extract_text() == self.pdf.pages[0].extract_text()
+
+        with pdfplumber.open(
+            self.path, object_cache=self.directory, compact_chars=True
+        ) as pdf:
+            page = pdf.pages[0]
+            assert isinstance(page.chars, CharStore)
+            assert to_lists(page.objects) == expected
+            assert not hasattr(page, "_layout")
+
+        # Different parsing settings require a separate entry
+        with pdfplumber.open(
+            self.path, object_cache=self.directory, object_types=["char"]
+        ) as pdf:
+            page = pdf.pages[0]
+            assert list(page.objects.keys()) == ["char"]
+            assert hasattr(page, "_layout")
+        assert len(pdf.object_cache.get_entries()) == 2
+
+        pdf.object_cache.clear()
+        assert len(pdf.object_cache.get_entries()) == 0
+
+    def test_eviction(self):
+        cache = ObjectCache(self.directory, max_size=1)
+        with pdfplumber.open(self.path, object_cache=cache) as pdf:
+            pdf.pages[0].objects
+        # The only entry is larger than max_size, so it is evicted immediately
+        assert len(cache.get_entries()) == 0
+
+        path = os.path.join(HERE, "pdfs/issue-33-lorem-ipsum.pdf")
+        cache.max_size = 10**9
+        with pdfplumber.open(path, object_cache=cache) as pdf:
+            for page in pdf.pages:
+                page.objects
+        entries = sorted(cache.get_entries(), key=lambda p: p.stat().st_mtime)
+        assert len(entries) == 2
+
+        cache.max_size = entries[-1].stat().st_size
+        cache.evict()
+        assert cache.get_entries() == entries[-1:]
+
+    def test_uncacheable(self):
+        path = os.path.join(HERE, "pdfs/image_structure.pdf")
+        with pdfplumber.open(path, object_cache=self.directory) as pdf:
+            assert len(pdf.pages[0].images)
+        assert len(pdf.object_cache.get_entries()) == 0
+
+    def test_corrupt_entry(self):
+        with pdfplumber.open(self.path, object_cache=self.directory) as pdf:
+            pdf.pages[0].objects
+        (entry,) = pdf.object_cache.get_entries()
+        entry.write_bytes(b"not a cache file")
+
+        with pdfplumber.open(self.path, object_cache=self.directory) as pdf:
+            page = pdf.pages[0]
+            assert to_lists(page.objects) == to_lists(self.pdf.pages[0].objects)
+            assert hasattr(page, "_layout")
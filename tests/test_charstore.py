@@ -0,0 +1,68 @@
+#!/usr/bin/env python
+import json
+import logging
+import os
+import unittest
+
+import pdfplumber
+from pdfplumber.utils.charstore import CharStore, CharView
+
+logging.disable(logging.ERROR)
+
+HERE = os.path.abspath(os.path.dirname(__file__))
+
+
+class Test(unittest.TestCase):
+    @classmethod
+    def setup_class(self):
+        path = os.path.join(HERE, "pdfs/nics-background-checks-2015-11.pdf")
+        self.pdf = pdfplumber.open(path)
+        self.pdf_compact = pdfplumber.open(path, compact_chars=True)
+
+    @classmethod
+    def teardown_class(self):
+        self.pdf.close()
+        self.pdf_compact.close()
+
+    def test_store(self):
+        store = CharStore.from_objects(
+            [
+                {"x0": 1, "text": "a", "matrix": (1, 0, 0, 1, 5, 5)},
+                {"x0": 2.5, "text": "b", "matrix": (1, 0, 0, 1, 6, 5), "mcid": 3},
+                {"x0": None, "text": "a", "matrix": None},
+            ]
+        )
+        assert len(store) == 3
+        assert isinstance(store[0], CharView)
+        assert dict(store[0]) == {"x0": 1, "text": "a", "matrix": (1, 0, 0, 1, 5, 5)}
+        assert "mcid" not in store[0]
+        assert store[1]["mcid"] == 3
+        assert store[-1]["x0"] is None
+        assert store.get_values("text") == ["a", "b", "a"]
+        assert [dict(c) for c in store[1:]] == [dict(store[1]), dict(store[2])]
+
+    def test_chars(self):
+        page = self.pdf.pages[0]
+        page_compact = self.pdf_compact.pages[0]
+        assert isinstance(page_compact.chars, CharStore)
+        assert page.chars == list(page_compact.chars)
+        assert page.extract_text() == page_compact.extract_text()
+        assert page.extract_words() == page_compact.extract_words()
+        assert page.extract_tables() == page_compact.extract_tables()
+        assert json.loads(page.to_json()) == json.loads(page_compact.to_json())
+
+    def test_crop(self):
+        page = self.pdf.pages[0]
+        page_compact = self.pdf_compact.pages[0]
+        bbox = (100, 100, 400, 300)
+        for method in ["crop", "within_bbox", "outside_bbox"]:
+            cropped = getattr(page, method)(bbox)
+            cropped_compact = getattr(page_compact, method)(bbox)
+            assert isinstance(cropped_compact.chars, CharStore)
+            assert cropped.chars == list(cropped_compact.chars)
+
+        filtered = page_compact.filter(lambda obj: obj.get("text") == "A")
+        assert isinstance(filtered.chars, CharStore)
+        assert len(filtered.chars) == len(
+            [c for c in page.chars if c.get("text") == "A"]
+        )
@@ -72,3 +72,43 @@ class Test(unittest.TestCase):
             page.dedupe_chars().extract_text(y_tolerance=6).splitlines()[4]
             == "UE 8. Circulation - Métabolismes"
         )
+
+    def test_dedupe_chars(self):
+        def char(text, x0, doctop, size=10):
+            return {
+                "text": text,
+                "fontname": "Font",
+                "size": size,
+                "upright": True,
+                "x0": x0,
+                "doctop": doctop,
+            }
+
+        chars = [
+            char("a", 10.5, 0),
+            char("b", 20, 0),
+            char("a", 10, 0.5),
+            char("a", 11.2, 0.5),
+            char("a", 10, 0.5, size=12),
+            char("b", 20, 2.5),
+            char("a", 10, 0),
+            char("a", 12, 0),
+        ]
+        deduped = pdfplumber.utils.dedupe_chars(chars)
+        # Survivors are the top-left-most of each cluster, in their original order
+        assert deduped == [chars[i] for i in [1, 4, 5, 6]]
+        assert deduped[3] is chars[6]
+
+        assert pdfplumber.utils.dedupe_chars(chars, tolerance=0) == [
+            chars[i] for i in [0, 1, 2, 3, 4, 5, 6, 7]
+        ]
+        assert pdfplumber.utils.dedupe_chars([]) == []
+
+    def test_compact_chars(self):
+        path = os.path.join(HERE, "pdfs/issue-71-duplicate-chars.pdf")
+        with pdfplumber.open(path, compact_chars=True) as pdf:
+            page = pdf.pages[0]
+            deduped = page.dedupe_chars()
+            assert isinstance(deduped.chars, pdfplumber.utils.charstore.CharStore)
+            expected = self.pdf.pages[0].dedupe_chars().chars
+            assert list(map(dict, deduped.chars)) == list(map(dict, expected))
@@ -3,12 +3,15 @@ import io
 import logging
 import os
 import unittest
+from xml.etree import ElementTree
 from zipfile import ZipFile
 
 import PIL.Image
+import PIL.ImageChops
 import pytest
 
 import pdfplumber
+from pdfplumber.display import get_page_image
 from pdfplumber.table import TableFinder
 
 logging.disable(logging.ERROR)
@@ -73,6 +76,29 @@ class Test(unittest.TestCase):
         im = self.pdf.pages[0].crop((10, 20, 30, 50)).to_image()
         assert im.original.size == (20, 30)
 
+    def test_region_rendering(self):
+        page = self.pdf.pages[0]
+        full = page.to_image(resolution=144).original
+        crop = page.crop((100, 50, 300, 250))
+        im = crop.to_image(resolution=144)
+        assert im.scale == 2
+        assert im.original.size == (400, 400)
+        # Only the cropped region is rendered, and cached separately
+        info = self.pdf.get_page_image.cache_info()
+        assert crop.to_image(resolution=144).original is im.original
+        assert self.pdf.get_page_image.cache_info().hits == info.hits + 1
+
+        # The region matches the full render, barring glyphs whose placement
+        # pdfium rounds differently when its origin changes
+        expected = full.crop((200, 100, 600, 500))
+        diff = PIL.ImageChops.difference(im.original, expected).convert("L")
+        assert diff.histogram()[0] > 0.99 * 400 * 400
+
+        # Regions extending beyond the page are rendered by cropping the
+        # whole page, which pads them
+        outside = page.crop((-10, -10, 20, 20), strict=False).to_image()
+        assert outside.original.size == (30, 30)
+
     def test_cropbox(self):
         path = os.path.join(HERE, "pdfs/issue-1054-example.pdf")
         with pdfplumber.open(path) as pdf:
@@ -81,6 +107,92 @@ class Test(unittest.TestCase):
             im = pdf.pages[0].to_image(force_mediabox=True)
             assert im.original.size == (2227, 2923)
 
+    def test_render_cache(self):
+        path = os.path.join(HERE, "pdfs/issue-33-lorem-ipsum.pdf")
+        with pdfplumber.open(path) as pdf:
+            im = pdf.pages[0].to_image()
+            pdfium_doc = pdf.pdfium_doc
+            pdf.pages[1].to_image()
+            assert pdf.pdfium_doc is pdfium_doc
+
+            # Same page and settings: served from the cache
+            assert pdf.pages[0].to_image().original is im.original
+            assert pdf.get_page_image.cache_info().hits == 1
+
+            hi_res = pdf.pages[0].to_image(resolution=144)
+            assert hi_res.original.size == tuple(2 * x for x in im.original.size)
+            aa = pdf.pages[0].to_image(antialias=True)
+            assert aa.original is not im.original
+
+            expected = get_page_image(
+                pdf.stream, pdf.path, 0, 144, password=None, antialias=False
+            )
+            assert hi_res.original.tobytes() == expected.tobytes()
+
+        assert not hasattr(pdf, "_pdfium_doc")
+        assert pdf.get_page_image.cache_info().currsize == 0
+
+    def test_to_array(self):
+        np = pytest.importorskip("numpy")
+        page = self.pdf.pages[0]
+        for p in [page, page.crop((10, 20, 300, 250))]:
+            im = p.to_image(resolution=50)
+            arr = p.to_array(resolution=50)
+            assert arr.dtype == np.uint8
+            assert arr.shape == (im.original.height, im.original.width, 4)
+            # The array is a view of pdfium's buffer, with BGRx channels
+            assert not arr.flags.owndata
+            assert np.array_equal(arr[:, :, 2::-1], np.asarray(im.original))
+
+        # Crops beyond the page are padded, as with .to_image(...), so that
+        # the array's pixels line up with the PageImage's coordinates
+        for bbox in [(-10, -10, 20, 20), (page.width - 20, 0, page.width + 15, 30)]:
+            p = page.crop(bbox, strict=False)
+            im = p.to_image()
+            arr = p.to_array()
+            assert arr.shape == (im.original.height, im.original.width, 4)
+            assert np.array_equal(arr[:, :, 2::-1], np.asarray(im.original))
+        assert not arr[:, -15:].any()
+
+        gray = page.to_array(width=200, grayscale=True)
+        width, height = page.to_image(width=200).original.size
+        assert gray.shape == (height, width)
+
+    def test_deferred_annotation(self):
+        im = self.pdf.pages[0].to_image()
+        assert im._annotated is None
+        png = im._repr_png_()
+        assert im._annotated is None
+
+        im.draw_rect((0, 0, 100, 100))
+        assert im.annotated is not im.original
+        assert im._repr_png_() != png
+        assert im.reset()._repr_png_() == png
+
+        # Shapes are only drawn once the annotated image is needed
+        im.draw_rects(im.page.chars, stroke_width=0)
+        assert len(im.shapes) == len(im.page.chars)
+        assert im._num_drawn == 0
+        im.annotated
+        assert im._num_drawn == len(im.shapes)
+
+    def test_to_svg(self):
+        page = self.pdf.pages[0]
+        im = page.to_image()
+        im.outline_chars().draw_lines(page.lines).draw_circles(page.chars[:5])
+        svg = im.to_svg()
+        root = ElementTree.fromstring(svg)
+        assert root.get("width") == str(im.original.width)
+        # Consecutive shapes of the same style share a path
+        paths = root.findall("{http://www.w3.org/2000/svg}path")
+        assert len(paths) == 4
+
+        b = io.BytesIO()
+        im.save(b, format="SVG")
+        assert b.getvalue().decode("utf-8") == svg
+        # Saving to SVG does not rasterize the shapes
+        assert im._annotated is None
+
     def test_copy(self):
         assert self.im.copy().original == self.im.original
 
@@ -0,0 +1,153 @@
+#!/usr/bin/env python
+import io
+import logging
+import os
+import pathlib
+import shutil
+import tempfile
+import unittest
+
+import PIL.Image
+import pytest
+
+import pdfplumber
+from pdfplumber import parallel
+from pdfplumber.parallel import (
+    PageProcessingError,
+    _init_worker,
+    _process_chunk,
+    get_open_kwargs,
+    get_source,
+)
+
+logging.disable(logging.ERROR)
+
+HERE = os.path.abspath(os.path.dirname(__file__))
+
+
+def count_chars(page, text=None):
+    return len([c for c in page.chars if text is None or c["text"] == text])
+
+
+def get_page_number(page):
+    return page.page_number
+
+
+def fail_on_page_2(page):
+    if page.page_number == 2:
+        raise ValueError("Cannot process this page")
+    return page.page_number
+
+
+class Test(unittest.TestCase):
+    @classmethod
+    def setup_class(self):
+        self.path = os.path.join(HERE, "pdfs/issue-53-example.pdf")
+        self.pdf = pdfplumber.open(self.path)
+
+    @classmethod
+    def teardown_class(self):
+        self.pdf.close()
+
+    def test_map_pages_method_name(self):
+        expected = [page.extract_text() for page in self.pdf.pages]
+        results = self.pdf.map_pages("extract_text", processes=2, chunksize=2)
+        assert list(results) == expected
+
+    def test_map_pages_function(self):
+        expected = [count_chars(page, text="e") for page in self.pdf.pages]
+        results = self.pdf.map_pages(count_chars, processes=2, text="e")
+        assert list(results) == expected
+
+    def test_map_pages_stream(self):
+        with open(self.path, "rb") as f:
+            with pdfplumber.open(f, pages=[2, 4]) as pdf:
+                results = list(pdf.map_pages("extract_text", processes=2))
+                assert results == [page.extract_text() for page in pdf.pages]
+                assert len(results) == 2
+
+    def test_open_kwargs(self):
+        assert get_open_kwargs(self.pdf)["strict_metadata"] is False
+        with pdfplumber.open(self.path, strict_metadata=True) as pdf:
+            open_kwargs = get_open_kwargs(pdf)
+            assert open_kwargs["strict_metadata"] is True
+            with pdfplumber.open(self.path, **open_kwargs) as reopened:
+                assert reopened.strict_metadata is True
+            assert list(pdf.map_pages("extract_text", processes=2)) == [
+                page.extract_text() for page in self.pdf.pages
+            ]
+
+    def test_map_pages_errors(self):
+        with pytest.raises(PageProcessingError) as e:
+            list(self.pdf.map_pages(fail_on_page_2, processes=2))
+        assert "page 2" in str(e.value)
+
+        with pytest.raises(ValueError):
+            list(self.pdf.map_pages("extract_text", chunksize=0))
+
+    def test_map_pages_wrong_count(self):
+        # The page tree declares too few, or too many, pages
+        with open(self.path, "rb") as f:
+            data = f.read()
+        expected = [page.page_number for page in self.pdf.pages]
+        for count in [b"1", b"9"]:
+            stream = io.BytesIO(data.replace(b"/Count 5", b"/Count " + count))
+            with pdfplumber.open(stream) as pdf:
+                results = list(pdf.map_pages(get_page_number, processes=2))
+            assert results == expected
+
+        # Looking up a nonexistent page is reported like any other failure
+        _init_worker(get_source(self.pdf), get_open_kwargs(self.pdf))
+        with pytest.raises(PageProcessingError) as e:
+            _process_chunk([10], "extract_text", {})
+        assert "page index 10" in str(e.value)
+        parallel._worker_pdf.close()
+
+    def test_render_pages(self):
+        results = list(self.pdf.render_pages(resolution=36, processes=2, chunksize=2))
+        assert [n for n, _ in results] == [p.page_number for p in self.pdf.pages]
+        for page, (_, data) in zip(self.pdf.pages, results):
+            img = PIL.Image.open(io.BytesIO(data))
+            assert img.format == "PNG"
+            expected = page.to_image(resolution=36).original
+            assert img.tobytes() == expected.tobytes()
+
+        with open(self.path, "rb") as f:
+            with pdfplumber.open(f) as pdf:
+                results = list(pdf.render_pages(pages=[2, 4], format="JPEG"))
+                # No Page objects are needed to render the pages
+                assert pdf.pages.loaded == []
+        assert [n for n, _ in results] == [2, 4]
+        assert all(data.startswith(b"\xff\xd8") for _, data in results)
+
+    def test_render_pages_wrong_count(self):
+        # The page tree declares too few, or too many, pages
+        with open(self.path, "rb") as f:
+            data = f.read()
+        with pdfplumber.open(io.BytesIO(data.replace(b"/Count 5", b"/Count 9"))) as pdf:
+            results = list(pdf.render_pages(resolution=10, processes=2))
+        assert [n for n, _ in results] == [1, 2, 3, 4, 5]
+
+        # pdfium cannot load the pages beyond the declared count, which is
+        # reported rather than silently skipping them
+        with pdfplumber.open(io.BytesIO(data.replace(b"/Count 5", b"/Count 1"))) as pdf:
+            with pytest.raises(PageProcessingError) as e:
+                list(pdf.render_pages(resolution=10, processes=2))
+        assert "page 2" in str(e.value)
+
+    def test_render_pages_directory(self):
+        directory = tempfile.mkdtemp()
+        try:
+            results = list(self.pdf.render_pages(directory=directory, processes=2))
+            assert len(results) == len(self.pdf.pages)
+            for page_number, path in results:
+                assert path.parent == pathlib.Path(directory)
+                assert path.name.endswith(f"{page_number}.png")
+                with PIL.Image.open(path) as img:
+                    assert (
+                        img.size
+                        == self.pdf.pages[page_number - 1].to_image().original.size
+                    )
+            assert sorted(os.listdir(directory)) == [p.name for _, p in results]
+        finally:
+            shutil.rmtree(directory)
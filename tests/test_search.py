@@ -0,0 +1,76 @@
+#!/usr/bin/env python
+import io
+import logging
+import os
+import re
+import unittest
+
+import pytest
+
+import pdfplumber
+from pdfplumber.search import SearchIndex
+
+logging.disable(logging.ERROR)
+
+HERE = os.path.abspath(os.path.dirname(__file__))
+
+
+class Test(unittest.TestCase):
+    @classmethod
+    def setup_class(self):
+        path = os.path.join(HERE, "pdfs/issue-33-lorem-ipsum.pdf")
+        self.pdf = pdfplumber.open(path)
+
+    @classmethod
+    def teardown_class(self):
+        self.pdf.close()
+
+    def get_expected(self, pattern, **kwargs):
+        layout = kwargs.pop("layout", False)
+        expected = []
+        for page in self.pdf.pages:
+            for result in page.search(pattern, layout=layout, **kwargs):
+                del result["chars"]
+                result["page_number"] = page.page_number
+                expected.append(result)
+        return expected
+
+    def test_search(self):
+        for layout in [False, True]:
+            index = self.pdf.build_search_index(layout=layout)
+            for pattern, kwargs in [
+                (r"(\w+)or\b", {}),
+                ("quaerat", {"regex": False, "case": False}),
+                (re.compile(r"0\.(\d)(\d)\s+0"), {"main_group": 2}),
+                ("Aliquam", {"return_groups": False}),
+            ]:
+                results = index.search(pattern, **kwargs)
+                assert len(results)
+                assert results == self.get_expected(pattern, layout=layout, **kwargs)
+
+        assert {r["page_number"] for r in index.search(r"\w+")} == {1, 2}
+        assert {r["page_number"] for r in index.search(r"\w+", pages=[2])} == {2}
+
+    def test_pages_released(self):
+        self.pdf.build_search_index()
+        # Only the index's PageText objects are kept, not the pages' objects
+        for page in self.pdf.pages:
+            assert not hasattr(page, "_objects")
+            assert page.get_textmap.cache_info().currsize == 0
+
+    def test_serialization(self):
+        index = self.pdf.build_search_index(layout=True)
+        serialized = index.to_json()
+        loaded = SearchIndex.from_json(serialized)
+        assert loaded.settings == {"layout": True}
+        assert loaded.search(r"\w+") == index.search(r"\w+")
+
+        stream = io.StringIO()
+        index.to_json(stream)
+        stream.seek(0)
+        assert SearchIndex.from_json(stream).search("dolor") == index.search("dolor")
+
+        data = index.to_dict()
+        data["version"] = 0
+        with pytest.raises(ValueError):
+            SearchIndex.from_dict(data)
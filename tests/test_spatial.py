@@ -0,0 +1,161 @@
+#!/usr/bin/env python
+import logging
+import os
+import unittest
+
+import pytest
+
+import pdfplumber
+from pdfplumber import utils
+from pdfplumber.utils import spatial
+from pdfplumber.utils.spatial import SpatialIndex
+
+logging.disable(logging.ERROR)
+
+HERE = os.path.abspath(os.path.dirname(__file__))
+
+
+class Test(unittest.TestCase):
+    @classmethod
+    def setup_class(self):
+        path = os.path.join(HERE, "pdfs/nics-background-checks-2015-11.pdf")
+        self.pdf = pdfplumber.open(path)
+        self.pdf_compact = pdfplumber.open(path, compact_chars=True)
+
+    @classmethod
+    def teardown_class(self):
+        self.pdf.close()
+        self.pdf_compact.close()
+
+    def test_index(self):
+        objs = [
+            utils.bbox_to_rect((0, 0, 10, 10)),
+            utils.bbox_to_rect((50, 50, 60, 60)),
+            utils.bbox_to_rect((10, 10, 50, 50)),
+            utils.bbox_to_rect((-1e6, 0, 1e6, 1)),
+            utils.bbox_to_rect((0, 0, float("inf"), 1)),
+        ]
+        index = SpatialIndex.from_objects(objs, cell_size=5)
+        assert len(index) == 5
+        assert index.intersects((0, 0, 10, 10)) == [0, 3, 4]
+        assert index.intersects((55, 55, 100, 100)) == [1]
+        assert index.within((0, 0, 50, 50)) == [0, 2]
+        assert index.outside((0, 0, 10, 10)) == [1, 2]
+        assert index.outside((200, 200, 300, 300)) == [0, 1, 2, 3, 4]
+        assert index.intersects((-5, -5, float("inf"), 0)) == [0, 3, 4]
+
+    def test_crops(self):
+        for pdf in [self.pdf, self.pdf_compact]:
+            page = pdf.pages[0]
+            bboxes = [(0, i * 20, page.width, i * 20 + 40) for i in range(10)]
+            for method, crop_fn in [
+                ("crop", utils.crop_to_bbox),
+                ("within_bbox", utils.within_bbox),
+                ("outside_bbox", utils.outside_bbox),
+            ]:
+                for bbox in bboxes:
+                    cropped = getattr(page, method)(bbox)
+                    for kind, objs in page.objects.items():
+                        expected = list(map(dict, crop_fn(objs, bbox)))
+                        assert list(map(dict, cropped.objects[kind])) == expected
+            assert "char" in page._spatial_indexes
+            page.close()
+            assert not hasattr(page, "_spatial_indexes")
+
+    def test_nested_crops(self):
+        for pdf in [self.pdf, self.pdf_compact]:
+            page = pdf.pages[0]
+            x0, top, x1, bottom = page.bbox
+            bboxes = [
+                (x0 + i * 20, top + i * 30, x1 - i * 10, bottom - i * 40)
+                for i in range(1, 5)
+            ]
+
+            lazy = page
+            chain = []
+            for i, bbox in enumerate(bboxes):
+                lazy = lazy.within_bbox(bbox) if i == 2 else lazy.crop(bbox)
+                chain.append(lazy)
+            lazy = lazy.filter(lambda obj: obj["object_type"] != "rect")
+            lazy = lazy.crop(bboxes[-1]).dedupe_chars().crop(bboxes[-1])
+
+            expected = page
+            for i, bbox in enumerate(bboxes):
+                expected = expected.within_bbox(bbox) if i == 2 else expected.crop(bbox)
+                # Materialize each intermediate page's objects
+                expected.objects
+            expected = expected.filter(lambda obj: obj["object_type"] != "rect")
+            expected = expected.crop(bboxes[-1]).dedupe_chars().crop(bboxes[-1])
+
+            for kind, objs in expected.objects.items():
+                assert list(map(dict, lazy.objects[kind])) == list(map(dict, objs))
+            assert lazy.extract_text() == expected.extract_text()
+            # Only the page preceding the filter needed its objects as dicts
+            assert [hasattr(p, "_objects") for p in chain] == [False] * 3 + [True]
+
+    def test_sweep(self):
+        bboxes = [
+            (0, 0, 10, 10),
+            (0, 20, 10, 30),
+            (0, 5, 10, 25),
+            (0, float("nan"), 10, 10),
+            (0, 0, 10, float("inf")),
+        ]
+        regions = [(0, 12, 10, 18), (0, 10, 10, 20), (0, 40, 5, 50), (0, 0, 0, 0)]
+        assert spatial.sweep(bboxes, regions) == [
+            [2, 3, 4],
+            [0, 1, 2, 3, 4],
+            [3, 4],
+            [0, 3, 4],
+        ]
+        assert spatial.sweep(bboxes, [(0, float("nan"), 1, 1)]) == [[0, 1, 2, 3, 4]]
+
+        # Regions sharing a vertical extent are also narrowed horizontally
+        row = [(i * 10, 0, i * 10 + 5, 10) for i in range(20)]
+        wide = (-5, 0, 200, 1)
+        regions = [
+            (0, 0, 10, 10),
+            (50, 0, 60, 10),
+            (150, 0, 160, 10),
+            (300, 0, 310, 10),
+        ]
+        assert spatial.sweep(row, regions) == [[0, 1], [5, 6], [15, 16], []]
+        # ... though wide bboxes make the narrowing less effective
+        bboxes = row + [wide]
+        for region, found in zip(regions, spatial.sweep(bboxes, regions)):
+            assert set(spatial.intersects(bboxes, region)) <= set(found)
+
+    def test_crop_many(self):
+        for pdf in [self.pdf, self.pdf_compact]:
+            page = pdf.pages[0]
+            parents = [page.crop((0, 50, 400, 500)), page.dedupe_chars()]
+            if pdf is self.pdf:
+                parents.append(page)
+            for parent in parents:
+                x0, top, x1, bottom = parent.bbox
+                bboxes = [
+                    (x, y, x + 120, y + 25)
+                    for x in range(int(x0), int(x1) - 120, 200)
+                    for y in range(int(top), int(bottom) - 25, 100)
+                ]
+                for mode, method, regions in [
+                    ("crop", "crop", bboxes),
+                    ("within", "within_bbox", bboxes),
+                    # Pages cropped via outside_bbox keep most of the objects
+                    ("outside", "outside_bbox", bboxes[:4]),
+                ]:
+                    pages = parent.crop_many(regions, mode=mode)
+                    assert len(pages) == len(regions)
+                    for cropped, bbox in zip(pages, regions):
+                        expected = getattr(parent, method)(bbox)
+                        assert cropped.bbox == expected.bbox
+                        for kind, objs in expected.objects.items():
+                            assert list(map(dict, cropped.objects[kind])) == list(
+                                map(dict, objs)
+                            )
+            page.close()
+
+        with pytest.raises(ValueError):
+            self.pdf.pages[0].crop_many([(0, 0, 10, 10)], mode="inside")
+        with pytest.raises(ValueError):
+            self.pdf.pages[0].crop_many([(0, 0, 10000, 10)])
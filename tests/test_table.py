@@ -2,11 +2,12 @@
 import logging
 import os
 import unittest
+from operator import itemgetter
 
 import pytest
 
 import pdfplumber
-from pdfplumber import table
+from pdfplumber import table, utils
 
 logging.disable(logging.ERROR)
 
@@ -224,3 +225,152 @@ class Test(unittest.TestCase):
             assert t[-2][-2] == "Uncommon"
 
             assert len(page.extract_tables({"vertical_strategy": "lines_strict"})) == 0
+
+    def test_edges_to_intersections(self):
+        def naive(edges, x_tolerance, y_tolerance):
+            # The original, exhaustive implementation
+            intersections = {}
+            v_edges = [e for e in edges if e["orientation"] == "v"]
+            h_edges = [e for e in edges if e["orientation"] == "h"]
+            for v in sorted(v_edges, key=itemgetter("x0", "top")):
+                for h in sorted(h_edges, key=itemgetter("top", "x0")):
+                    if (
+                        (v["top"] <= (h["top"] + y_tolerance))
+                        and (v["bottom"] >= (h["top"] - y_tolerance))
+                        and (v["x0"] >= (h["x0"] - x_tolerance))
+                        and (v["x0"] <= (h["x1"] + x_tolerance))
+                    ):
+                        vertex = (v["x0"], h["top"])
+                        if vertex not in intersections:
+                            intersections[vertex] = {"v": [], "h": []}
+                        intersections[vertex]["v"].append(v)
+                        intersections[vertex]["h"].append(h)
+            return intersections
+
+        def ids(intersections):
+            return [
+                (k, [id(e) for e in d["v"]], [id(e) for e in d["h"]])
+                for k, d in intersections.items()
+            ]
+
+        def edge(x0, top, x1, bottom, orientation):
+            rect = utils.bbox_to_rect((x0, top, x1, bottom))
+            return dict(rect, orientation=orientation)
+
+        # A grid of cells, each drawn with its own four edges
+        grid_edges = []
+        for row in range(10):
+            for col in range(10):
+                x0, top, x1, bottom = col * 10, row * 10, col * 10 + 10, row * 10 + 10
+                grid_edges += [
+                    edge(x0, top, x1, top, "h"),
+                    edge(x0, bottom, x1, bottom, "h"),
+                    edge(x0, top, x0, bottom, "v"),
+                    edge(x1, top, x1, bottom, "v"),
+                ]
+
+        edge_sets = [grid_edges]
+        for filename in [
+            "pdffill-demo.pdf",
+            "nics-background-checks-2015-11.pdf",
+            "issue-140-example.pdf",
+            "table-curves-example.pdf",
+        ]:
+            with pdfplumber.open(os.path.join(HERE, "pdfs", filename)) as pdf:
+                for page in pdf.pages[:2]:
+                    edge_sets.append(table.TableFinder(page).get_edges())
+
+        for edges in edge_sets:
+            for tolerance in [0, 1, 3]:
+                expected = naive(edges, tolerance, tolerance)
+                actual = table.edges_to_intersections(edges, tolerance, tolerance)
+                assert ids(actual) == ids(expected)
+
+    def test_intersections_to_cells(self):
+        def edge(x0, top, x1, bottom, orientation):
+            rect = utils.bbox_to_rect((x0, top, x1, bottom))
+            return dict(rect, orientation=orientation)
+
+        # A 3x2 grid, in which the two bottom-left cells have been merged
+        edges = [
+            edge(0, 0, 30, 0, "h"),
+            edge(0, 10, 30, 10, "h"),
+            edge(20, 20, 30, 20, "h"),
+            edge(0, 30, 30, 30, "h"),
+            edge(0, 0, 0, 30, "v"),
+            edge(10, 0, 10, 10, "v"),
+            edge(20, 0, 20, 30, "v"),
+            edge(30, 0, 30, 30, "v"),
+        ]
+        intersections = table.edges_to_intersections(edges)
+        assert table.intersections_to_cells(intersections) == [
+            (0, 0, 10, 10),
+            (0, 10, 20, 30),
+            (10, 0, 20, 10),
+            (20, 0, 30, 10),
+            (20, 10, 30, 20),
+            (20, 20, 30, 30),
+        ]
+
+    def test_cells_to_tables(self):
+        cells = [
+            (0, 0, 1, 1),
+            (5, 5, 6, 6),
+            (2, 2, 3, 3),
+            (1, 1, 2, 2),
+            (5, 6, 6, 7),
+            (9, 9, 10, 10),
+        ]
+        assert table.cells_to_tables(cells) == [
+            [(0, 0, 1, 1), (1, 1, 2, 2), (2, 2, 3, 3)],
+            [(5, 5, 6, 6), (5, 6, 6, 7)],
+        ]
+
+        # Cell order, including for duplicate cells, should follow that of
+        # repeatedly scanning the not-yet-assigned cells
+        cells = [
+            (4, 0, 6, 1),
+            (2, 2, 3, 4),
+            (4, 2, 6, 3),
+            (2, 2, 4, 4),
+            (3, 3, 4, 4),
+            (3, 1, 4, 2),
+            (2, 2, 4, 4),
+        ]
+        assert table.cells_to_tables(cells) == [
+            [
+                (4, 0, 6, 1),
+                (3, 1, 4, 2),
+                (2, 2, 4, 4),
+                (2, 2, 3, 4),
+                (4, 2, 6, 3),
+                (3, 3, 4, 4),
+                (2, 2, 4, 4),
+            ]
+        ]
+
+    def test_extract_tables(self):
+        page = self.pdf.pages[0]
+        tables = page.find_tables()
+        expected = [t.extract() for t in tables]
+        assert table.extract_tables(tables, page.chars) == expected
+        assert page.extract_tables() == expected
+
+        # Overlapping, merged, and empty cells
+        cells = [(0, 0, 100, 20), (100, 0, 200, 40), (0, 20, 100, 40), (50, 0, 60, 5)]
+        chars = page.chars
+        t = table.Table(page, cells)
+
+        def naive(bbox):
+            x0, top, x1, bottom = bbox
+            return [
+                c
+                for c in chars
+                if x0 <= (c["x0"] + c["x1"]) / 2 < x1
+                and top <= (c["top"] + c["bottom"]) / 2 < bottom
+            ]
+
+        buckets = table.bucket_chars([t.rows], chars)
+        for (_, r, c), bucket in buckets.items():
+            assert bucket == naive(t.rows[r].cells[c])
+        assert len(buckets) == 4
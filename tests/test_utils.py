@@ -13,6 +13,7 @@ from pdfminer.psparser import PSLiteral
 
 import pdfplumber
 from pdfplumber import utils
+from pdfplumber.page import WORDMAP_CACHE_SIZE
 
 logging.disable(logging.ERROR)
 
@@ -47,6 +48,36 @@ class Test(unittest.TestCase):
         assert utils.cluster_objects(b, "x", 0) == [[b[0], b[1]], [b[2], b[3]]]
         assert utils.cluster_objects(b, 7, 0) == [[b[0]], [b[1], b[2], b[3]]]
 
+    def test_cluster_numpy(self):
+        pytest.importorskip("numpy")
+        from pdfplumber.utils import clustering
+
+        values = [(i * 7919) % 1000 / 4 for i in range(1000)] + [3, 3.0, 250]
+        objs = [{"x": v, "i": i} for i, v in enumerate(values)]
+        original = clustering.NUMPY_MIN_VALUES
+        try:
+            clustering.NUMPY_MIN_VALUES = len(values) + 1
+            expected = [
+                utils.cluster_list(values, 0.1),
+                utils.cluster_objects(objs, "x", 1),
+                utils.cluster_objects(objs, "x", 1, preserve_order=True),
+                utils.cluster_objects([], "x", 1),
+            ]
+            clustering.NUMPY_MIN_VALUES = 0
+            actual = [
+                utils.cluster_list(values, 0.1),
+                utils.cluster_objects(objs, "x", 1),
+                utils.cluster_objects(objs, "x", 1, preserve_order=True),
+                utils.cluster_objects([], "x", 1),
+            ]
+        finally:
+            clustering.NUMPY_MIN_VALUES = original
+        assert actual == expected
+        # The original values, including their types, should be returned
+        assert [list(map(type, c)) for c in actual[0]] == [
+            list(map(type, c)) for c in expected[0]
+        ]
+
     def test_resolve(self):
         annot = self.pdf.annots[0]
         annot_ad0 = utils.resolve(annot["data"]["A"]["D"][0])
@@ -228,6 +259,75 @@ class Test(unittest.TestCase):
                 extra_attrs=["non_stroking_color", "fontname"],
             )
 
+    def test_extract_words_horizontal_fast_path(self):
+        class SlowWordExtractor(utils.text.WordExtractor):
+            # Overriding this method disables the fast path for horizontal text
+            def char_begins_new_word(self, *args, **kwargs):
+                return super().char_begins_new_word(*args, **kwargs)
+
+        settings = [
+            {},
+            {"x_tolerance_ratio": 0.15, "y_tolerance_ratio": 0.5},
+            {"keep_blank_chars": True, "split_at_punctuation": True},
+            {"split_at_punctuation": ".,", "x_tolerance": 1},
+            {"char_dir": "rtl", "use_text_flow": True},
+        ]
+        for path in ["pdfs/test-punkt.pdf", "pdfs/scotus-transcript-p1.pdf"]:
+            with pdfplumber.open(os.path.join(HERE, path)) as pdf:
+                chars = pdf.pages[0].chars
+                for kwargs in settings:
+                    fast = utils.text.WordExtractor(**kwargs).extract_words(chars)
+                    slow = SlowWordExtractor(**kwargs).extract_words(chars)
+                    assert fast == slow
+
+        # Rotated and vertical text, in every combination of directions
+        rotated_settings = [
+            {
+                "char_dir": c,
+                "line_dir": ln,
+                "char_dir_rotated": c,
+                "line_dir_rotated": ln,
+            }
+            for c, ln in [
+                ("ltr", "ttb"),
+                ("rtl", "btt"),
+                ("ttb", "rtl"),
+                ("btt", "ltr"),
+            ]
+        ] + [{"vertical_ttb": False}, {"horizontal_ltr": False}]
+        for path in ["pdfs/issue-848.pdf", "pdfs/issue-192-example.pdf"]:
+            with pdfplumber.open(os.path.join(HERE, path)) as pdf:
+                for page in pdf.pages[:4]:
+                    chars = page.chars
+                    for kwargs in rotated_settings:
+                        fast = utils.text.WordExtractor(**kwargs).extract_words(chars)
+                        slow = SlowWordExtractor(**kwargs).extract_words(chars)
+                        assert len(fast) and fast == slow
+
+    def test_word_cache(self):
+        path = os.path.join(HERE, "pdfs/scotus-transcript-p1.pdf")
+        with pdfplumber.open(path) as pdf:
+            page = pdf.pages[0]
+            words = page.extract_words(extra_attrs=["size"])
+            assert words == utils.extract_words(page.chars, extra_attrs=["size"])
+
+            # Mutating the returned words should not affect the cache
+            words[0]["text"] = "CHANGED"
+            assert page.extract_words(extra_attrs=["size"])[0]["text"] != "CHANGED"
+            assert page.get_wordmap.cache_info().hits == 1
+
+            # Textmaps reuse the cached words, regardless of layout settings
+            page.extract_text()
+            page.extract_text(layout=True)
+            page.search("Court")
+            info = page.get_wordmap.cache_info()
+            assert (info.misses, info.hits) == (2, 2)
+            assert page.extract_words() == utils.extract_words(page.chars)
+            assert page.get_wordmap.cache_info().maxsize == WORDMAP_CACHE_SIZE
+
+            page.close()
+            assert page.get_wordmap.cache_info().currsize == 0
+
     def test_extract_words_punctuation(self):
         path = os.path.join(HERE, "pdfs/test-punkt.pdf")
         with pdfplumber.open(path) as pdf:
@@ -372,6 +472,27 @@ class Test(unittest.TestCase):
         assert text == utils_text
         assert text == target
 
+    def test_textmap(self):
+        page = self.pdf_scotus.pages[0]
+        textmap = page.get_textmap(layout=True)
+        assert len(textmap.text) == len(textmap.char_indices)
+        assert textmap.as_string == textmap.text
+        for text, i in zip(textmap.text, textmap.char_indices):
+            if i < 0:
+                assert text in " \n"
+            else:
+                assert textmap.chars[i]["text"] == text
+
+        # The constructor still accepts (text, char) tuples
+        rebuilt = utils.text.TextMap(textmap.tuples, "ttb", "ltr")
+        assert rebuilt.as_string == textmap.as_string
+        assert rebuilt.tuples == textmap.tuples
+
+        with pytest.raises(ValueError):
+            utils.text.TextMap.from_arrays(
+                "abc", textmap.char_indices[:2], [], "ttb", "ltr"
+            )
+
     def test_extract_text_layout_cropped(self):
         target = (
             open(os.path.join(HERE, "comparisons/scotus-transcript-p1-cropped.txt"))
@@ -445,6 +566,72 @@ class Test(unittest.TestCase):
         results = page.search(r"10 Tuesday", layout=True)
         assert len(results) == 0
 
+    def test_search_many(self):
+        pdf = self.pdf_scotus
+        patterns = [r"SUPREME\s+(\w+)", re.compile(r"(\d+) (\w+)"), "Court"]
+
+        results = list(pdf.search_many(patterns))
+        path = os.path.join(HERE, "pdfs/issue-53-example.pdf")
+        with pdfplumber.open(path) as other:
+            in_use = other.pages[0]
+            in_use.objects
+            assert len(list(other.search_many([r"\w+"])))
+            # Each page is released once it has been searched, unless it
+            # was already in use
+            assert hasattr(in_use, "_objects")
+            for page in other.pages[1:]:
+                assert not hasattr(page, "_objects")
+                assert page.get_textmap.cache_info().currsize == 0
+
+        with pdfplumber.open(path) as other:
+            # Only the selected pages are loaded
+            assert len(list(other.search_many([r"\w+"], pages=[2])))
+            assert [p.page_number for p in other.pages.loaded] == [2]
+
+        expected = []
+        for page in pdf.pages:
+            for pattern in patterns:
+                for result in page.search(pattern):
+                    result.update(page_number=page.page_number, pattern=pattern)
+                    expected.append(result)
+        assert results == expected
+
+        combined = list(pdf.search_many(patterns, combine=True))
+        assert [r["text"] for r in combined[:3]] == [
+            "1 IN",
+            "SUPREME COURT",
+            "3 MICHAEL",
+        ]
+        assert combined[0]["pattern"] is patterns[1]
+        assert combined[0]["groups"] == ("1", "IN")
+        assert combined[1]["groups"] == ("COURT",)
+        assert all(r in results for r in combined)
+
+        main = list(pdf.search_many(patterns[:2], main_group=1, combine=True))
+        assert [r["text"] for r in main[:2]] == ["1", "COURT"]
+        with pytest.raises(IndexError):
+            list(pdf.search_many(patterns, main_group=1, combine=True))
+
+        assert list(pdf.search_many(patterns, pages=[2])) == []
+        assert list(pdf.search_many([], combine=True)) == []
+
+        with pytest.raises(ValueError):
+            list(pdf.search_many(["a", re.compile("b", re.I)], combine=True))
+
+        # Repeated group names cannot be combined
+        named = [r"(?P<word>SUPREME)", r"(?P<word>Court)"]
+        assert len(list(pdf.search_many(named, pages=[1])))
+        with pytest.raises(ValueError, match="share group names: word"):
+            list(pdf.search_many(named, combine=True))
+
+        # Leading inline flags are fine, as long as all patterns share them
+        inline = [r"(?i)supreme\s+(\w+)", "(?i)court"]
+        separate = list(pdf.search_many(inline, pages=[1]))
+        combined = list(pdf.search_many(inline, pages=[1], combine=True))
+        assert len(combined) and all(r in separate for r in combined)
+        with pytest.raises(ValueError, match="different flags"):
+            list(pdf.search_many(["court", "(?i)court"], combine=True))
+
     def test_extract_text_lines(self):
         page = self.pdf_scotus.pages[0]
         results = page.extract_text_lines()